@@ -24,9 +24,31 @@ export const StatusPage: React.FC<StatusPageProps> = ({ onBack }) => {
     };
 
     useEffect(() => {
-        checkHealth();
-        const interval = setInterval(checkHealth, 5000);
-        return () => clearInterval(interval);
+        // Only poll while the page is visible; refresh immediately when it comes back
+        let interval: ReturnType<typeof setInterval> | undefined;
+
+        const start = () => {
+            checkHealth();
+            interval = setInterval(checkHealth, 5000);
+        };
+        const stop = () => {
+            clearInterval(interval);
+            interval = undefined;
+        };
+        const onVisibilityChange = () => {
+            if (document.hidden) {
+                stop();
+            } else if (interval === undefined) {
+                start();
+            }
+        };
+
+        if (!document.hidden) start();
+        document.addEventListener('visibilitychange', onVisibilityChange);
+        return () => {
+            stop();
+            document.removeEventListener('visibilitychange', onVisibilityChange);
+        };
     }, []);
 
     const getStatusColor = (status: string) => {
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Analyze retrieval relevance scores for a fixed set of test queries.
+
+Runs the test queries through the retriever in one batch and reports
+average/min/max scores and threshold hit rates per collection, to track
+progress towards the 0.9 average relevance target.
+
+Run with: python scripts/analyze_scores.py
+Set RERANK_ENABLED=true to compare against cross-encoder re-ranking.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter as QdrantVectorStore
+from src.config.settings import settings
+from src.core.services.retrieval_service import RetrievalService as F1Retriever
+
+TEST_QUERIES = [
+    "What is the penalty for exceeding track limits?",
+    "Why did Verstappen get a 5 second penalty?",
+    "What is the rule for an unsafe release in the pit lane?",
+    "How are drivers penalized for impeding in qualifying?",
+    "What happens if a driver causes a collision?",
+    "What are the rules for overtaking under safety car?",
+    "When can a driver be disqualified from a race?",
+    "What is a grid penalty and when is it applied?",
+]
+
+THRESHOLDS = np.array([0.7, 0.8, 0.9])
+
+
+SUMMARY_COLUMNS = ("N", "Avg", "Min", "Max", *(f">={t}" for t in THRESHOLDS))
+
+
+def _summary_row(scores: np.ndarray) -> np.ndarray:
+    """Count, mean, min, max and threshold hit rates for one set of scores (NaN if empty)."""
+    if scores.size == 0:
+        return np.array([0, *([np.nan] * (len(SUMMARY_COLUMNS) - 1))])
+
+    # One sort, then all threshold counts from a single vectorized binary search
+    srt = np.sort(scores)
+    rates = (srt.size - np.searchsorted(srt, THRESHOLDS, side="left")) / srt.size
+    return np.array([srt.size, srt.mean(), srt[0], srt[-1], *rates])
+
+
+def _format_summary(names: list[str], summary: np.ndarray) -> str:
+    """Render the summary matrix as a fixed-width table."""
+    header = f"{'':<20}" + "".join(f"{c:>9}" for c in SUMMARY_COLUMNS)
+    rows = [
+        f"{name:<20}{int(row[0]):>9}" + "".join(f"{v:>9.4f}" for v in row[1:])
+        for name, row in zip(names, summary)
+    ]
+    return "\n".join([header, *rows])
+
+
+def main() -> int:
+    """Retrieve context for all test queries and summarize the scores."""
+    vector_store = QdrantVectorStore(
+        url=settings.qdrant_url,
+        api_key=settings.qdrant_api_key,
+        embedding_api_key=settings.google_api_key,
+    )
+    retriever = F1Retriever(vector_store, use_reranker=settings.rerank_enabled)
+
+    print("=" * 60)
+    print(f"Retrieval Score Analysis (rerank={'on' if retriever.reranker else 'off'})")
+    print("=" * 60)
+
+    query_contexts = [retriever.extract_race_context(query) for query in TEST_QUERIES]
+    contexts = retriever.retrieve_batch(TEST_QUERIES, top_k=5, query_contexts=query_contexts)
+
+    for query, context in zip(TEST_QUERIES, contexts):
+        top = [
+            r.score for r in context.regulations + context.stewards_decisions + context.race_data
+        ]
+        best = f"{max(top):.4f}" if top else "-"
+        print(f"\n{query}\n  results: {len(top)}  best: {best}")
+
+    reg = np.fromiter((r.score for c in contexts for r in c.regulations), dtype=float)
+    stewards = np.fromiter((r.score for c in contexts for r in c.stewards_decisions), dtype=float)
+    race = np.fromiter((r.score for c in contexts for r in c.race_data), dtype=float)
+
+    names = ["Regulations", "Stewards decisions", "Race data", "Overall"]
+    summary = np.vstack(
+        [
+            _summary_row(scores)
+            for scores in (reg, stewards, race, np.concatenate([reg, stewards, race]))
+        ]
+    )
+    print(f"\n{'=' * 60}\nSUMMARY\n{'=' * 60}\n{_format_summary(names, summary)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,10 @@ for any documents containing BOM (Byte Order Mark) characters that could
 cause JSON encoding issues in the API response.
 """
 
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src to path for imports
@@ -15,6 +18,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter as QdrantVectorStore
 from src.config.settings import settings
 
+PROBLEMATIC_CHARS = re.compile(r"[\ufeff\ufffe\x00]")
+PROBLEMATIC_CHAR_NAMES = {
+    "\ufeff": "BOM (\\ufeff)",
+    "\ufffe": "BOM (\\ufffe)",
+    "\x00": "NULL byte (\\x00)",
+}
+# UTF-8 encodings of the characters above, for the fast byte-level reject
+PROBLEMATIC_BYTES = (b"\xef\xbb\xbf", b"\xef\xbf\xbe", b"\x00")
+
 
 def check_text_for_problematic_chars(text: str, field_name: str) -> list[dict]:
     """Check a text string for BOM and other problematic characters.
@@ -24,55 +36,54 @@ def check_text_for_problematic_chars(text: str, field_name: str) -> list[dict]:
         field_name: Name of the field being checked (for reporting)
 
     Returns:
-        List of issues found
+        List of issues found (one per occurrence; position 0 means a leading BOM)
     """
-    issues = []
-
     if not text:
-        return issues
-
-    # Check for BOM characters
-    if "\ufeff" in text:
-        pos = text.find("\ufeff")
-        issues.append(
-            {
-                "char": "BOM (\\ufeff)",
-                "field": field_name,
-                "position": pos,
-                "context": repr(text[max(0, pos - 20) : pos + 20]),
-            }
-        )
-
-    if "\ufffe" in text:
-        pos = text.find("\ufffe")
-        issues.append(
-            {
-                "char": "BOM (\\ufffe)",
-                "field": field_name,
-                "position": pos,
-                "context": repr(text[max(0, pos - 20) : pos + 20]),
-            }
-        )
-
-    # Check for null bytes
-    if "\x00" in text:
-        pos = text.find("\x00")
-        issues.append(
-            {
-                "char": "NULL byte (\\x00)",
-                "field": field_name,
-                "position": pos,
-                "context": repr(text[max(0, pos - 20) : pos + 20]),
-            }
-        )
-
-    # Check for first character being BOM
-    if text and ord(text[0]) == 0xFEFF:
-        issues.append(
-            {"char": "Leading BOM", "field": field_name, "position": 0, "context": repr(text[:50])}
-        )
-
-    return issues
+        return []
+
+    # Fast path for clean text (the common case): C-level byte searches, no regex
+    buf = text.encode("utf-8", "surrogatepass")
+    if not any(needle in buf for needle in PROBLEMATIC_BYTES):
+        return []
+
+    # Single regex pass over the string instead of one find() per character
+    return [
+        {
+            "char": PROBLEMATIC_CHAR_NAMES[match.group()],
+            "field": field_name,
+            "position": match.start(),
+            "context": repr(text[max(0, match.start() - 20) : match.start() + 20]),
+        }
+        for match in PROBLEMATIC_CHARS.finditer(text)
+    ]
+
+
+def _scan_point(point) -> tuple[str, str, list[dict]]:
+    """Check every string field of a point's payload.
+
+    Args:
+        point: Qdrant record returned by scroll
+
+    Returns:
+        Tuple of (doc_id, title, issues)
+    """
+    payload = point.payload or {}
+    doc_issues = []
+
+    # Check content field
+    content = payload.get("content", "")
+    doc_issues.extend(check_text_for_problematic_chars(content, "content"))
+
+    # Check all string fields in payload
+    for key, value in payload.items():
+        if key == "content":
+            continue
+        if isinstance(value, str):
+            doc_issues.extend(check_text_for_problematic_chars(value, f"metadata.{key}"))
+
+    doc_id = payload.get("doc_id", f"point_{point.id}")
+    title = payload.get("title", payload.get("source", "Unknown"))[:50]
+    return doc_id, title, doc_issues
 
 
 def scan_collection(vector_store: QdrantVectorStore, collection_name: str) -> dict:
@@ -108,13 +119,12 @@ def scan_collection(vector_store: QdrantVectorStore, collection_name: str) -> di
             print("  [Empty collection - skipping]")
             return results
 
-        # Scroll through all points in batches
+        # Scroll through all points in batches. The next scroll RPC is fetched
+        # in the background while the current batch is scanned on the worker pool.
         batch_size = 100
-        offset = None
 
-        while True:
-            # Use scroll to get all points
-            scroll_result = client.scroll(
+        def fetch(offset):
+            return client.scroll(
                 collection_name=collection_name,
                 limit=batch_size,
                 offset=offset,
@@ -122,35 +132,30 @@ def scan_collection(vector_store: QdrantVectorStore, collection_name: str) -> di
                 with_vectors=False,
             )
 
-            points, next_offset = scroll_result
+        with (
+            ThreadPoolExecutor(max_workers=1) as fetcher,
+            ThreadPoolExecutor(max_workers=os.cpu_count()) as scanners,
+        ):
+            pending = fetcher.submit(fetch, None)
 
-            if not points:
-                break
+            while pending is not None:
+                points, next_offset = pending.result()
 
-            for point in points:
-                results["documents_scanned"] += 1
-                doc_issues = []
+                if not points:
+                    break
 
-                payload = point.payload or {}
+                # Kick off the next page before scanning this one
+                pending = fetcher.submit(fetch, next_offset) if next_offset is not None else None
 
-                # Check content field
-                content = payload.get("content", "")
-                doc_issues.extend(check_text_for_problematic_chars(content, "content"))
+                futures = [scanners.submit(_scan_point, point) for point in points]
+                results["documents_scanned"] += len(points)
 
-                # Check all string fields in payload
-                for key, value in payload.items():
-                    if key == "content":
+                for future in as_completed(futures):
+                    doc_id, title, doc_issues = future.result()
+                    if not doc_issues:
                         continue
-                    if isinstance(value, str):
-                        doc_issues.extend(
-                            check_text_for_problematic_chars(value, f"metadata.{key}")
-                        )
 
-                if doc_issues:
                     results["documents_with_issues"] += 1
-                    doc_id = payload.get("doc_id", f"point_{point.id}")
-                    title = payload.get("title", payload.get("source", "Unknown"))[:50]
-
                     print(f"\n  ⚠️  Document: {doc_id}")
                     print(f"      Title: {title}")
                     for issue in doc_issues:
@@ -160,10 +165,6 @@ def scan_collection(vector_store: QdrantVectorStore, collection_name: str) -> di
                         print(f"        Context: {issue['context']}")
                         results["issues"].append({"doc_id": doc_id, "title": title, **issue})
 
-            if next_offset is None:
-                break
-            offset = next_offset
-
     except Exception as e:
         print(f"  ❌ Error scanning collection: {e}")
         results["error"] = str(e)
@@ -194,9 +195,9 @@ def main():
     all_results = []
 
     for collection in [
-        QdrantVectorStore.REGULATIONS_NAMESPACE,
-        QdrantVectorStore.STEWARDS_NAMESPACE,
-        QdrantVectorStore.RACE_DATA_NAMESPACE,
+        QdrantVectorStore.REGULATIONS_COLLECTION,
+        QdrantVectorStore.STEWARDS_COLLECTION,
+        QdrantVectorStore.RACE_DATA_COLLECTION,
     ]:
         results = scan_collection(vector_store, collection)
         all_results.append(results)
@@ -1,43 +1,120 @@
 #!/usr/bin/env python3
-"""Compare local and Secret Manager API keys after update."""
+"""Compare local and Secret Manager API keys after update.
 
+Run with: python scripts/compare_keys.py [--mode {basic,hash,safe,verbose}]
+
+Modes:
+  basic    plain equality check
+  hash     compare SHA-256 fingerprints (safe to share the output)
+  safe     constant-time comparison (default)
+  verbose  constant-time comparison plus BOM/whitespace/length hints
+
+Requires Application Default Credentials and the Secret Manager client:
+    pip install google-cloud-secret-manager
+"""
+
+import argparse
+import hashlib
 import secrets
-import subprocess
+import sys
 
 from dotenv import dotenv_values
 
-# Get local key
-local = dotenv_values(".env").get("GOOGLE_API_KEY", "")
-
-# Get secret manager key
-result = subprocess.run(
-    [
-        r"C:\Users\addis\AppData\Local\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
-        "secrets",
-        "versions",
-        "access",
-        "latest",
-        "--secret=f1-agent-google-api-key",
-        "--project=gen-lang-client-0855046443",
-    ],
-    capture_output=True,
-    text=True,
+SECRET_VERSION = (
+    "projects/gen-lang-client-0855046443/secrets/f1-agent-google-api-key/versions/latest"
 )
-secret = result.stdout.strip()
+BOM = chr(0xFEFF)
+
+
+def fetch_secret(name: str = SECRET_VERSION) -> str | None:
+    """Fetch a secret version with a single Secret Manager call.
+
+    Args:
+        name: Full resource name of the secret version.
+
+    Returns:
+        The decoded, stripped secret, or None if the client library is missing.
+    """
+    try:
+        from google.cloud import secretmanager
+    except ImportError:
+        print("❌ google-cloud-secret-manager not installed!")
+        print("   Run: pip install google-cloud-secret-manager")
+        return None
+
+    client = secretmanager.SecretManagerServiceClient()
+    response = client.access_secret_version(name=name)
+    return response.payload.data.decode("utf-8").strip()
+
+
+def _fingerprint(value: str) -> str:
+    """Short SHA-256 fingerprint of a key for display."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:12]
+
+
+def compare(local: str, secret: str, mode: str) -> bool:
+    """Compare the two keys and print diagnostics for the chosen mode.
 
-print("=" * 60)
-print("KEY COMPARISON - Local vs Secret Manager")
-print("=" * 60)
+    Args:
+        local: Key from the local .env file.
+        secret: Key from Secret Manager.
+        mode: One of basic, hash, safe, verbose.
 
-# Check for BOM
-local_bom = local.startswith(chr(0xFEFF))
-secret_bom = secret.startswith(chr(0xFEFF))
+    Returns:
+        True if the keys match.
+    """
+    if mode == "basic":
+        return local == secret
+
+    if mode == "hash":
+        print(f"Local fingerprint:          {_fingerprint(local)}")
+        print(f"Secret Manager fingerprint: {_fingerprint(secret)}")
+        return _fingerprint(local) == _fingerprint(secret)
+
+    # Use constant-time comparison to prevent timing attacks
+    match = secrets.compare_digest(local.encode("utf-8"), secret.encode("utf-8"))
+
+    if mode == "verbose":
+        print(f"Local:          length={len(local)} bom={local.startswith(BOM)}")
+        print(f"Secret Manager: length={len(secret)} bom={secret.startswith(BOM)}")
+        print(f"Local has surrounding whitespace: {local != local.strip()}")
+
+    return match
+
+
+def main() -> int:
+    """Compare the local key against Secret Manager."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode",
+        choices=["basic", "hash", "safe", "verbose"],
+        default="safe",
+        help="Comparison/diagnostic mode (default: safe)",
+    )
+    args = parser.parse_args()
+
+    # Get local key
+    local = dotenv_values(".env").get("GOOGLE_API_KEY", "") or ""
+
+    # Get secret manager key (fetched once regardless of mode)
+    secret = fetch_secret()
+    if secret is None:
+        return 1
+
+    print("=" * 60)
+    print("KEY COMPARISON - Local vs Secret Manager")
+    print("=" * 60)
+
+    print("\n=== COMPARISON ===")
+    if compare(local, secret, args.mode):
+        print("✅ MATCH - Local and Secret Manager keys are identical!")
+        return 0
 
-print("\n=== COMPARISON ===")
-# Use constant-time comparison to prevent timing attacks
-if secrets.compare_digest(local, secret):
-    print("✅ MATCH - Local and Secret Manager keys are identical!")
-else:
     print("❌ MISMATCH")
     print("Check your .env file and Google Secret Manager to ensure they match.")
     print("Tip: Check for hidden BOM characters or whitespace.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
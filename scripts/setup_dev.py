@@ -5,6 +5,7 @@ This script is called automatically by poetry install via the post-install hook.
 It ensures pre-commit hooks are installed for all developers who clone the repo.
 """
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -24,17 +25,26 @@ def main() -> int:
         print("pre-commit hooks already installed")
         return 0
 
-    # Install pre-commit hooks
+    # Resolve the executable up front: an absolute path skips the PATH search in the
+    # child and lets subprocess use the posix_spawn fast path where available
+    pre_commit = shutil.which("pre-commit")
+    if pre_commit is None:
+        print("pre-commit not found, skipping hook installation")
+        return 0
+
+    # Install both hook types and their environments in a single pre-commit run
     print("Installing pre-commit hooks...")
     try:
         subprocess.run(
-            ["pre-commit", "install", "--install-hooks"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        subprocess.run(
-            ["pre-commit", "install", "--hook-type", "pre-push"],
+            [
+                pre_commit,
+                "install",
+                "--install-hooks",
+                "--hook-type",
+                "pre-commit",
+                "--hook-type",
+                "pre-push",
+            ],
             check=True,
             capture_output=True,
             text=True,
@@ -44,9 +54,6 @@ def main() -> int:
     except subprocess.CalledProcessError as e:
         print(f"Failed to install pre-commit hooks: {e.stderr}")
         return 1
-    except FileNotFoundError:
-        print("pre-commit not found, skipping hook installation")
-        return 0
 
 
 if __name__ == "__main__":
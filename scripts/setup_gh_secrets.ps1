@@ -90,7 +90,13 @@ $ErrorActionPreference = "Stop"
 Write-Color "Granting IAM permissions..."
 $roles = @("roles/run.admin", "roles/storage.admin", "roles/artifactregistry.admin", "roles/iam.serviceAccountUser")
 $ErrorActionPreference = "Continue"
+# Read the policy once and only rewrite it for roles the account does not have yet
+$grantedRoles = @(gcloud projects get-iam-policy $PROJECT_ID --flatten="bindings[].members" --filter="bindings.members:serviceAccount:$SERVICE_ACCOUNT_EMAIL" --format="value(bindings.role)" 2>$null)
 foreach ($role in $roles) {
+    if ($grantedRoles -contains $role) {
+        Write-Host "Already granted $role"
+        continue
+    }
     # Adding binding is idempotent
     gcloud projects add-iam-policy-binding $PROJECT_ID --member="serviceAccount:$SERVICE_ACCOUNT_EMAIL" --role=$role --condition=None 2>$null | Out-Null
     Write-Host "Granted $role"
@@ -99,7 +105,7 @@ $ErrorActionPreference = "Stop"
 
 # --- 6. Create Workload Identity Pool ---
 Write-Color "Creating Workload Identity Pool: $POOL_NAME..."
-# Move project number fetch up
+# Resolve the project number once; steps 8 and 9 reuse it
 $PROJECT_NUMBER = gcloud projects describe $PROJECT_ID --format="value(projectNumber)"
 
 $ErrorActionPreference = "Continue"
@@ -139,10 +145,9 @@ Write-Color "Binding Service Account to GitHub Repo..."
 # This command adds the binding.
 gcloud iam service-accounts add-iam-policy-binding $SERVICE_ACCOUNT_EMAIL `
     --role="roles/iam.workloadIdentityUser" `
-    --member="principalSet://iam.googleapis.com/projects/$(gcloud projects describe $PROJECT_ID --format='value(projectNumber)')/locations/global/workloadIdentityPools/$POOL_NAME/attribute.repository/$REPO_NAME" | Out-Null
+    --member="principalSet://iam.googleapis.com/projects/$PROJECT_NUMBER/locations/global/workloadIdentityPools/$POOL_NAME/attribute.repository/$REPO_NAME" | Out-Null
 
 # --- 9. Construct Provider Resource Name ---
-$PROJECT_NUMBER = gcloud projects describe $PROJECT_ID --format="value(projectNumber)"
 $WORKLOAD_IDENTITY_PROVIDER = "projects/$PROJECT_NUMBER/locations/global/workloadIdentityPools/$POOL_NAME/providers/$PROVIDER_NAME"
 
 Write-Color "------------------------------------------------"
@@ -156,14 +161,15 @@ Write-Color "------------------------------------------------"
 $setSecrets = Read-Host "Do you want to upload these secrets to GitHub now? (y/n)"
 if ($setSecrets -eq "y") {
     Write-Color "Setting GitHub Secrets using gh CLI..."
+    # Pass the repo explicitly so gh does not re-resolve it from git remotes on every call
 
-    gh secret set GCP_PROJECT_ID --body "$PROJECT_ID"
+    gh secret set GCP_PROJECT_ID --repo $REPO_NAME --body "$PROJECT_ID"
     Write-Host "Set GCP_PROJECT_ID"
 
-    gh secret set GCP_SERVICE_ACCOUNT --body "$SERVICE_ACCOUNT_EMAIL"
+    gh secret set GCP_SERVICE_ACCOUNT --repo $REPO_NAME --body "$SERVICE_ACCOUNT_EMAIL"
     Write-Host "Set GCP_SERVICE_ACCOUNT"
 
-    gh secret set GCP_WORKLOAD_IDENTITY_PROVIDER --body "$WORKLOAD_IDENTITY_PROVIDER"
+    gh secret set GCP_WORKLOAD_IDENTITY_PROVIDER --repo $REPO_NAME --body "$WORKLOAD_IDENTITY_PROVIDER"
     Write-Host "Set GCP_WORKLOAD_IDENTITY_PROVIDER"
 
     Write-Color "All secrets set successfully!" "Green"
@@ -58,7 +58,14 @@ fi
 echo "Granting IAM permissions..."
 ROLES=("roles/run.admin" "roles/storage.admin" "roles/artifactregistry.admin" "roles/iam.serviceAccountUser")
 
+# Read the policy once and only rewrite it for roles the account does not have yet
+GRANTED_ROLES=$(gcloud projects get-iam-policy "$PROJECT_ID" --flatten="bindings[].members" --filter="bindings.members:serviceAccount:$SERVICE_ACCOUNT_EMAIL" --format="value(bindings.role)")
+
 for role in "${ROLES[@]}"; do
+    if grep -qxF "$role" <<< "$GRANTED_ROLES"; then
+        echo "Already granted $role"
+        continue
+    fi
     gcloud projects add-iam-policy-binding "$PROJECT_ID" --member="serviceAccount:$SERVICE_ACCOUNT_EMAIL" --role="$role" --condition=None > /dev/null
     echo "Granted $role"
 done
@@ -112,14 +119,15 @@ read -p "Do you want to upload these secrets to GitHub now? (y/n) " -n 1 -r
 echo
 if [[ $REPLY =~ ^[Yy]$ ]]; then
     echo "Setting GitHub Secrets using gh CLI..."
+    # Pass the repo explicitly so gh does not re-resolve it from git remotes on every call
 
-    gh secret set GCP_PROJECT_ID --body "$PROJECT_ID"
+    gh secret set GCP_PROJECT_ID --repo "$REPO_NAME" --body "$PROJECT_ID"
     echo "Set GCP_PROJECT_ID"
 
-    gh secret set GCP_SERVICE_ACCOUNT --body "$SERVICE_ACCOUNT_EMAIL"
+    gh secret set GCP_SERVICE_ACCOUNT --repo "$REPO_NAME" --body "$SERVICE_ACCOUNT_EMAIL"
     echo "Set GCP_SERVICE_ACCOUNT"
 
-    gh secret set GCP_WORKLOAD_IDENTITY_PROVIDER --body "$WORKLOAD_IDENTITY_PROVIDER"
+    gh secret set GCP_WORKLOAD_IDENTITY_PROVIDER --repo "$REPO_NAME" --body "$WORKLOAD_IDENTITY_PROVIDER"
     echo "Set GCP_WORKLOAD_IDENTITY_PROVIDER"
 
     echo -e "\033[32mAll secrets set successfully!\033[0m"
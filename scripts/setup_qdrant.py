@@ -13,6 +13,7 @@ Requirements:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib.util import find_spec
 from pathlib import Path
 
@@ -25,6 +26,28 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def ensure_collection(client, collection_name: str, exists: bool, embedding_dim: int) -> str:
+    """Report on an existing collection or create a missing one.
+
+    Returns:
+        Status line for the collection.
+    """
+    from qdrant_client.models import Distance, VectorParams
+
+    if exists:
+        info = client.get_collection(collection_name)
+        return f"   ✅ {collection_name}: {info.points_count} vectors"
+
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(
+            size=embedding_dim,
+            distance=Distance.COSINE,
+        ),
+    )
+    return f"   🆕 Created collection: {collection_name}"
+
+
 def setup_qdrant():
     """Verify Qdrant Cloud connection and create collections."""
     url = os.getenv("QDRANT_URL")
@@ -49,7 +72,6 @@ def setup_qdrant():
         return False
 
     from qdrant_client import QdrantClient
-    from qdrant_client.models import Distance, VectorParams
 
     try:
         client = QdrantClient(url=url, api_key=api_key)
@@ -63,21 +85,23 @@ def setup_qdrant():
         required_collections = ["regulations", "stewards_decisions", "race_data"]
         embedding_dim = 768  # Gemini text-embedding-004
 
-        for collection_name in required_collections:
-            exists = any(c.name == collection_name for c in collections.collections)
-
-            if exists:
-                info = client.get_collection(collection_name)
-                print(f"   ✅ {collection_name}: {info.points_count} vectors")
-            else:
-                client.create_collection(
-                    collection_name=collection_name,
-                    vectors_config=VectorParams(
-                        size=embedding_dim,
-                        distance=Distance.COSINE,
-                    ),
+        existing_names = {c.name for c in collections.collections}
+
+        # Collections are independent, so check/create them concurrently
+        with ThreadPoolExecutor(max_workers=len(required_collections)) as executor:
+            futures = [
+                executor.submit(
+                    ensure_collection,
+                    client,
+                    collection_name,
+                    collection_name in existing_names,
+                    embedding_dim,
                 )
-                print(f"   🆕 Created collection: {collection_name}")
+                for collection_name in required_collections
+            ]
+            # Print in a stable order; result() re-raises any failure
+            for future in futures:
+                print(future.result())
 
         print("\n✅ Qdrant setup complete!")
         print("\nNext steps:")
@@ -12,10 +12,16 @@ import json
 import sys
 
 import requests
+from requests.adapters import HTTPAdapter
+
+UTF8_BOM = b"\xef\xbb\xbf"
 
 
 def test_api_endpoint(
-    url: str, question: str = "What is the penalty for track limits?", timeout: int = 60
+    url: str,
+    question: str = "What is the penalty for track limits?",
+    timeout: int = 60,
+    session: requests.Session | None = None,
 ) -> dict:
     """Test an API endpoint for proper JSON response.
 
@@ -23,6 +29,7 @@ def test_api_endpoint(
         url: The API endpoint URL
         question: Test question to send
         timeout: Request timeout in seconds
+        session: Optional session to reuse pooled connections across calls
 
     Returns:
         Dict with test results
@@ -38,7 +45,12 @@ def test_api_endpoint(
         payload = {"question": question}
         print(f"Sending: {json.dumps(payload)}")
 
-        response = requests.post(url, json=payload, timeout=timeout)
+        # Stream the body so it is read exactly once; every check below reuses these bytes
+        response = (session or requests).post(url, json=payload, timeout=timeout, stream=True)
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=8192):
+            body.extend(chunk)
+        raw_bytes = bytes(body)
 
         # Check 1: Status code
         results["checks"]["status_code"] = response.status_code
@@ -54,12 +66,11 @@ def test_api_endpoint(
             results["errors"].append(f"Unexpected Content-Type: {content_type}")
 
         # Check 3: Raw bytes for BOM
-        raw_bytes = response.content
         results["checks"]["response_length"] = len(raw_bytes)
         print(f"3. Response Length: {len(raw_bytes)} bytes")
 
         # Check for UTF-8 BOM at start
-        has_bom = raw_bytes.startswith(b"\xef\xbb\xbf")
+        has_bom = raw_bytes.startswith(UTF8_BOM)
         results["checks"]["has_utf8_bom"] = has_bom
         print(f"4. Has UTF-8 BOM at start: {has_bom}")
         if has_bom:
@@ -68,20 +79,21 @@ def test_api_endpoint(
         # Check first few bytes
         print(f"5. First 50 bytes: {repr(raw_bytes[:50])}")
 
-        # Check 4: BOM character in decoded text
-        text = response.text
-        has_bom_char = "\ufeff" in text
+        # Check 4: BOM character anywhere in the body. A U+FEFF in UTF-8 text is
+        # always these three bytes, so search the raw bytes instead of decoding
+        pos = raw_bytes.find(UTF8_BOM)
+        has_bom_char = pos != -1
         results["checks"]["has_bom_char"] = has_bom_char
         print(f"6. Has BOM char (\\ufeff) in text: {has_bom_char}")
         if has_bom_char:
-            pos = text.find("\ufeff")
-            results["errors"].append(f"BOM character found at position {pos}")
-            print(f"   Position: {pos}")
-            print(f"   Context: {repr(text[max(0,pos-20):pos+20])}")
-
-        # Check 5: First character
-        if text:
-            first_char = text[0]
+            results["errors"].append(f"BOM character found at byte position {pos}")
+            context = raw_bytes[max(0, pos - 20) : pos + 20].decode("utf-8", errors="replace")
+            print(f"   Position: {pos} (bytes)")
+            print(f"   Context: {repr(context)}")
+
+        # Check 5: First character (a UTF-8 character is at most 4 bytes)
+        if raw_bytes:
+            first_char = raw_bytes[:4].decode("utf-8", errors="ignore")[:1] or "\ufffd"
             first_ord = ord(first_char)
             print(f"7. First character: {repr(first_char)} (ord: {first_ord})")
             if first_ord == 0xFEFF:
@@ -90,7 +102,8 @@ def test_api_endpoint(
         # Check 6: JSON validity
         print("\n8. Attempting JSON parse...")
         try:
-            data = response.json()
+            # json.loads on bytes detects the encoding (and a leading BOM) like response.json()
+            data = json.loads(raw_bytes)
             results["checks"]["json_valid"] = True
             print("   ✅ JSON parsed successfully")
 
@@ -108,10 +121,11 @@ def test_api_endpoint(
             if "model_used" in data:
                 print(f"   - model_used: {data['model_used']}")
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             results["checks"]["json_valid"] = False
             results["errors"].append(f"JSON parse error: {e}")
             print(f"   ❌ JSON parse failed: {e}")
+            text = raw_bytes[:2000].decode("utf-8", errors="replace")
             print(f"   Raw text (first 500 chars): {repr(text[:500])}")
 
         # Overall success
@@ -164,9 +178,14 @@ def main():
 
     all_results = []
 
-    for endpoint in endpoints:
-        results = test_api_endpoint(endpoint)
-        all_results.append(results)
+    # One pooled session so repeated requests to an endpoint reuse the connection
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        for endpoint in endpoints:
+            results = test_api_endpoint(endpoint, session=session)
+            all_results.append(results)
 
     # Overall summary
     print("\n" + "=" * 60)
@@ -7,20 +7,19 @@ import requests
 
 url = "https://f1-penalty-agent-mb4t5jwica-ey.a.run.app/api/v1/ask"
 
-# Explicitly create clean JSON without any BOM
+# requests serializes json= payloads itself (ASCII-only, no BOM); this one-shot
+# dump is only for showing the bytes that go over the wire
 payload = {"question": "test"}
-json_data = json.dumps(payload, ensure_ascii=True)
+payload_bytes = json.dumps(payload).encode("utf-8")
 
 print("Testing from Linux/WSL...")
 print(f"URL: {url}")
-print(f"Payload bytes: {json_data.encode('utf-8')[:50]}")
-print(f"First byte: {json_data.encode('utf-8')[0]}")
+print(f"Payload bytes: {payload_bytes[:50]}")
+print(f"First byte: {payload_bytes[0]}")
 print()
 
-headers = {"Content-Type": "application/json; charset=utf-8"}
-
 try:
-    response = requests.post(url, data=json_data.encode("utf-8"), headers=headers, timeout=120)
+    response = requests.post(url, json=payload, timeout=120)
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.text[:500]}")
 except Exception as e:
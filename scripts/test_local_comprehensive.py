@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
-"""Comprehensive local API test suite."""
+"""Comprehensive local API test suite.
 
-import threading
-import time
+Requests are served in-process through httpx's ASGI transport, so no uvicorn
+server, socket or warm-up wait is needed.
+"""
 
-import requests
-import uvicorn
+import asyncio
+
+from httpx import ASGITransport, AsyncClient
+from orjson import loads as json_loads
 
 # Test questions covering different query types
 TEST_QUESTIONS = [
@@ -17,42 +20,39 @@ TEST_QUESTIONS = [
 ]
 
 
-def run_server():
-    from src.adapters.inbound.api.main import app
+SECTION_RULE = "=" * 60
 
-    uvicorn.run(app, host="127.0.0.1", port=8765, log_level="error")
 
+def print_section(title: str) -> None:
+    """Print a section banner with a single write."""
+    print(f"\n{SECTION_RULE}\n{title}\n{SECTION_RULE}")
 
-def main():
-    # Start server
-    print("Starting local server...")
-    thread = threading.Thread(target=run_server, daemon=True)
-    thread.start()
-    time.sleep(5)
 
-    base_url = "http://127.0.0.1:8765"
+async def main():
+    from src.adapters.inbound.api.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await run_tests(client)
 
+
+async def run_tests(client: AsyncClient):
     # Test 1: Health check
-    print("\n" + "=" * 60)
-    print("TEST 1: Health Check")
-    print("=" * 60)
+    print_section("TEST 1: Health Check")
     try:
-        r = requests.get(f"{base_url}/health", timeout=10)
+        r = await client.get("/api/v1/health", timeout=10)
         print(f"Status: {r.status_code}")
-        print(f"Response: {r.json()}")
+        print(f"Response: {json_loads(r.content)}")
         assert r.status_code == 200, "Health check failed"
         print("✅ PASSED")
     except Exception as e:
         print(f"❌ FAILED: {e}")
 
     # Test 2: Setup status
-    print("\n" + "=" * 60)
-    print("TEST 2: Setup Status")
-    print("=" * 60)
+    print_section("TEST 2: Setup Status")
     try:
-        r = requests.get(f"{base_url}/api/v1/setup/status", timeout=30)
+        r = await client.get("/api/v1/setup/status", timeout=30)
         print(f"Status: {r.status_code}")
-        data = r.json()
+        data = json_loads(r.content)
         print(f"Is Populated: {data.get('is_populated')}")
         print(f"Collections: {data.get('collections')}")
         assert r.status_code == 200, "Setup status check failed"
@@ -62,49 +62,49 @@ def main():
         print(f"❌ FAILED: {e}")
 
     # Test 3: Multiple /ask questions
-    print("\n" + "=" * 60)
-    print("TEST 3: Ask Questions (Multiple)")
-    print("=" * 60)
+    print_section("TEST 3: Ask Questions (Multiple)")
 
     passed = 0
     failed = 0
 
-    for i, question in enumerate(TEST_QUESTIONS, 1):
+    # Questions are independent, so send them all at once: wall time is the
+    # slowest answer rather than the sum of all of them.
+    responses = await asyncio.gather(
+        *(
+            client.post("/api/v1/ask", json={"question": question}, timeout=120)
+            for question in TEST_QUESTIONS
+        ),
+        return_exceptions=True,
+    )
+
+    for i, (question, r) in enumerate(zip(TEST_QUESTIONS, responses), 1):
         print(f"\n--- Question {i}: {question[:50]}...")
-        try:
-            r = requests.post(
-                f"{base_url}/api/v1/ask",
-                json={"question": question},
-                timeout=120,
-            )
-            if r.status_code == 200:
-                data = r.json()
-                answer = data.get("answer", "")
-                sources = data.get("sources", [])
-                print("  Status: 200 ✅")
-                print(f"  Answer length: {len(answer)} chars")
-                print(f"  Sources: {len(sources)}")
-                print(f"  Preview: {answer[:100]}...")
-                passed += 1
-            else:
-                print(f"  Status: {r.status_code} ❌")
-                print(f"  Error: {r.text[:200]}")
-                failed += 1
-        except Exception as e:
-            print(f"  ❌ Request failed: {e}")
+        if isinstance(r, BaseException):
+            print(f"  ❌ Request failed: {r}")
+            failed += 1
+        elif r.status_code == 200:
+            data = json_loads(r.content)
+            answer = data.get("answer", "")
+            sources = data.get("sources", [])
+            print("  Status: 200 ✅")
+            print(f"  Answer length: {len(answer)} chars")
+            print(f"  Sources: {len(sources)}")
+            print(f"  Preview: {answer[:100]}...")
+            passed += 1
+        else:
+            print(f"  Status: {r.status_code} ❌")
+            print(f"  Error: {r.text[:200]}")
             failed += 1
 
     print(f"\n--- Results: {passed}/{len(TEST_QUESTIONS)} passed ---")
 
     # Test 4: Edge cases
-    print("\n" + "=" * 60)
-    print("TEST 4: Edge Cases")
-    print("=" * 60)
+    print_section("TEST 4: Edge Cases")
 
     # Empty question should fail gracefully
     print("\n--- Empty question ---")
     try:
-        r = requests.post(f"{base_url}/api/v1/ask", json={"question": ""}, timeout=30)
+        r = await client.post("/api/v1/ask", json={"question": ""}, timeout=30)
         print(f"Status: {r.status_code}")
         if r.status_code == 422:  # Validation error expected
             print("✅ Correctly rejected empty question")
@@ -116,14 +116,14 @@ def main():
     # Unicode question
     print("\n--- Unicode question ---")
     try:
-        r = requests.post(
-            f"{base_url}/api/v1/ask",
+        r = await client.post(
+            "/api/v1/ask",
             json={"question": "What is the penalty for Pérez at São Paulo?"},
             timeout=120,
         )
         print(f"Status: {r.status_code}")
         if r.status_code == 200:
-            data = r.json()
+            data = json_loads(r.content)
             print("✅ Unicode handled correctly")
             print(f"Answer preview: {data.get('answer', '')[:100]}...")
         else:
@@ -131,10 +131,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
 
-    print("\n" + "=" * 60)
-    print("ALL LOCAL TESTS COMPLETE")
-    print("=" * 60)
+    print_section("ALL LOCAL TESTS COMPLETE")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
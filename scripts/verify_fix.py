@@ -10,7 +10,9 @@ print("Testing deployed API...")
 print(f"URL: {url}\n")
 
 try:
-    response = requests.post(url, json=payload, timeout=120)
+    # A session keeps the TLS connection pooled if this check is extended to more calls
+    with requests.Session() as session:
+        response = session.post(url, json=payload, timeout=120)
 
     print(f"Status Code: {response.status_code}")
 
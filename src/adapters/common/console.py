@@ -0,0 +1,9 @@
+"""Shared Rich console for adapter progress output.
+
+Terminal, color-system and encoding detection run once when this module is
+imported, instead of once per adapter module.
+"""
+
+from rich.console import Console
+
+console = Console()
@@ -6,7 +6,11 @@ logger = logging.getLogger(__name__)
 
 
 def log_encoding_info() -> None:
-    logger.info(f"System encoding: {sys.getfilesystemencoding()}")
-    logger.info(f"Stdout encoding: {sys.stdout.encoding}")
-    logger.info(f"Locale: {locale.getlocale()}")
-    logger.info(f"Default encoding: {sys.getdefaultencoding()}")
+    """Log the process encoding settings as a single record."""
+    logger.info(
+        "Encoding: fs=%s stdout=%s locale=%s default=%s",
+        sys.getfilesystemencoding(),
+        sys.stdout.encoding,
+        locale.getlocale(),
+        sys.getdefaultencoding(),
+    )
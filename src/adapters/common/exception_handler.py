@@ -41,7 +41,8 @@ def format_exception_json(
     if isinstance(exc, F1AgentError):
         result = exc.to_dict(include_trace=include_trace)
         if extra_context:
-            result.setdefault("context", {}).update(extra_context)
+            # Build a new dict so the exception's own context isn't mutated
+            result["context"] = {**result.get("context", {}), **extra_context}
         return result
 
     # Handle standard Python exceptions
@@ -82,7 +83,7 @@ def log_exception(
     log: logging.Logger | None = None,
     level: int = logging.ERROR,
     extra_context: dict[str, Any] | None = None,
-) -> None:
+) -> dict[str, Any]:
     """Log exception in structured JSON format.
 
     Args:
@@ -91,6 +92,10 @@ def log_exception(
         level: Logging level (default: ERROR).
         extra_context: Additional context to include.
 
+    Returns:
+        The formatted error dictionary (with stack trace), so callers can
+        build a response from it instead of formatting the exception again.
+
     Example:
         >>> try:
         ...     do_something_risky()
@@ -100,7 +105,9 @@ def log_exception(
     log_instance = log or logger
 
     exc_data = format_exception_json(exc, include_trace=True, extra_context=extra_context)
-    log_instance.log(level, json.dumps(exc_data, indent=2))
+    if log_instance.isEnabledFor(level):
+        log_instance.log(level, json.dumps(exc_data, indent=2, default=str))
+    return exc_data
 
 
 def handle_exception(
@@ -132,10 +139,10 @@ def handle_exception(
         ...     error_info = handle_exception(e, context={"operation": "fetch"}, reraise=False)
         ...     return JSONResponse(status_code=500, content=error_info)
     """
-    log_exception(exc, log=log, extra_context=context)
+    error_info = log_exception(exc, log=log, extra_context=context)
 
     # Return client-safe version (no traces)
-    error_info = format_exception_json(exc, include_trace=False, extra_context=context)
+    error_info.pop("stack_trace", None)
 
     if reraise:
         raise exc
@@ -1,9 +1,18 @@
-"""FastAPI dependency injection for F1 Agent."""
+"""FastAPI dependency injection for F1 Agent.
+
+Singletons are held in module globals. ``init_dependencies()`` builds them all
+at startup so each getter is a plain global read on the request path; the
+getters still build lazily if startup was skipped (e.g. in-process test
+clients that don't run the lifespan).
+"""
 
 import logging
-from functools import lru_cache
+import threading
+import time
+from typing import Any
 
 from ....adapters.outbound.llm.gemini_adapter import GeminiAdapter as GeminiClient
+from ....adapters.outbound.vector_store.qdrant_adapter import GeminiEmbeddingFunction
 from ....adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter as QdrantVectorStore
 from ....config.settings import settings
 from ....core.services.agent_service import AgentService as F1Agent
@@ -11,42 +20,149 @@ from ....core.services.retrieval_service import RetrievalService as F1Retriever
 
 logger = logging.getLogger(__name__)
 
+_embedding_function: GeminiEmbeddingFunction | None = None
+_vector_store: QdrantVectorStore | None = None
+_retriever: F1Retriever | None = None
+_llm_client: GeminiClient | None = None
+_agent: F1Agent | None = None
+
+# Collection stats are polled by readiness probes and the setup UI every few
+# seconds; a short TTL collapses those bursts into one round trip to Qdrant
+STATS_TTL_SECONDS = 3.0
+_stats_cache: dict[tuple[str, ...], tuple[float, dict[str, dict[str, Any]]]] = {}
+_stats_lock = threading.Lock()
+# Bumped by invalidate_collection_stats; a refresh that started before an
+# invalidation must not store its (pre-invalidation) result. The store lock is
+# only held for the compare-and-store, never across a Qdrant call
+_stats_generation = 0
+_stats_store_lock = threading.Lock()
+
+
+def get_embedding_function() -> GeminiEmbeddingFunction:
+    """Get or create the GeminiEmbeddingFunction singleton.
+
+    Shared so every consumer reuses one warm genai client (and its HTTP session).
+    """
+    global _embedding_function
+    if _embedding_function is None:
+        logger.info("Initializing GeminiEmbeddingFunction...")
+        _embedding_function = GeminiEmbeddingFunction(settings.google_api_key)
+    return _embedding_function
+
 
-@lru_cache
 def get_vector_store() -> QdrantVectorStore:
     """Get or create the QdrantVectorStore singleton."""
-    logger.info("Initializing QdrantVectorStore...")
-    return QdrantVectorStore(
-        url=settings.qdrant_url,
-        api_key=settings.qdrant_api_key,
-        embedding_api_key=settings.google_api_key,
-    )
+    global _vector_store
+    if _vector_store is None:
+        logger.info("Initializing QdrantVectorStore...")
+        _vector_store = QdrantVectorStore(
+            url=settings.qdrant_url,
+            api_key=settings.qdrant_api_key,
+            embedding_api_key=settings.google_api_key,
+            embedding_function=get_embedding_function(),
+        )
+    return _vector_store
 
 
-@lru_cache
 def get_retriever() -> F1Retriever:
     """Get or create the F1Retriever singleton."""
-    logger.info("Initializing F1Retriever...")
-    vector_store = get_vector_store()
-    # Disable reranker for cross-platform compatibility (torch has issues on Windows)
-    # In production Docker/Linux, this can be enabled for better accuracy
-    return F1Retriever(vector_store, use_reranker=False)
+    global _retriever
+    if _retriever is None:
+        logger.info("Initializing F1Retriever...")
+        # Reranker is off by default for cross-platform compatibility (torch has issues
+        # on Windows). In production Docker/Linux, set RERANK_ENABLED=true for better accuracy
+        _retriever = F1Retriever(get_vector_store(), use_reranker=settings.rerank_enabled)
+    return _retriever
 
 
-@lru_cache
 def get_llm_client() -> GeminiClient:
     """Get or create the GeminiClient singleton."""
-    logger.info("Initializing GeminiClient...")
-    return GeminiClient(
-        api_key=settings.google_api_key,
-        model=settings.llm_model,
-    )
+    global _llm_client
+    if _llm_client is None:
+        logger.info("Initializing GeminiClient...")
+        _llm_client = GeminiClient(
+            api_key=settings.google_api_key,
+            model=settings.llm_model,
+        )
+    return _llm_client
 
 
-@lru_cache
 def get_agent() -> F1Agent:
     """Get or create the F1Agent singleton."""
-    logger.info("Initializing F1Agent...")
+    global _agent
+    if _agent is None:
+        logger.info("Initializing F1Agent...")
+        _agent = F1Agent(retriever=get_retriever(), llm_client=get_llm_client())
+    return _agent
+
+
+def init_dependencies() -> None:
+    """Build every singleton up front so requests never pay construction cost."""
+    get_vector_store()
+    get_retriever()
+    get_llm_client()
+    get_agent()
+
+
+def warm_dependencies() -> None:
+    """Open the lazily created clients so the first request doesn't pay for them.
+
+    Connects to Qdrant (provisioning collections once), creates the Gemini
+    clients and, when enabled, loads the reranker model. Failures are logged
+    rather than raised so the service still starts and the readiness probe
+    can report what is down.
+    """
     retriever = get_retriever()
-    llm_client = get_llm_client()
-    return F1Agent(retriever=retriever, llm_client=llm_client)
+    warmups = [
+        ("Qdrant client", get_vector_store().warm),
+        ("Gemini embedding client", get_embedding_function().warm),
+        ("Gemini LLM client", get_llm_client().warm),
+    ]
+    if retriever.reranker is not None:
+        warmups.append(("reranker model", retriever.reranker.warm))
+
+    for name, warm in warmups:
+        try:
+            warm()
+        except Exception as e:
+            logger.warning("Could not warm %s at startup: %s", name, e)
+
+
+def get_collection_stats_cached(
+    vector_store: QdrantVectorStore, collection_names: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Batched collection stats, reused for ``STATS_TTL_SECONDS``.
+
+    Only one caller refreshes an expired entry at a time, but nobody waits on
+    it: while a refresh is in flight, other callers get the previous stats, or
+    fetch their own if there is nothing cached yet.
+    """
+    key = tuple(collection_names)
+    cached = _stats_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    if not _stats_lock.acquire(blocking=False):
+        if cached is not None:
+            return cached[1]
+        return vector_store.get_collection_stats_batch(collection_names)
+    try:
+        generation = _stats_generation
+        stats = vector_store.get_collection_stats_batch(collection_names)
+        with _stats_store_lock:
+            if generation == _stats_generation:
+                _stats_cache[key] = (time.monotonic() + STATS_TTL_SECONDS, stats)
+        return stats
+    finally:
+        _stats_lock.release()
+
+
+def invalidate_collection_stats() -> None:
+    """Drop cached collection stats (call after indexing changes the counts).
+
+    Doesn't take the refresh lock, so it is safe to call from the event loop.
+    A refresh already in flight still returns its stats but won't cache them.
+    """
+    global _stats_generation
+    with _stats_store_lock:
+        _stats_generation += 1
+        _stats_cache.clear()
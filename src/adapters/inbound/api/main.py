@@ -2,20 +2,18 @@
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from ....core.domain.exceptions import F1AgentError
-from ...common.exception_handler import (
-    format_exception_json,
-    get_http_status_code,
-    log_exception,
-)
+from ...common.exception_handler import get_http_status_code, log_exception
+from .rate_limit import SlidingWindowRateLimitMiddleware
 from .routers import chat, health, setup
 
 # Configure logging
@@ -25,13 +23,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
 # Determine if we're in debug mode (shows full stack traces)
 DEBUG_MODE = os.getenv("DEBUG", "false").lower() == "true"
 
-# Initialize rate limiter
-# Default: 60 requests per minute per IP for general endpoints
-# Chat endpoints have stricter limits defined in the router
-limiter = Limiter(key_func=get_remote_address)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Initialize resources on startup and clean up on shutdown."""
+    from .deps import init_dependencies, warm_dependencies
+
+    # Encoding diagnostics are only useful when chasing BOM/charset issues;
+    # skip them on regular (frequent, serverless) cold starts
+    if DEBUG_MODE:
+        from ...common.debug import log_encoding_info
+
+        log_encoding_info()
+    init_dependencies()
+    warm_dependencies()
+
+    logger.info("F1 Penalty Agent API starting up...")
+    logger.info("API docs available at /docs")
+    logger.info("Debug mode: %s", "ENABLED" if DEBUG_MODE else "DISABLED")
+
+    yield
+
+    logger.info("F1 Penalty Agent API shutting down...")
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -43,12 +61,10 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add rate limiter to app state and exception handler
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 ALLOWED_ORIGINS = [
     "http://localhost:3000",  # Local dev
     "http://localhost:5173",  # Vite dev server
@@ -56,6 +72,16 @@ ALLOWED_ORIGINS = [
     "https://gen-lang-client-0855046443.firebaseapp.com",  # Firebase hosting alt
 ]
 
+# Origin matchers precomputed once (lowercased, as scheme and host are
+# case-insensitive): exact origins for a set lookup, and (prefix, suffix)
+# pairs for any "*" wildcard entries
+_EXACT_ORIGINS = frozenset(o.lower() for o in ALLOWED_ORIGINS if "*" not in o)
+_WILDCARD_ORIGINS = tuple(tuple(o.lower().split("*", 1)) for o in ALLOWED_ORIGINS if "*" in o)
+
+# Rate limit the chat endpoints before routing and body validation. Added before
+# CORS so CORS wraps it and 429 responses still carry the CORS headers
+app.add_middleware(SlidingWindowRateLimitMiddleware, rules=chat.RATE_LIMITS)
+
 # Configure CORS for frontend access with restricted methods and headers
 app.add_middleware(
     CORSMiddleware,
@@ -72,6 +98,9 @@ app.add_middleware(
     ],  # Restrict to standard headers needed for API calls
 )
 
+# Compress larger JSON bodies (answers with sources); SSE streams are excluded by Starlette
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 @app.middleware("http")
 async def enforce_origin_middleware(request: Request, call_next):
@@ -79,8 +108,9 @@ async def enforce_origin_middleware(request: Request, call_next):
 
     Ensures that API requests come from allowed origins only.
     """
-    # Skip origin check for metrics, health, or non-API endpoints if needed
-    if request.method == "OPTIONS":
+    # Skip origin check for preflights and non-API endpoints (docs, schema)
+    scope = request.scope
+    if scope["method"] == "OPTIONS" or not scope["path"].startswith("/api/"):
         return await call_next(request)
 
     origin = request.headers.get("origin")
@@ -93,22 +123,14 @@ async def enforce_origin_middleware(request: Request, call_next):
     # Given the user said "only allow the firebase website", we'll be strict
     # but allow localhost for dev.
 
-    if origin:
-        # Simple wildcard check
-        is_allowed = False
-        for allowed in ALLOWED_ORIGINS:
-            if allowed == origin:
-                is_allowed = True
-                break
-            if "*" in allowed:
-                # Basic wildcard matching
-                prefix, suffix = allowed.split("*")
-                if origin.startswith(prefix) and origin.endswith(suffix):
-                    is_allowed = True
-                    break
-
+    if origin and (origin := origin.lower()) not in _EXACT_ORIGINS:
+        # Basic wildcard matching
+        is_allowed = any(
+            origin.startswith(prefix) and origin.endswith(suffix)
+            for prefix, suffix in _WILDCARD_ORIGINS
+        )
         if not is_allowed:
-            return JSONResponse(status_code=403, content={"detail": "Origin not allowed"})
+            return ORJSONResponse(status_code=403, content={"detail": "Origin not allowed"})
 
     return await call_next(request)
 
@@ -124,6 +146,27 @@ app.include_router(setup.router)
 # =============================================================================
 
 
+def _log_and_format(request: Request, exc: Exception) -> dict[str, Any]:
+    """Log the exception and return its response body from the same formatted dict.
+
+    Path and method are read from the ASGI scope (no URL object built) and only
+    logged; the response keeps just the error's own context. The stack trace is
+    only kept in the response in debug mode.
+    """
+    scope = request.scope
+    error_data = log_exception(
+        exc,
+        extra_context={"path": scope.get("path", ""), "method": scope.get("method", "")},
+    )
+    if isinstance(exc, F1AgentError) and exc.extra_context:
+        error_data["context"] = exc.extra_context
+    else:
+        error_data.pop("context", None)
+    if not DEBUG_MODE:
+        error_data.pop("stack_trace", None)
+    return error_data
+
+
 @app.exception_handler(F1AgentError)
 async def f1_agent_error_handler(request: Request, exc: F1AgentError) -> JSONResponse:
     """Handle all F1AgentError exceptions with structured JSON response.
@@ -135,11 +178,9 @@ async def f1_agent_error_handler(request: Request, exc: F1AgentError) -> JSONRes
     Returns:
         JSONResponse with structured error details.
     """
-    log_exception(exc, extra_context={"path": str(request.url.path), "method": request.method})
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=get_http_status_code(exc),
-        content=exc.to_dict(include_trace=DEBUG_MODE),
+        content=_log_and_format(request, exc),
     )
 
 
@@ -154,38 +195,11 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     Returns:
         JSONResponse with structured error details.
     """
-    log_exception(exc, extra_context={"path": str(request.url.path), "method": request.method})
-
-    error_data = format_exception_json(exc, include_trace=DEBUG_MODE)
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=get_http_status_code(exc),
-        content=error_data,
+        content=_log_and_format(request, exc),
     )
 
 
-# =============================================================================
-# Lifecycle Events
-# =============================================================================
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize resources on startup."""
-    from ...common.debug import log_encoding_info
-
-    log_encoding_info()
-
-    logger.info("F1 Penalty Agent API starting up...")
-    logger.info("API docs available at /docs")
-    logger.info("Debug mode: %s", "ENABLED" if DEBUG_MODE else "DISABLED")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup resources on shutdown."""
-    logger.info("F1 Penalty Agent API shutting down...")
-
-
 # Export for uvicorn
 __all__ = ["app"]
@@ -0,0 +1,75 @@
+"""In-process sliding-window rate limiting as an ASGI middleware.
+
+Runs before routing and request-body validation, so rejected requests never
+reach Pydantic or the endpoint. Counters live in this process only, which
+matches a single Cloud Run instance; they are not shared across instances.
+"""
+
+import time
+from collections import deque
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SlidingWindowRateLimitMiddleware:
+    """Limit requests per client IP on selected paths over a sliding window.
+
+    Each (path, client) key keeps the timestamps of its requests inside the
+    window; a request is rejected with 429 once the window holds ``limit`` of
+    them. Idle keys are swept once per window so the table stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, rules: dict[str, tuple[int, float]]) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            rules: Exact request path -> (max requests, window in seconds).
+        """
+        self.app = app
+        self.rules = rules
+        self._hits: dict[tuple[str, str], deque[float]] = {}
+        self._next_sweep = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Count the request against its path's rule, or reject it with 429."""
+        if scope["type"] != "http" or (rule := self.rules.get(scope["path"])) is None:
+            await self.app(scope, receive, send)
+            return
+
+        limit, period = rule
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        client = scope.get("client")
+        key = (scope["path"], client[0] if client else "127.0.0.1")
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = self._hits[key] = deque()
+
+        window_start = now - period
+        while hits and hits[0] <= window_start:
+            hits.popleft()
+
+        if len(hits) >= limit:
+            retry_after = max(1, int(hits[0] - window_start) + 1)
+            response = ORJSONResponse(
+                status_code=429,
+                content={"error": f"Rate limit exceeded: {limit} per {period:g} seconds"},
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        hits.append(now)
+        await self.app(scope, receive, send)
+
+    def _sweep(self, now: float) -> None:
+        """Drop keys whose newest request has left the longest window."""
+        longest = max(period for _, period in self.rules.values())
+        cutoff = now - longest
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= cutoff]:
+            del self._hits[key]
+        self._next_sweep = now + longest
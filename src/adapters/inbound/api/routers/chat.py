@@ -1,24 +1,74 @@
 """Chat endpoint for asking F1 penalty questions."""
 
+import json
 import logging
 
-from fastapi import APIRouter, HTTPException, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from .....core.domain.agent import ChatMessage as DomainChatMessage
 from .....core.domain.utils import normalize_text
 from ..deps import get_agent
-from ..models import AnswerResponse, ErrorResponse, QuestionRequest, SourceInfo
+from ..models import AnswerResponse, ChatMessage, ErrorResponse, QuestionRequest
 
 logger = logging.getLogger(__name__)
 
-# Rate limiter for chat endpoints - more restrictive than general API
-# 20 requests per minute per IP to prevent abuse of LLM resources
-limiter = Limiter(key_func=get_remote_address)
+# Rate limits for chat endpoints - more restrictive than general API:
+# 20 requests per minute per IP to prevent abuse of LLM resources.
+# Path -> (max requests, window seconds), enforced by the app's rate-limit middleware
+RATE_LIMITS: dict[str, tuple[int, float]] = {
+    "/api/v1/ask": (20, 60.0),
+    "/api/v1/ask/stream": (20, 60.0),
+}
 
 router = APIRouter(prefix="/api/v1", tags=["chat"])
 
+# SSE chunk frames are sent once per token: only the text is JSON-encoded and
+# the fixed envelope around it is precomputed (same bytes as json.dumps of the dict)
+_SSE_CHUNK_PREFIX = 'data: {"type": "chunk", "content": '
+_SSE_FRAME_END = "}\n\n"
+
+
+def _source_payloads(sources_used: list[dict]) -> list[dict]:
+    """Shape agent source citations as SourceInfo-compatible dicts.
+
+    The citations are built by the agent service, so they are mapped directly
+    instead of going through Pydantic; the one constrained field, the 0-1
+    relevance score, is clamped (raw cosine scores can be negative).
+    """
+    return [
+        {
+            "title": source.get("source", "Unknown"),
+            "doc_type": source.get("doc_type", "unknown"),
+            "relevance_score": min(max(source.get("score", 0.0), 0.0), 1.0),
+            "excerpt": source.get("excerpt") or "",
+            "url": source.get("url"),
+        }
+        for source in sources_used
+    ]
+
+
+def _to_history(messages: list[ChatMessage]) -> list[DomainChatMessage]:
+    """Convert validated API chat messages to domain messages (positional, no re-validation)."""
+    return [DomainChatMessage(m.role, m.content) for m in messages]
+
+
+def _answer_response(answer: str, sources: list[dict], question: str) -> ORJSONResponse:
+    """Encode an AnswerResponse-shaped payload in one pass.
+
+    Returning a Response makes FastAPI skip its response-model serialization;
+    ``response_model`` is kept on the route for the OpenAPI schema.
+    """
+    return ORJSONResponse(
+        content={
+            "answer": answer,
+            "sources": sources,
+            "question": question,
+            "model_used": "gemini-2.0-flash",
+        }
+    )
+
 
 @router.post(
     "/ask",
@@ -29,16 +79,14 @@ router = APIRouter(prefix="/api/v1", tags=["chat"])
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-@limiter.limit("20/minute")
-def ask_question(request: Request, body: QuestionRequest) -> AnswerResponse:
+async def ask_question(body: QuestionRequest) -> ORJSONResponse:
     """Ask a question about F1 penalties or regulations.
 
     Args:
-        request: The FastAPI request object (used for rate limiting).
         body: The question request containing the user's question.
 
     Returns:
-        AnswerResponse with the AI-generated answer and sources.
+        JSON response shaped like AnswerResponse, with the AI-generated answer and sources.
 
     Raises:
         HTTPException: If the question cannot be processed.
@@ -49,57 +97,32 @@ def ask_question(request: Request, body: QuestionRequest) -> AnswerResponse:
 
         # Validate minimum input length for meaningful processing
         if len(normalized_question.strip()) < 3:
-            return AnswerResponse(
-                answer="I need a bit more context to help you. Could you ask about a specific F1 penalty, regulation, or race incident?",
-                sources=[],
-                question=normalized_question,
-                model_used="gemini-2.0-flash",
+            return _answer_response(
+                "I need a bit more context to help you. Could you ask about a specific F1 penalty, regulation, or race incident?",
+                [],
+                normalized_question,
             )
 
         # Convert API messages to Domain messages
-        history = [DomainChatMessage(role=m.role, content=m.content) for m in body.messages]
-
-        # Get response from the agent
-        response = agent.ask(normalized_question, messages=history)
-
-        # Convert sources to SourceInfo objects
-        sources = []
-        for source in response.sources_used:
-            if isinstance(source, str):
-                sources.append(
-                    SourceInfo(
-                        title=source.replace("[Source] ", ""),
-                        doc_type="regulation",
-                        relevance_score=0.0,
-                        excerpt=None,
-                    )
-                )
-            else:
-                sources.append(
-                    SourceInfo(
-                        title=source.get("source", "Unknown"),
-                        doc_type=source.get("doc_type", "unknown"),
-                        relevance_score=source.get("score", 0.0),
-                        excerpt=source.get("excerpt") or "",
-                        url=source.get("url"),
-                    )
-                )
-
-        return AnswerResponse(
-            answer=response.answer,
-            sources=sources,
-            question=normalized_question,
-            model_used="gemini-2.0-flash",
+        history = _to_history(body.messages)
+
+        # Get response from the agent; the LLM/vector calls block, so run them in
+        # the threadpool and keep the event loop free for other requests
+        response = await run_in_threadpool(agent.ask, normalized_question, messages=history)
+
+        # Built from already-normalized service output: skip Pydantic entirely
+        return _answer_response(
+            response.answer, _source_payloads(response.sources_used), normalized_question
         )
 
     except ValueError as e:
-        logger.warning(f"Invalid request: {e}")
+        logger.warning("Invalid request: %s", e)
         raise HTTPException(
             status_code=400,
             detail="Invalid request. Please check your input and try again.",
         )
-    except Exception as e:
-        logger.exception(f"Error processing question: {e}")
+    except Exception:
+        logger.exception("Error processing question")
         raise HTTPException(
             status_code=500,
             detail="An error occurred while processing your question. Please try again.",
@@ -107,20 +130,15 @@ def ask_question(request: Request, body: QuestionRequest) -> AnswerResponse:
 
 
 @router.post("/ask/stream")
-@limiter.limit("20/minute")
-def ask_question_stream(request: Request, body: QuestionRequest):
+def ask_question_stream(body: QuestionRequest):
     """Stream the response token-by-token using Server-Sent Events.
 
     Args:
-        request: The FastAPI request object (used for rate limiting).
         body: The question request containing the user's question.
 
     Returns:
         StreamingResponse with SSE-formatted chunks.
     """
-    import json
-
-    from fastapi.responses import StreamingResponse
 
     def generate():
         try:
@@ -133,20 +151,30 @@ def ask_question_stream(request: Request, body: QuestionRequest):
                 yield f"data: {json.dumps({'type': 'done', 'sources': []})}\n\n"
                 return
 
-            # Stream the response chunks
-            full_response = ""
-            for chunk in agent.ask_stream(normalized_question):
-                full_response += chunk
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-
-            # Send done signal with sources (empty for now, could be enhanced)
-            yield f"data: {json.dumps({'type': 'done', 'sources': []})}\n\n"
+            # Convert API messages to Domain messages
+            history = _to_history(body.messages)
+
+            # Stream the response chunks; the generator returns the final AgentResponse
+            stream = agent.ask_stream(normalized_question, messages=history)
+            dumps = json.dumps
+            while True:
+                try:
+                    chunk = next(stream)
+                except StopIteration as stop:
+                    response = stop.value
+                    break
+                yield _SSE_CHUNK_PREFIX + dumps(chunk) + _SSE_FRAME_END
+
+            # Send done signal with the sources retrieved for this answer
+            sources = _source_payloads(response.sources_used) if response else []
+            done = {"type": "done", "sources": sources}
+            yield f"data: {json.dumps(done)}\n\n"
 
         except ValueError as e:
-            logger.warning(f"Invalid streaming request: {e}")
+            logger.warning("Invalid streaming request: %s", e)
             yield f"data: {json.dumps({'type': 'error', 'message': 'Invalid request. Please check your input and try again.'})}\n\n"
-        except Exception as e:
-            logger.exception(f"Error in streaming response: {e}")
+        except Exception:
+            logger.exception("Error in streaming response")
             yield f"data: {json.dumps({'type': 'error', 'message': 'An error occurred. Please try again.'})}\n\n"
 
     return StreamingResponse(
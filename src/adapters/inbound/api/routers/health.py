@@ -1,12 +1,16 @@
 """Health check endpoints."""
 
 from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
 
-from ..deps import get_vector_store
+from ..deps import get_collection_stats_cached, get_vector_store
 from ..models import HealthResponse
 
 router: APIRouter = APIRouter(prefix="/api/v1", tags=["health"])
 
+# The liveness payload never changes: build (and validate) it once
+_HEALTHY = HealthResponse(status="healthy", version="1.0.0", vector_store="not_checked")
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
@@ -15,11 +19,7 @@ async def health_check() -> HealthResponse:
     Returns:
         HealthResponse with current status and version.
     """
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        vector_store="not_checked",
-    )
+    return _HEALTHY
 
 
 @router.get("/ready", response_model=HealthResponse)
@@ -33,14 +33,15 @@ async def readiness_check() -> HealthResponse:
     """
     try:
         vector_store = get_vector_store()
-        # Aggregate stats from all collections
-        regs = vector_store.get_collection_stats(vector_store.REGULATIONS_COLLECTION).get(
-            "count", 0
-        )
-        stewards = vector_store.get_collection_stats(vector_store.STEWARDS_COLLECTION).get(
-            "count", 0
-        )
-        race = vector_store.get_collection_stats(vector_store.RACE_DATA_COLLECTION).get("count", 0)
+        # Aggregate stats from all collections in one batched (briefly cached) call,
+        # run in the threadpool so the blocking Qdrant requests don't stall the loop
+        names = [
+            vector_store.REGULATIONS_COLLECTION,
+            vector_store.STEWARDS_COLLECTION,
+            vector_store.RACE_DATA_COLLECTION,
+        ]
+        stats = await run_in_threadpool(get_collection_stats_cached, vector_store, names)
+        regs, stewards, race = (stats[name].get("count", 0) for name in names)
 
         total = regs + stewards + race
         vs_status = f"connected ({total} docs: {regs} regs, {stewards} decisions, {race} race)"
@@ -49,7 +50,8 @@ async def readiness_check() -> HealthResponse:
         vs_status = f"error: {str(e)}"
         status = "degraded"
 
-    return HealthResponse(
+    # Fields are plain strings built above: construct without re-validating
+    return HealthResponse.model_construct(
         status=status,
         version="1.0.0",
         vector_store=vs_status,
@@ -1,18 +1,36 @@
 """Setup endpoints for data indexing and management."""
 
+import asyncio
+import functools
+import itertools
 import logging
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
-from .....core.domain.utils import chunk_text, normalize_text
-from ..deps import get_vector_store
+from .....core.domain.race_data import INDEXED_PENALTY_CATEGORIES, build_driver_map
+from .....core.domain.utils import chunk_text, normalize_label, normalize_text, short_hash
+from ..deps import get_collection_stats_cached, get_vector_store, invalidate_collection_stats
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["setup"])
 
+# FIA downloads and FastF1 session loads are network/disk bound, so setup
+# overlaps them on a small thread pool
+SETUP_MAX_WORKERS = 8
+
+# Documents are sent to the vector store in batches of about this size as they
+# are produced, rather than buffering a whole season before the first write
+INDEX_BATCH_SIZE = 256
+
 
 class SetupRequest(BaseModel):
     """Request model for setup endpoint."""
@@ -36,6 +54,17 @@ class SetupStatusResponse(BaseModel):
     status: str
     is_populated: bool
     collections: dict[str, int]
+    setup_running: bool = False
+    last_setup_counts: dict[str, int] | None = None
+    last_setup_error: str | None = None
+
+
+# State of the background job started by POST /setup (one job per process)
+_setup_job: dict[str, Any] = {"running": False, "last_counts": None, "error": None}
+
+# Serializes setup jobs so overlapping runs never scrape FIA or write twice. Taken
+# by the request handler (see _claim_setup) and released when its job ends
+_setup_lock = asyncio.Lock()
 
 
 @router.get("/setup/status", response_model=SetupStatusResponse)
@@ -50,22 +79,114 @@ async def get_setup_status() -> SetupStatusResponse:
         collections = {}
         total = 0
 
-        for collection in ["regulations", "stewards_decisions", "race_data"]:
-            stats = vector_store.get_collection_stats(collection)
+        # Blocking (briefly cached) Qdrant requests: keep them off the event loop
+        batch_stats = await run_in_threadpool(
+            get_collection_stats_cached,
+            vector_store,
+            ["regulations", "stewards_decisions", "race_data"],
+        )
+        for collection, stats in batch_stats.items():
             count = stats.get("count", 0)
             collections[collection] = count
             total += count
 
-        return SetupStatusResponse(
+        return SetupStatusResponse.model_construct(
             status="ok",
             is_populated=total > 0,
             collections=collections,
+            setup_running=_setup_job["running"],
+            last_setup_counts=_setup_job["last_counts"],
+            last_setup_error=_setup_job["error"],
         )
     except Exception as e:
-        logger.exception(f"Error checking setup status: {e}")
+        logger.exception("Error checking setup status")
         raise HTTPException(status_code=500, detail=f"Error checking status: {e}")
 
 
+def _fetch_fia_chunks(scraper, doc, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """Download one FIA document and return its normalized text chunks.
+
+    Runs on a worker thread. The document's full text is dropped once
+    chunked, so only the chunks stay in memory.
+    """
+    scraper.download_document(doc)
+    scraper.extract_text(doc)
+    if not doc.text_content:
+        return []
+    chunks = chunk_text(
+        normalize_text(doc.text_content), chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+    doc.text_content = None
+    return chunks
+
+
+def _iter_fia_chunks(scraper, docs: list, chunk_size: int, chunk_overlap: int):
+    """Fetch and chunk FIA documents on a bounded thread pool, yielding each as it finishes.
+
+    The blocking counterpart of ``_iter_threaded`` for the background setup.
+    At most two documents per worker are in flight, so a slow consumer
+    (indexing) doesn't let finished chunks pile up for the whole phase.
+    Yields ``(doc, chunks, error)`` in completion order, where ``error`` is
+    the exception fetching the document raised (or None).
+    """
+    if not docs:
+        return
+
+    max_workers = min(SETUP_MAX_WORKERS, len(docs))
+    pending_docs = iter(docs)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(doc) -> None:
+            future = executor.submit(_fetch_fia_chunks, scraper, doc, chunk_size, chunk_overlap)
+            in_flight[future] = doc
+
+        for doc in itertools.islice(pending_docs, 2 * max_workers):
+            submit(doc)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                doc = in_flight.pop(future)
+                if (next_doc := next(pending_docs, None)) is not None:
+                    submit(next_doc)
+                error = future.exception()
+                yield doc, (None if error else future.result()), error
+
+
+async def _iter_threaded(fn, items: list):
+    """Run ``fn`` over ``items`` on a bounded thread pool, yielding each as it finishes.
+
+    Used by the streaming setup so progress can be reported per item without
+    blocking the event loop. Yields ``(item, result, error)`` in completion
+    order, where ``error`` is the exception ``fn(item)`` raised (or None).
+    """
+    if not items:
+        return
+
+    def call(item):
+        try:
+            return item, fn(item), None
+        except Exception as e:
+            return item, None, e
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=min(SETUP_MAX_WORKERS, len(items)))
+    try:
+        futures = [loop.run_in_executor(executor, call, item) for item in items]
+        for future in asyncio.as_completed(futures):
+            yield await future
+    finally:
+        # Don't block the event loop if the client disconnects mid-run
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _index_batch(vector_store, batch: list, collection_name: str) -> int:
+    """Index a batch of documents (if any) and return how many were stored."""
+    if not batch:
+        return 0
+    return vector_store.add_documents(batch, collection_name=collection_name)
+
+
 def _run_setup_task(reset: bool, limit: int, season: int) -> dict:
     """Background task to index real F1 data.
 
@@ -96,85 +217,98 @@ def _run_setup_task(reset: bool, limit: int, season: int) -> dict:
 
     counts = {"regulations": 0, "stewards_decisions": 0, "race_data": 0}
 
-    # --- 1. Index FIA Regulations ---
-    logger.info(f"Scraping FIA regulations for {season}...")
-    try:
-        scraper = FIAScraper(data_dir)
-        regulations = scraper.scrape_regulations(season)
-        # Apply limit: 0 means all, otherwise limit*2 regulations
-        regs_to_process = regulations if limit == 0 else regulations[: limit * 2]
-
-        reg_docs = []
-        for reg in regs_to_process:
-            scraper.download_document(reg)
-            scraper.extract_text(reg)
-            if reg.text_content:
-                # Normalize and chunk for better search
-                clean_text = normalize_text(reg.text_content)
-                chunks = chunk_text(clean_text, chunk_size=1500, chunk_overlap=200)
-                for i, chunk in enumerate(chunks):
-                    reg_docs.append(
-                        Document(
-                            doc_id=f"reg-{hash(reg.url) % 10000}-{i}",
-                            content=chunk,
-                            metadata={
-                                "source": normalize_text(reg.title),
-                                "type": "regulation",
-                                "url": reg.url,
-                                "season": season,
-                                "chunk_index": i,
-                                "total_chunks": len(chunks),
-                            },
-                        )
-                    )
-
-        if reg_docs:
-            vector_store.add_documents(reg_docs, collection_name="regulations")
-            counts["regulations"] = len(reg_docs)
-            logger.info(f"Indexed {len(reg_docs)} regulation chunks")
-    except Exception as e:
-        logger.warning(f"Failed to scrape regulations: {e}")
+    # One scraper, and so one keep-alive HTTP session, for both FIA phases
+    scraper = FIAScraper(data_dir)
 
-    # --- 2. Index Stewards Decisions ---
-    logger.info(f"Scraping stewards decisions for {season}...")
     try:
-        decisions = scraper.scrape_stewards_decisions(season)
-        # Apply limit: 0 means all, otherwise limit*5 decisions
-        decs_to_process = decisions if limit == 0 else decisions[: limit * 5]
-
-        dec_docs = []
-        for dec in decs_to_process:
-            scraper.download_document(dec)
-            scraper.extract_text(dec)
-            if dec.text_content:
-                # Normalize and chunk stewards decisions
-                clean_text = normalize_text(dec.text_content)
-                chunks = chunk_text(clean_text, chunk_size=1500, chunk_overlap=200)
-                for i, chunk in enumerate(chunks):
-                    dec_docs.append(
-                        Document(
-                            doc_id=f"dec-{hash(dec.url) % 10000}-{i}",
-                            content=chunk,
-                            metadata={
-                                "source": normalize_text(dec.title),
-                                "type": "stewards_decision",
-                                "event": normalize_text(dec.event_name or ""),
-                                "url": dec.url,
-                                "season": season,
-                                "chunk_index": i,
-                            },
+        # --- 1. Index FIA Regulations ---
+        logger.info("Scraping FIA regulations for %s...", season)
+        try:
+            regulations = scraper.scrape_regulations(season)
+            # Apply limit: 0 means all, otherwise limit*2 regulations
+            regs_to_process = regulations if limit == 0 else regulations[: limit * 2]
+
+            reg_docs = []
+            for reg, chunks, error in _iter_fia_chunks(scraper, regs_to_process, 1500, 200):
+                if error is not None:
+                    logger.warning("Failed to process %s: %s", reg.title, error)
+                    continue
+                if chunks:
+                    n_chunks = len(chunks)
+                    # Per-document values, computed once rather than per chunk
+                    doc_key = short_hash(reg.url)
+                    base_meta = {
+                        "source": normalize_label(reg.title),
+                        "type": "regulation",
+                        "url": reg.url,
+                        "season": season,
+                        "total_chunks": n_chunks,
+                    }
+                    for i, chunk in enumerate(chunks):
+                        reg_docs.append(
+                            Document(
+                                doc_id=f"reg-{doc_key}-{i}",
+                                content=chunk,
+                                metadata={**base_meta, "chunk_index": i},
+                            )
                         )
-                    )
+                    if len(reg_docs) >= INDEX_BATCH_SIZE:
+                        counts["regulations"] += _index_batch(vector_store, reg_docs, "regulations")
+                        reg_docs = []
+
+            counts["regulations"] += _index_batch(vector_store, reg_docs, "regulations")
+            if counts["regulations"]:
+                logger.info("Indexed %d regulation chunks", counts["regulations"])
+        except Exception as e:
+            logger.warning("Failed to scrape regulations: %s", e)
+
+        # --- 2. Index Stewards Decisions ---
+        logger.info("Scraping stewards decisions for %s...", season)
+        try:
+            decisions = scraper.scrape_stewards_decisions(season)
+            # Apply limit: 0 means all, otherwise limit*5 decisions
+            decs_to_process = decisions if limit == 0 else decisions[: limit * 5]
+
+            dec_docs = []
+            for dec, chunks, error in _iter_fia_chunks(scraper, decs_to_process, 1500, 200):
+                if error is not None:
+                    logger.warning("Failed to process %s: %s", dec.title, error)
+                    continue
+                if chunks:
+                    doc_key = short_hash(dec.url)
+                    base_meta = {
+                        "source": normalize_label(dec.title),
+                        "type": "stewards_decision",
+                        "event": normalize_label(dec.event_name or ""),
+                        "url": dec.url,
+                        "season": season,
+                    }
+                    for i, chunk in enumerate(chunks):
+                        dec_docs.append(
+                            Document(
+                                doc_id=f"dec-{doc_key}-{i}",
+                                content=chunk,
+                                metadata={**base_meta, "chunk_index": i},
+                            )
+                        )
+                    if len(dec_docs) >= INDEX_BATCH_SIZE:
+                        counts["stewards_decisions"] += _index_batch(
+                            vector_store, dec_docs, "stewards_decisions"
+                        )
+                        dec_docs = []
 
-        if dec_docs:
-            vector_store.add_documents(dec_docs, collection_name="stewards_decisions")
-            counts["stewards_decisions"] = len(dec_docs)
-            logger.info(f"Indexed {len(dec_docs)} stewards decision chunks")
-    except Exception as e:
-        logger.warning(f"Failed to scrape stewards decisions: {e}")
+            counts["stewards_decisions"] += _index_batch(
+                vector_store, dec_docs, "stewards_decisions"
+            )
+            if counts["stewards_decisions"]:
+                logger.info("Indexed %d stewards decision chunks", counts["stewards_decisions"])
+        except Exception as e:
+            logger.warning("Failed to scrape stewards decisions: %s", e)
+    finally:
+        scraper.close()
 
     # --- 3. Index Race Data (penalties from FastF1) ---
-    logger.info(f"Loading race control data for {season}...")
+    logger.info("Loading race control data for %s...", season)
     try:
         loader = FastF1Loader(cache_dir)
         events = loader.get_season_events(season)
@@ -184,19 +318,30 @@ def _run_setup_task(reset: bool, limit: int, season: int) -> dict:
         # Load Jolpica for driver context
         jolpica = JolpicaClient()
         drivers = jolpica.get_drivers(season)
-        driver_map = {d.code: d.name for d in drivers}
-        driver_map.update({str(d.number): d.name for d in drivers if d.number})
+        driver_map = build_driver_map(drivers)
+
+        def load_event(event: str):
+            try:
+                return loader.get_race_control_messages(season, event, "Race")
+            except Exception as e:
+                logger.warning("Failed to load race data for %s: %s", event, e)
+                return []
+
+        # Load all events' race control messages in parallel (results keep event order)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(SETUP_MAX_WORKERS, len(events_to_process)))
+        ) as executor:
+            event_penalties = list(executor.map(load_event, events_to_process))
 
         race_docs = []
-        for event in events_to_process:
+        for event, penalties in zip(events_to_process, event_penalties):
             try:
-                penalties = loader.get_race_control_messages(season, event, "Race")
                 for penalty in penalties:
-                    if penalty.category in ["Penalty", "Investigation", "Track Limits"]:
+                    if penalty.category in INDEXED_PENALTY_CATEGORIES:
                         # Resolve driver name using Jolpica data
                         driver_name = penalty.driver
-                        if driver_name and driver_name in driver_map:
-                            driver_name = driver_map[driver_name]
+                        if driver_name:
+                            driver_name = driver_map.get(driver_name, driver_name)
 
                         content = normalize_text(
                             f"Race: {penalty.race_name} ({penalty.session})\n"
@@ -206,69 +351,120 @@ def _run_setup_task(reset: bool, limit: int, season: int) -> dict:
                         )
                         race_docs.append(
                             Document(
-                                doc_id=f"race-{hash(f'{event}-{penalty.message}') % 10000}",
+                                doc_id=f"race-{short_hash(f'{event}-{penalty.session}-{penalty.message}')}",
                                 content=content,
                                 metadata={
-                                    "source": normalize_text(
+                                    "source": normalize_label(
                                         f"{penalty.race_name} {penalty.session}"
                                     ),
                                     "type": "race_control",
-                                    "driver": normalize_text(driver_name or ""),
-                                    "race": normalize_text(penalty.race_name),
+                                    "driver": normalize_label(driver_name or ""),
+                                    "race": normalize_label(penalty.race_name),
                                     "season": season,
                                 },
                             )
                         )
             except Exception as e:
-                logger.warning(f"Failed to load race data for {event}: {e}")
+                logger.warning("Failed to load race data for %s: %s", event, e)
                 continue
 
-        if race_docs:
-            vector_store.add_documents(race_docs, collection_name="race_data")
-            counts["race_data"] = len(race_docs)
-            logger.info(f"Indexed {len(race_docs)} race control messages")
+            if len(race_docs) >= INDEX_BATCH_SIZE:
+                counts["race_data"] += _index_batch(vector_store, race_docs, "race_data")
+                race_docs = []
+
+        counts["race_data"] += _index_batch(vector_store, race_docs, "race_data")
+        if counts["race_data"]:
+            logger.info("Indexed %d race control messages", counts["race_data"])
     except Exception as e:
-        logger.warning(f"Failed to load race data: {e}")
+        logger.warning("Failed to load race data: %s", e)
 
+    invalidate_collection_stats()
     return counts
 
 
-@router.post("/setup", response_model=SetupResponse)
-async def run_setup(request: SetupRequest) -> SetupResponse:
-    """Index real F1 data into the knowledge base.
+async def _claim_setup() -> Callable[[], None]:
+    """Take ``_setup_lock`` for a new setup job.
+
+    The lock is taken in the request handler, before the response is sent, so
+    a second request arriving before the job starts is still rejected.
+
+    Returns:
+        A release callable; calling it more than once is safe.
+
+    Raises:
+        HTTPException: 409 if a setup job is already running.
+    """
+    if _setup_lock.locked():
+        raise HTTPException(status_code=409, detail="Setup is already running")
+    # Uncontended, so this returns without yielding to another request
+    await _setup_lock.acquire()
+
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            _setup_lock.release()
+
+    return release
+
+
+async def _run_setup_job(release: Callable[[], None], reset: bool, limit: int, season: int) -> None:
+    """Run ``_run_setup_task`` as a background job, recording its outcome in ``_setup_job``.
+
+    The task runs on ``asyncio.to_thread`` rather than the request threadpool,
+    so a long indexing run does not take worker threads from ``/ask``.
+    ``release`` frees the setup slot claimed by the handler once the job ends.
+    """
+    _setup_job.update(running=True, error=None)
+    try:
+        _setup_job["last_counts"] = await asyncio.to_thread(_run_setup_task, reset, limit, season)
+    except Exception as e:
+        logger.exception("Error during setup")
+        _setup_job["error"] = str(e)
+    finally:
+        _setup_job["running"] = False
+        release()
+
+
+@router.post("/setup", response_model=SetupResponse, status_code=202)
+async def run_setup(request: SetupRequest, background_tasks: BackgroundTasks) -> SetupResponse:
+    """Start indexing real F1 data into the knowledge base.
 
     This endpoint scrapes FIA regulations and stewards decisions,
-    and loads race control messages from FastF1.
+    and loads race control messages from FastF1. Indexing takes minutes, so it
+    runs in the background after the 202 response; poll ``/setup/status`` for
+    progress and the resulting counts.
 
     Use limit=0 (default) to index ALL available data.
     Use reset=true to clear existing data before indexing.
 
     Args:
         request: Setup configuration options.
+        background_tasks: FastAPI background task queue for this request.
 
     Returns:
-        SetupResponse with status and collection counts.
-    """
-    try:
-        logger.info(
-            f"Starting setup: season={request.season}, limit={request.limit}, reset={request.reset}"
-        )
+        SetupResponse confirming the job was accepted.
 
-        # Run synchronously for now (could make async with BackgroundTasks)
-        counts = _run_setup_task(request.reset, request.limit, request.season)
-
-        total = sum(counts.values())
+    Raises:
+        HTTPException: 409 if a setup job is already running.
+    """
+    release = await _claim_setup()
 
-        return SetupResponse(
-            status="success",
-            message=f"Indexed {total} documents: {counts['regulations']} regulations, "
-            f"{counts['stewards_decisions']} decisions, {counts['race_data']} race events",
-            collections=counts,
-        )
+    logger.info(
+        "Starting setup: season=%s, limit=%s, reset=%s",
+        request.season,
+        request.limit,
+        request.reset,
+    )
+    background_tasks.add_task(_run_setup_job, release, request.reset, request.limit, request.season)
 
-    except Exception as e:
-        logger.exception(f"Error during setup: {e}")
-        raise HTTPException(status_code=500, detail=f"Setup failed: {e}")
+    return SetupResponse(
+        status="accepted",
+        message=f"Setup started for {request.season}; poll /api/v1/setup/status for progress",
+        collections=None,
+    )
 
 
 # ==============================================================================
@@ -298,32 +494,36 @@ async def _generate_setup_events(reset: bool, limit: int, season: int):
         season: F1 season year.
 
     Yields:
-        SSE formatted event strings.
+        SSE formatted events, encoded as bytes.
     """
-    import asyncio
-    import hashlib
-    import json
-
     from .....adapters.outbound.data_sources.fia_adapter import FIAAdapter as FIAScraper
     from .....config.settings import settings
     from .....core.domain import Document
-    from .....core.domain.utils import chunk_text, normalize_text
 
-    def make_event(event_type: str, **kwargs) -> str:
-        """Format an SSE event."""
-        data = {"event_type": event_type, **kwargs}
-        return f"data: {json.dumps(data)}\n\n"
+    def make_event(event_type: str, **kwargs) -> bytes:
+        """Format an SSE event as bytes, ready for the response stream."""
+        # One bytes formatting op frames the payload in a single allocation
+        return b"data: %b\n\n" % orjson.dumps({"event_type": event_type, **kwargs})
+
+    def index_progress(data_type: str) -> bytes:
+        """Progress event after a batch flush, carrying the phase's running count.
+
+        The phase's chunk total isn't known while downloads are still in
+        flight, so ``total`` is the count indexed so far.
+        """
+        indexed = counts[data_type]
+        return make_event(
+            "progress", data_type=data_type, phase="index", current=indexed, total=indexed
+        )
 
     yield make_event("start", message=f"Starting setup for {season} season")
-    await asyncio.sleep(0.1)
 
     vector_store = get_vector_store()
     config_hash = settings.get_config_hash()
 
     if reset:
         yield make_event("phase", phase="reset", message="Resetting collections...")
-        await asyncio.sleep(0.1)
-        vector_store.reset()
+        await asyncio.to_thread(vector_store.reset)
 
     data_dir = Path(settings.data_dir)
     cache_dir = data_dir / "fastf1_cache"
@@ -332,211 +532,241 @@ async def _generate_setup_events(reset: bool, limit: int, season: int):
 
     counts = {"regulations": 0, "stewards_decisions": 0, "race_data": 0}
 
-    # --- 1. Regulations ---
-    yield make_event(
-        "phase", data_type="regulations", phase="discovery", message="Scanning regulations..."
+    # Closed in the finally below even if the client disconnects mid-stream
+    scraper = FIAScraper(data_dir)
+    fetch_chunks = functools.partial(
+        _fetch_fia_chunks,
+        scraper,
+        chunk_size=settings.chunk_size,
+        chunk_overlap=settings.chunk_overlap,
     )
-    await asyncio.sleep(0.1)
 
     try:
-        scraper = FIAScraper(data_dir)
-        regulations = scraper.scrape_regulations(season)
-        regs_to_process = regulations if limit == 0 else regulations[: limit * 2]
-
+        # --- 1. Regulations ---
         yield make_event(
-            "phase",
-            data_type="regulations",
-            phase="discovery",
-            total=len(regs_to_process),
-            message=f"Found {len(regs_to_process)} regulations",
+            "phase", data_type="regulations", phase="discovery", message="Scanning regulations..."
         )
-        await asyncio.sleep(0.1)
 
-        yield make_event(
-            "phase", data_type="regulations", phase="download", total=len(regs_to_process)
-        )
+        try:
+            regulations = await asyncio.to_thread(scraper.scrape_regulations, season)
+            regs_to_process = regulations if limit == 0 else regulations[: limit * 2]
 
-        reg_docs = []
-        for i, reg in enumerate(regs_to_process):
-            if vector_store.document_exists("regulations", reg.url, config_hash):
+            yield make_event(
+                "phase",
+                data_type="regulations",
+                phase="discovery",
+                total=len(regs_to_process),
+                message=f"Found {len(regs_to_process)} regulations",
+            )
+
+            yield make_event(
+                "phase", data_type="regulations", phase="download", total=len(regs_to_process)
+            )
+
+            # One existence query for the whole phase instead of one per document
+            existing = await asyncio.to_thread(
+                vector_store.document_exists_many,
+                "regulations",
+                [reg.url for reg in regs_to_process],
+                config_hash,
+            )
+
+            total = len(regs_to_process)
+            done = 0
+            to_fetch = []
+            for reg in regs_to_process:
+                if reg.url in existing:
+                    done += 1
+                    yield make_event(
+                        "progress",
+                        data_type="regulations",
+                        phase="download",
+                        current=done,
+                        total=total,
+                        item=f"Skipped: {reg.title[:40]}",
+                    )
+                else:
+                    to_fetch.append(reg)
+
+            reg_docs = []
+            async for reg, chunks, error in _iter_threaded(fetch_chunks, to_fetch):
+                done += 1
                 yield make_event(
                     "progress",
                     data_type="regulations",
                     phase="download",
-                    current=i + 1,
-                    total=len(regs_to_process),
-                    item=f"Skipped: {reg.title[:40]}",
+                    current=done,
+                    total=total,
+                    item=reg.title[:50],
                 )
-            else:
+                if error is not None:
+                    logger.warning("Failed to process %s: %s", reg.title, error)
+                    continue
+                if chunks:
+                    doc_hash = short_hash(reg.url)
+                    base_meta = {
+                        "source": normalize_label(reg.title),
+                        "type": "regulation",
+                        "url": reg.url,
+                        "season": season,
+                        "total_chunks": len(chunks),
+                        "config_hash": config_hash,
+                    }
+                    for j, chunk in enumerate(chunks):
+                        reg_docs.append(
+                            Document(
+                                doc_id=f"reg-{doc_hash}-{j}",
+                                content=chunk,
+                                metadata={**base_meta, "chunk_index": j},
+                            )
+                        )
+                    if len(reg_docs) >= INDEX_BATCH_SIZE:
+                        counts["regulations"] += await asyncio.to_thread(
+                            _index_batch, vector_store, reg_docs, "regulations"
+                        )
+                        reg_docs = []
+                        yield index_progress("regulations")
+
+            counts["regulations"] += await asyncio.to_thread(
+                _index_batch, vector_store, reg_docs, "regulations"
+            )
+            if counts["regulations"]:
                 yield make_event(
-                    "progress",
+                    "phase",
                     data_type="regulations",
-                    phase="download",
-                    current=i + 1,
-                    total=len(regs_to_process),
-                    item=reg.title[:50],
+                    phase="index",
+                    current=counts["regulations"],
+                    total=counts["regulations"],
+                    message=f"Indexed {counts['regulations']} documents",
+                )
+                yield make_event(
+                    "phase",
+                    data_type="regulations",
+                    phase="complete",
+                    message=f"+{counts['regulations']} documents",
                 )
 
-                try:
-                    scraper.download_document(reg)
-                    scraper.extract_text(reg)
-                    if reg.text_content:
-                        clean_text = normalize_text(reg.text_content)
-                        chunks = chunk_text(
-                            clean_text,
-                            chunk_size=settings.chunk_size,
-                            chunk_overlap=settings.chunk_overlap,
-                        )
-                        doc_hash = hashlib.md5(reg.url.encode()).hexdigest()[:10]
-                        for j, chunk in enumerate(chunks):
-                            reg_docs.append(
-                                Document(
-                                    doc_id=f"reg-{doc_hash}-{j}",
-                                    content=chunk,
-                                    metadata={
-                                        "source": normalize_text(reg.title),
-                                        "type": "regulation",
-                                        "url": reg.url,
-                                        "season": season,
-                                        "chunk_index": j,
-                                        "total_chunks": len(chunks),
-                                        "config_hash": config_hash,
-                                    },
-                                )
-                            )
-                except Exception as e:
-                    logger.warning(f"Failed to process {reg.title}: {e}")
+        except Exception as e:
+            yield make_event("error", data_type="regulations", message=str(e))
+
+        # --- 2. Stewards Decisions ---
+        yield make_event(
+            "phase",
+            data_type="stewards_decisions",
+            phase="discovery",
+            message="Scanning stewards decisions...",
+        )
 
-            # Yield control periodically
-            if i % 3 == 0:
-                await asyncio.sleep(0.05)
+        try:
+            decisions = await asyncio.to_thread(scraper.scrape_stewards_decisions, season)
+            decs_to_process = decisions if limit == 0 else decisions[: limit * 5]
 
-        if reg_docs:
             yield make_event(
                 "phase",
-                data_type="regulations",
-                phase="index",
-                total=len(reg_docs),
-                message="Indexing...",
+                data_type="stewards_decisions",
+                phase="discovery",
+                total=len(decs_to_process),
+                message=f"Found {len(decs_to_process)} decisions",
             )
-            await asyncio.sleep(0.1)
-            vector_store.add_documents(reg_docs, collection_name="regulations")
-            counts["regulations"] = len(reg_docs)
+
             yield make_event(
                 "phase",
-                data_type="regulations",
-                phase="complete",
-                message=f"+{len(reg_docs)} documents",
+                data_type="stewards_decisions",
+                phase="download",
+                total=len(decs_to_process),
             )
 
-    except Exception as e:
-        yield make_event("error", data_type="regulations", message=str(e))
-
-    # --- 2. Stewards Decisions ---
-    yield make_event(
-        "phase",
-        data_type="stewards_decisions",
-        phase="discovery",
-        message="Scanning stewards decisions...",
-    )
-    await asyncio.sleep(0.1)
-
-    try:
-        decisions = scraper.scrape_stewards_decisions(season)
-        decs_to_process = decisions if limit == 0 else decisions[: limit * 5]
-
-        yield make_event(
-            "phase",
-            data_type="stewards_decisions",
-            phase="discovery",
-            total=len(decs_to_process),
-            message=f"Found {len(decs_to_process)} decisions",
-        )
-        await asyncio.sleep(0.1)
+            existing = await asyncio.to_thread(
+                vector_store.document_exists_many,
+                "stewards_decisions",
+                [dec.url for dec in decs_to_process],
+                config_hash,
+            )
 
-        yield make_event(
-            "phase", data_type="stewards_decisions", phase="download", total=len(decs_to_process)
-        )
+            total = len(decs_to_process)
+            done = 0
+            to_fetch = []
+            for dec in decs_to_process:
+                if dec.url in existing:
+                    done += 1
+                    yield make_event(
+                        "progress",
+                        data_type="stewards_decisions",
+                        phase="download",
+                        current=done,
+                        total=total,
+                        item=f"Skipped: {dec.title[:40]}",
+                    )
+                else:
+                    to_fetch.append(dec)
 
-        dec_docs = []
-        for i, dec in enumerate(decs_to_process):
-            if vector_store.document_exists("stewards_decisions", dec.url, config_hash):
+            dec_docs = []
+            async for dec, chunks, error in _iter_threaded(fetch_chunks, to_fetch):
+                done += 1
                 yield make_event(
                     "progress",
                     data_type="stewards_decisions",
                     phase="download",
-                    current=i + 1,
-                    total=len(decs_to_process),
-                    item=f"Skipped: {dec.title[:40]}",
-                )
-            else:
-                yield make_event(
-                    "progress",
-                    data_type="stewards_decisions",
-                    phase="download",
-                    current=i + 1,
-                    total=len(decs_to_process),
+                    current=done,
+                    total=total,
                     item=dec.title[:50],
                 )
-                try:
-                    scraper.download_document(dec)
-                    scraper.extract_text(dec)
-                    if dec.text_content:
-                        clean_text = normalize_text(dec.text_content)
-                        chunks = chunk_text(
-                            clean_text,
-                            chunk_size=settings.chunk_size,
-                            chunk_overlap=settings.chunk_overlap,
-                        )
-                        doc_hash = hashlib.md5(dec.url.encode()).hexdigest()[:10]
-                        for j, chunk in enumerate(chunks):
-                            dec_docs.append(
-                                Document(
-                                    doc_id=f"dec-{doc_hash}-{j}",
-                                    content=chunk,
-                                    metadata={
-                                        "source": normalize_text(dec.title),
-                                        "type": "stewards_decision",
-                                        "event": normalize_text(dec.event_name or ""),
-                                        "url": dec.url,
-                                        "season": season,
-                                        "chunk_index": j,
-                                        "config_hash": config_hash,
-                                    },
-                                )
+                if error is not None:
+                    logger.warning("Failed to process %s: %s", dec.title, error)
+                    continue
+                if chunks:
+                    doc_hash = short_hash(dec.url)
+                    base_meta = {
+                        "source": normalize_label(dec.title),
+                        "type": "stewards_decision",
+                        "event": normalize_label(dec.event_name or ""),
+                        "url": dec.url,
+                        "season": season,
+                        "config_hash": config_hash,
+                    }
+                    for j, chunk in enumerate(chunks):
+                        dec_docs.append(
+                            Document(
+                                doc_id=f"dec-{doc_hash}-{j}",
+                                content=chunk,
+                                metadata={**base_meta, "chunk_index": j},
                             )
-                except Exception as e:
-                    logger.warning(f"Failed to process {dec.title}: {e}")
-
-            if i % 5 == 0:
-                await asyncio.sleep(0.05)
+                        )
+                    if len(dec_docs) >= INDEX_BATCH_SIZE:
+                        counts["stewards_decisions"] += await asyncio.to_thread(
+                            _index_batch, vector_store, dec_docs, "stewards_decisions"
+                        )
+                        dec_docs = []
+                        yield index_progress("stewards_decisions")
 
-        if dec_docs:
-            yield make_event(
-                "phase",
-                data_type="stewards_decisions",
-                phase="index",
-                total=len(dec_docs),
-                message="Indexing...",
-            )
-            await asyncio.sleep(0.1)
-            vector_store.add_documents(dec_docs, collection_name="stewards_decisions")
-            counts["stewards_decisions"] = len(dec_docs)
-            yield make_event(
-                "phase",
-                data_type="stewards_decisions",
-                phase="complete",
-                message=f"+{len(dec_docs)} documents",
+            counts["stewards_decisions"] += await asyncio.to_thread(
+                _index_batch, vector_store, dec_docs, "stewards_decisions"
             )
+            if counts["stewards_decisions"]:
+                yield make_event(
+                    "phase",
+                    data_type="stewards_decisions",
+                    phase="index",
+                    current=counts["stewards_decisions"],
+                    total=counts["stewards_decisions"],
+                    message=f"Indexed {counts['stewards_decisions']} documents",
+                )
+                yield make_event(
+                    "phase",
+                    data_type="stewards_decisions",
+                    phase="complete",
+                    message=f"+{counts['stewards_decisions']} documents",
+                )
 
-    except Exception as e:
-        yield make_event("error", data_type="stewards_decisions", message=str(e))
+        except Exception as e:
+            yield make_event("error", data_type="stewards_decisions", message=str(e))
+    finally:
+        scraper.close()
 
     # --- 3. Race Data ---
     yield make_event(
         "phase", data_type="race_data", phase="discovery", message="Scanning race events..."
     )
-    await asyncio.sleep(0.1)
 
     try:
         from .....adapters.outbound.data_sources.fastf1_adapter import FastF1Adapter as FastF1Loader
@@ -545,7 +775,7 @@ async def _generate_setup_events(reset: bool, limit: int, season: int):
         )
 
         loader = FastF1Loader(cache_dir)
-        events = loader.get_season_events(season)
+        events = await asyncio.to_thread(loader.get_season_events, season)
         events_to_process = events if limit == 0 else events[:limit]
 
         yield make_event(
@@ -557,101 +787,139 @@ async def _generate_setup_events(reset: bool, limit: int, season: int):
         )
 
         jolpica = JolpicaClient()
-        drivers = jolpica.get_drivers(season)
-        driver_map = {d.code: d.name for d in drivers}
-        driver_map.update({str(d.number): d.name for d in drivers if d.number})
-        team_map = jolpica.get_driver_teams_map(season)
+        drivers = await asyncio.to_thread(jolpica.get_drivers, season)
+        driver_map = build_driver_map(drivers)
+        team_map = await asyncio.to_thread(jolpica.get_driver_teams_map, season)
 
         yield make_event(
             "phase", data_type="race_data", phase="download", total=len(events_to_process)
         )
 
+        def load_event(event: str):
+            return loader.get_race_control_messages(season, event, "Race")
+
         race_docs = []
-        for i, event in enumerate(events_to_process):
+        done = 0
+        async for event, penalties, error in _iter_threaded(load_event, events_to_process):
+            done += 1
             yield make_event(
                 "progress",
                 data_type="race_data",
                 phase="download",
-                current=i + 1,
+                current=done,
                 total=len(events_to_process),
                 item=event,
             )
+            if error is not None:
+                logger.warning("Failed to load race data for %s: %s", event, error)
+                continue
             try:
-                penalties = loader.get_race_control_messages(season, event, "Race")
+                relevant = []
                 for penalty in penalties:
-                    if penalty.category in ["Penalty", "Investigation", "Track Limits"]:
-                        driver_name = penalty.driver
-                        if driver_name and driver_name in driver_map:
-                            driver_name = driver_map[driver_name]
-                        team_name = penalty.team or "Unknown"
-                        if team_name == "Unknown" and driver_name in team_map:
-                            team_name = team_map[driver_name]
-
-                        msg_content = f"{event}-{penalty.session}-{penalty.message}"
-                        msg_hash = hashlib.md5(msg_content.encode()).hexdigest()[:10]
+                    if penalty.category in INDEXED_PENALTY_CATEGORIES:
+                        msg_hash = short_hash(f"{event}-{penalty.session}-{penalty.message}")
                         synthetic_url = f"fastf1://{season}/{event}/{penalty.session}/{msg_hash}"
+                        relevant.append((penalty, msg_hash, synthetic_url))
+
+                # One existence query per event instead of one per message
+                existing = await asyncio.to_thread(
+                    vector_store.document_exists_many,
+                    "race_data",
+                    [url for _, _, url in relevant],
+                    config_hash,
+                )
 
-                        if vector_store.document_exists("race_data", synthetic_url, config_hash):
-                            continue
-
-                        content = normalize_text(
-                            f"Race: {penalty.race_name} ({penalty.session})\n"
-                            f"Driver: {driver_name or 'Unknown'}\n"
-                            f"Team: {team_name}\n"
-                            f"Message: {penalty.message}\n"
-                            f"Category: {penalty.category}"
-                        )
-                        race_docs.append(
-                            Document(
-                                doc_id=f"race-{msg_hash}",
-                                content=content,
-                                metadata={
-                                    "source": normalize_text(
-                                        f"{penalty.race_name} {penalty.session}"
-                                    ),
-                                    "type": "race_control",
-                                    "driver": normalize_text(driver_name or ""),
-                                    "team": normalize_text(team_name),
-                                    "race": normalize_text(penalty.race_name),
-                                    "season": season,
-                                    "url": synthetic_url,
-                                    "config_hash": config_hash,
-                                },
-                            )
+                for penalty, msg_hash, synthetic_url in relevant:
+                    if synthetic_url in existing:
+                        continue
+
+                    driver_name = penalty.driver
+                    if driver_name:
+                        driver_name = driver_map.get(driver_name, driver_name)
+                    team_name = penalty.team or "Unknown"
+                    if team_name == "Unknown" and driver_name in team_map:
+                        team_name = team_map[driver_name]
+
+                    # Look each field up once and reuse it in the content and metadata
+                    race_name = penalty.race_name
+                    session = penalty.session
+                    content = normalize_text(
+                        f"Race: {race_name} ({session})\n"
+                        f"Driver: {driver_name or 'Unknown'}\n"
+                        f"Team: {team_name}\n"
+                        f"Message: {penalty.message}\n"
+                        f"Category: {penalty.category}"
+                    )
+                    race_docs.append(
+                        Document(
+                            doc_id=f"race-{msg_hash}",
+                            content=content,
+                            metadata={
+                                "source": normalize_label(f"{race_name} {session}"),
+                                "type": "race_control",
+                                "driver": normalize_label(driver_name or ""),
+                                "team": normalize_label(team_name),
+                                "race": normalize_label(race_name),
+                                "season": season,
+                                "url": synthetic_url,
+                                "config_hash": config_hash,
+                            },
                         )
+                    )
             except Exception as e:
-                logger.warning(f"Failed to load race data for {event}: {e}")
-
-            await asyncio.sleep(0.05)
+                logger.warning("Failed to load race data for %s: %s", event, e)
+            if len(race_docs) >= INDEX_BATCH_SIZE:
+                counts["race_data"] += await asyncio.to_thread(
+                    _index_batch, vector_store, race_docs, "race_data"
+                )
+                race_docs = []
+                yield index_progress("race_data")
 
-        if race_docs:
+        counts["race_data"] += await asyncio.to_thread(
+            _index_batch, vector_store, race_docs, "race_data"
+        )
+        if counts["race_data"]:
             yield make_event(
                 "phase",
                 data_type="race_data",
                 phase="index",
-                total=len(race_docs),
-                message="Indexing...",
+                current=counts["race_data"],
+                total=counts["race_data"],
+                message=f"Indexed {counts['race_data']} documents",
             )
-            await asyncio.sleep(0.1)
-            vector_store.add_documents(race_docs, collection_name="race_data")
-            counts["race_data"] = len(race_docs)
             yield make_event(
                 "phase",
                 data_type="race_data",
                 phase="complete",
-                message=f"+{len(race_docs)} documents",
+                message=f"+{counts['race_data']} documents",
             )
 
     except Exception as e:
         yield make_event("error", data_type="race_data", message=str(e))
 
     # Final summary
+    invalidate_collection_stats()
     total = sum(counts.values())
     yield make_event(
         "complete", totals=counts, message=f"Setup complete! Indexed {total} documents"
     )
 
 
+async def _stream_setup_job(release: Callable[[], None], reset: bool, limit: int, season: int):
+    """Stream ``_generate_setup_events``, then free the setup slot with ``release``.
+
+    Shares ``_setup_lock`` and ``_setup_job`` with the background job, so a
+    streamed run and a ``POST /setup`` run never index at the same time.
+    """
+    _setup_job.update(running=True, error=None)
+    try:
+        async for event in _generate_setup_events(reset, limit, season):
+            yield event
+    finally:
+        _setup_job["running"] = False
+        release()
+
+
 @router.post("/admin/setup/stream")
 async def run_setup_stream(request: SetupRequest):
     """Run setup with SSE streaming for real-time progress.
@@ -664,15 +932,21 @@ async def run_setup_stream(request: SetupRequest):
 
     Returns:
         StreamingResponse with SSE events.
+
+    Raises:
+        HTTPException: 409 if a setup job is already running.
     """
     from fastapi.responses import StreamingResponse
 
+    release = await _claim_setup()
     return StreamingResponse(
-        _generate_setup_events(request.reset, request.limit, request.season),
+        _stream_setup_job(release, request.reset, request.limit, request.season),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",
         },
+        # Runs after the body, so the slot is freed even if the stream never started
+        background=BackgroundTask(release),
     )
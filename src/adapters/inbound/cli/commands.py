@@ -1,6 +1,5 @@
 """CLI interface for the F1 Penalty Agent."""
 
-import hashlib
 import json
 import os
 from typing import Any
@@ -12,7 +11,8 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 
 from ....config.settings import settings
-from ....core.domain.utils import chunk_text, normalize_text
+from ....core.domain.race_data import INDEXED_PENALTY_CATEGORIES, build_driver_map
+from ....core.domain.utils import chunk_text, normalize_label, normalize_text, short_hash
 from ...common.exception_handler import format_exception_json
 
 app = typer.Typer(
@@ -212,8 +212,10 @@ def status() -> None:
         )
 
         total = 0
-        for collection in ["regulations", "stewards_decisions", "race_data"]:
-            stats = vector_store.get_collection_stats(collection)
+        batch_stats = vector_store.get_collection_stats_batch(
+            ["regulations", "stewards_decisions", "race_data"]
+        )
+        for collection, stats in batch_stats.items():
             count = stats["count"]
             total += count
             emoji = "✅" if count > 0 else "⚪"
@@ -248,6 +250,8 @@ def _ingest_regulations(
     from .progress import Phase
 
     config_hash = settings.get_config_hash()
+    chunk_size = settings.chunk_size
+    chunk_overlap = settings.chunk_overlap
 
     try:
         # DISCOVERY PHASE
@@ -283,12 +287,13 @@ def _ingest_regulations(
                     # Chunk long documents for better search
                     chunks = chunk_text(
                         clean_text,
-                        chunk_size=settings.chunk_size,
-                        chunk_overlap=settings.chunk_overlap,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
                     )
+                    n_chunks = len(chunks)
 
-                    # Use stable MD5 hash for ID
-                    doc_hash = hashlib.md5(reg.url.encode()).hexdigest()[:10]
+                    # Stable hash of the URL for the ID
+                    doc_hash = short_hash(reg.url)
 
                     for j, chunk in enumerate(chunks):
                         reg_docs.append(
@@ -296,17 +301,17 @@ def _ingest_regulations(
                                 doc_id=f"reg-{doc_hash}-{j}",
                                 content=chunk,
                                 metadata={
-                                    "source": normalize_text(reg.title),
+                                    "source": normalize_label(reg.title),
                                     "type": "regulation",
                                     "url": reg.url,
                                     "season": season,
                                     "chunk_index": j,
-                                    "total_chunks": len(chunks),
+                                    "total_chunks": n_chunks,
                                     "config_hash": config_hash,
                                 },
                             )
                         )
-                    chunks_count += len(chunks)
+                    chunks_count += n_chunks
                     progress.mark_new(reg.title)
             except Exception as e:
                 progress.mark_failed(reg.title, str(e))
@@ -347,6 +352,8 @@ def _ingest_stewards_decisions(
     from .progress import Phase
 
     config_hash = settings.get_config_hash()
+    chunk_size = settings.chunk_size
+    chunk_overlap = settings.chunk_overlap
 
     try:
         # DISCOVERY PHASE
@@ -381,12 +388,13 @@ def _ingest_stewards_decisions(
                     clean_text = normalize_text(dec.text_content)
                     chunks = chunk_text(
                         clean_text,
-                        chunk_size=settings.chunk_size,
-                        chunk_overlap=settings.chunk_overlap,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
                     )
+                    n_chunks = len(chunks)
 
-                    # Stable MD5 hash
-                    doc_hash = hashlib.md5(dec.url.encode()).hexdigest()[:10]
+                    # Stable hash of the URL for the ID
+                    doc_hash = short_hash(dec.url)
 
                     for j, chunk in enumerate(chunks):
                         dec_docs.append(
@@ -394,9 +402,9 @@ def _ingest_stewards_decisions(
                                 doc_id=f"dec-{doc_hash}-{j}",
                                 content=chunk,
                                 metadata={
-                                    "source": normalize_text(dec.title),
+                                    "source": normalize_label(dec.title),
                                     "type": "stewards_decision",
-                                    "event": normalize_text(dec.event_name or ""),
+                                    "event": normalize_label(dec.event_name or ""),
                                     "url": dec.url,
                                     "season": season,
                                     "chunk_index": j,
@@ -404,7 +412,7 @@ def _ingest_stewards_decisions(
                                 },
                             )
                         )
-                    chunks_count += len(chunks)
+                    chunks_count += n_chunks
                     progress.mark_new(dec.title)
             except Exception as e:
                 progress.mark_failed(dec.title, str(e))
@@ -466,8 +474,7 @@ def _ingest_race_data(
 
         jolpica = JolpicaClient()
         drivers = jolpica.get_drivers(season)
-        driver_map = {d.code: d.name for d in drivers}
-        driver_map.update({str(d.number): d.name for d in drivers if d.number})
+        driver_map = build_driver_map(drivers)
         team_map = jolpica.get_driver_teams_map(season)
 
         # DOWNLOAD PHASE (loading race data)
@@ -483,27 +490,26 @@ def _ingest_race_data(
                 event_new = 0
 
                 for penalty in penalties:
-                    if penalty.category in ["Penalty", "Investigation", "Track Limits"]:
+                    if penalty.category in INDEXED_PENALTY_CATEGORIES:
+                        # Create synthetic URL for uniqueness check
+                        msg_hash = short_hash(f"{event}-{penalty.session}-{penalty.message}")
+                        synthetic_url = f"fastf1://{season}/{event}/{penalty.session}/{msg_hash}"
+
+                        # Check if exists before resolving names for the document
+                        if vector_store.document_exists("race_data", synthetic_url, config_hash):
+                            skipped += 1
+                            continue
+
                         # Resolve driver name using Jolpica data
                         driver_name = penalty.driver
-                        if driver_name and driver_name in driver_map:
-                            driver_name = driver_map[driver_name]
+                        if driver_name:
+                            driver_name = driver_map.get(driver_name, driver_name)
 
                         # Resolve team
                         team_name = penalty.team or "Unknown"
                         if team_name == "Unknown" and driver_name in team_map:
                             team_name = team_map[driver_name]
 
-                        # Create synthetic URL for uniqueness check
-                        msg_content = f"{event}-{penalty.session}-{penalty.message}"
-                        msg_hash = hashlib.md5(msg_content.encode()).hexdigest()[:10]
-                        synthetic_url = f"fastf1://{season}/{event}/{penalty.session}/{msg_hash}"
-
-                        # Check if exists
-                        if vector_store.document_exists("race_data", synthetic_url, config_hash):
-                            skipped += 1
-                            continue
-
                         content = normalize_text(
                             f"Race: {penalty.race_name} ({penalty.session})\n"
                             f"Driver: {driver_name or 'Unknown'}\n"
@@ -519,13 +525,13 @@ def _ingest_race_data(
                                 doc_id=doc_id,
                                 content=content,
                                 metadata={
-                                    "source": normalize_text(
+                                    "source": normalize_label(
                                         f"{penalty.race_name} {penalty.session}"
                                     ),
                                     "type": "race_control",
-                                    "driver": normalize_text(driver_name or ""),
-                                    "team": normalize_text(team_name),
-                                    "race": normalize_text(penalty.race_name),
+                                    "driver": normalize_label(driver_name or ""),
+                                    "team": normalize_label(team_name),
+                                    "race": normalize_label(penalty.race_name),
                                     "season": season,
                                     "url": synthetic_url,
                                     "config_hash": config_hash,
@@ -658,6 +664,7 @@ def setup(
         counts["stewards_decisions"] = _ingest_stewards_decisions(
             scraper, vector_store, limit, season, progress
         )
+        scraper.close()
 
         # --- 3. Index Race Data (penalties from FastF1) ---
         progress.start_data_type("Race Data", "🏎️")
@@ -40,7 +40,7 @@ class SafeConsole:
 
             self._console = Console()
         except Exception as e:
-            logger.debug(f"Rich console initialization failed: {e}")
+            logger.debug("Rich console initialization failed: %s", e)
             self._console = None
 
         return self._console
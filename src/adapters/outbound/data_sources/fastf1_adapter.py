@@ -4,12 +4,10 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
-from rich.console import Console
-
 from ....core.domain import PenaltyEvent, RaceResult
 from ....core.ports.data_source_port import RaceDataSourcePort
+from ...common.console import console
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 # Constants
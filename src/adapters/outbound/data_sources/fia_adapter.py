@@ -9,18 +9,21 @@ from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
 from pypdf import PdfReader
-from rich.console import Console
+from requests.adapters import HTTPAdapter
 
 from ....core.domain import FIADocument
 from ....core.domain.utils import normalize_text
 from ....core.ports.data_source_port import RegulationsSourcePort
+from ...common.console import console
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 # Constants
 REQUEST_TIMEOUT = 30
 DOWNLOAD_TIMEOUT = 60
+# Keep-alive connections kept per host; setup downloads documents from several
+# threads at once, and requests' default of 10 would drop the extra connections
+POOL_MAXSIZE = 16
 
 
 class FIAAdapter(RegulationsSourcePort):
@@ -43,6 +46,9 @@ class FIAAdapter(RegulationsSourcePort):
         self.regulations_dir = self.data_dir / "regulations"
         self.stewards_dir = self.data_dir / "stewards"
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         )
@@ -5,9 +5,9 @@ from dataclasses import dataclass
 from typing import Any
 
 import requests
-from rich.console import Console
 
-console = Console()
+from ...common.console import console
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -162,7 +162,7 @@ class JolpicaAdapter:
             if standings_list:
                 return standings_list[0].get("DriverStandings", [])  # type: ignore[no-any-return]
         except (KeyError, TypeError, IndexError) as e:
-            logger.debug(f"Driver standings parse error: {e}")
+            logger.debug("Driver standings parse error: %s", e)
 
         return []
 
@@ -185,7 +185,7 @@ class JolpicaAdapter:
             if races:
                 return races[0].get("Results", [])  # type: ignore[no-any-return]
         except (KeyError, TypeError, IndexError) as e:
-            logger.debug(f"Race results parse error: {e}")
+            logger.debug("Race results parse error: %s", e)
 
         return []
 
@@ -52,6 +52,10 @@ class GeminiAdapter(LLMPort):
 
         return self._client
 
+    def warm(self) -> None:
+        """Create the Gemini client ahead of the first generation call."""
+        self._get_client()
+
     def generate(
         self,
         prompt: str,
@@ -109,7 +109,7 @@ class SQLiteAdapter:
                 conn.commit()
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
 
     def insert_penalty(
@@ -149,7 +149,7 @@ class SQLiteAdapter:
                 conn.commit()
                 return cursor.lastrowid or 0
         except sqlite3.Error as e:
-            logger.error(f"Failed to insert penalty: {e}")
+            logger.error("Failed to insert penalty: %s", e)
             return 0
 
     def clear_season(self, season: int) -> None:
@@ -164,7 +164,7 @@ class SQLiteAdapter:
                 cursor.execute("DELETE FROM penalties WHERE season = ?", (season,))
                 conn.commit()
         except sqlite3.Error as e:
-            logger.error(f"Failed to clear season {season}: {e}")
+            logger.error("Failed to clear season %s: %s", season, e)
 
     def _validate_sql_safety(self, query: str) -> tuple[bool, str]:
         """Validate SQL query for safety against injection attacks.
@@ -184,7 +184,7 @@ class SQLiteAdapter:
         # Check for blocked patterns (SQL injection attempts)
         for pattern in BLOCKED_SQL_PATTERNS:
             if re.search(pattern, query_upper, re.IGNORECASE):
-                logger.warning(f"Blocked potentially dangerous SQL pattern: {pattern}")
+                logger.warning("Blocked potentially dangerous SQL pattern: %s", pattern)
                 return False, "Query contains blocked pattern for security reasons."
 
         # Extract table references and validate against whitelist
@@ -212,7 +212,7 @@ class SQLiteAdapter:
 
         for table in referenced_tables:
             if table.lower() not in ALLOWED_TABLES:
-                logger.warning(f"Query references non-whitelisted table: {table}")
+                logger.warning("Query references non-whitelisted table: %s", table)
                 return False, f"Query references non-allowed table: {table}"
 
         # Additional check: require at least one table reference for valid queries
@@ -249,5 +249,5 @@ class SQLiteAdapter:
                 cursor.execute(query, params)
                 return cursor.fetchall()
         except sqlite3.Error as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             return []
@@ -4,8 +4,11 @@ This module provides a Qdrant-based vector store that implements the same interf
 as the previous Pinecone store for seamless switching between backends.
 """
 
+import hashlib
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -14,18 +17,32 @@ if TYPE_CHECKING:
 from ....core.domain import Document, SearchResult
 from ....core.domain.exceptions import (
     QdrantConnectionError,
+    VectorStoreError,
 )
-from ....core.domain.utils import normalize_text
+from ....core.domain.utils import normalize_label, normalize_text
 from ....core.ports.embedding_port import EmbeddingPort
 from ....core.ports.vector_store_port import VectorStorePort
 
 logger = logging.getLogger(__name__)
 
 # Constants
-EMBEDDING_BATCH_SIZE = 20
+EMBEDDING_BATCH_SIZE = 100  # Gemini batch embed limit per request
+UPSERT_BATCH_SIZE = 100
 MAX_EMBEDDING_RETRIES = 3
 EMBEDDING_DIMENSION = 3072  # gemini-embedding-001 default dimension
 
+# Low-cardinality metadata keys whose values repeat across many documents; only
+# these go through the bounded label cache, other strings (URLs, hashes) don't
+LABEL_METADATA_KEYS = frozenset({"source", "race", "driver", "team", "event"})
+
+# Cluster URLs whose collections and payload indexes were already ensured in this
+# process, so later adapters for the same cluster skip the provisioning round trips
+_PROVISIONED_URLS: set[str] = set()
+
+# Serializes lazy client creation and provisioning: adapters are used from
+# several threads at once (concurrent retrieval, batched stats)
+_CLIENT_LOCK = threading.Lock()
+
 
 class GeminiEmbeddingFunction(EmbeddingPort):
     """Custom embedding function using Google Gemini API.
@@ -47,11 +64,31 @@ class GeminiEmbeddingFunction(EmbeddingPort):
             self._client = genai.Client(api_key=self.api_key)
         return self._client
 
+    def warm(self) -> None:
+        """Create the genai client ahead of the first embedding call."""
+        self._get_client()
+
     def embed_query(self, text: str) -> list[float]:
         """Generate embedding for a single query text."""
         embeddings = self._embed_texts([text], task_type="RETRIEVAL_QUERY")
         return embeddings[0] if embeddings else [0.0] * EMBEDDING_DIMENSION
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple query texts in as few API calls as possible."""
+        if not texts:
+            return []
+
+        all_embeddings = []
+        for i in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            batch = texts[i : i + EMBEDDING_BATCH_SIZE]
+            embeddings = self._embed_texts(batch, task_type="RETRIEVAL_QUERY")
+            # Keep positions aligned with the input even if the API returned nothing
+            if len(embeddings) != len(batch):
+                embeddings = [[0.0] * EMBEDDING_DIMENSION for _ in batch]
+            all_embeddings.extend(embeddings)
+
+        return all_embeddings
+
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple documents."""
         if not texts:
@@ -66,7 +103,7 @@ class GeminiEmbeddingFunction(EmbeddingPort):
                 all_embeddings.extend(embeddings)
                 time.sleep(0.5)  # Rate limiting
             except Exception as e:
-                logger.error(f"Error embedding batch {i}: {e}")
+                logger.error("Error embedding batch %s: %s", i, e)
                 # Add empty embeddings for failed batch to maintain index
                 all_embeddings.extend([[] for _ in batch])
 
@@ -90,7 +127,7 @@ class GeminiEmbeddingFunction(EmbeddingPort):
                 return []
             except Exception as e:
                 if attempt == MAX_EMBEDDING_RETRIES - 1:
-                    logger.error(f"Failed to embed texts after retries: {e}")
+                    logger.error("Failed to embed texts after retries: %s", e)
                     raise
                 time.sleep(2**attempt)
         return []
@@ -116,6 +153,7 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
         url: str,
         api_key: str,
         embedding_api_key: str,
+        embedding_function: EmbeddingPort | None = None,
     ) -> None:
         """Initialize the Qdrant vector store.
 
@@ -123,26 +161,35 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
             url: Qdrant Cloud cluster URL.
             api_key: Qdrant API key.
             embedding_api_key: Google API key for embeddings.
+            embedding_function: Optional shared embedding function. When omitted a
+                new GeminiEmbeddingFunction is created from embedding_api_key.
         """
         self.url = url
         self.api_key = api_key
         self._client: QdrantClient | None = None
-        self._embedding_function = GeminiEmbeddingFunction(embedding_api_key)
+        self._embedding_function = embedding_function or GeminiEmbeddingFunction(embedding_api_key)
 
     def _get_client(self) -> "QdrantClient":
         """Get or create Qdrant client connection."""
-        if not self._client:
+        if self._client is not None:
+            return self._client
+
+        with _CLIENT_LOCK:
+            # Another thread may have connected while this one waited
+            if self._client is not None:
+                return self._client
             try:
                 from qdrant_client import QdrantClient
 
-                self._client = QdrantClient(
+                client = QdrantClient(
                     url=self.url,
                     api_key=self.api_key,
                 )
                 logger.info("Connected to Qdrant at: %s", self.url)
 
-                # Ensure collections exist
-                self._ensure_collections()
+                # Ensure collections exist (once per cluster per process)
+                if self.url not in _PROVISIONED_URLS:
+                    self._ensure_collections(client)
             except Exception as e:
                 raise QdrantConnectionError(
                     f"Failed to connect to Qdrant at {self.url}",
@@ -150,12 +197,17 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                     context={"url": self.url},
                 ) from e
 
-        return self._client
+            # Published only once provisioned, so other threads never use it early
+            self._client = client
+            return client
 
-    def _ensure_collections(self) -> None:
+    def warm(self) -> None:
+        """Connect to Qdrant, provisioning collections if needed, ahead of first use."""
+        self._get_client()
+
+    def _ensure_collections(self, client: "QdrantClient") -> None:
         """Ensure all required collections exist."""
         try:
-            client = self._get_client()
             collections = client.get_collections().collections
             existing = {c.name for c in collections}
 
@@ -167,7 +219,7 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                 self.RACE_DATA_COLLECTION,
             ]:
                 if name not in existing:
-                    logger.info(f"Creating collection {name}")
+                    logger.info("Creating collection %s", name)
                     client.create_collection(
                         collection_name=name,
                         vectors_config=models.VectorParams(
@@ -190,8 +242,9 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                     field_schema=models.PayloadSchemaType.KEYWORD,
                 )
 
+            _PROVISIONED_URLS.add(self.url)
         except Exception as e:
-            logger.error(f"Failed to ensure collections: {e}")
+            logger.error("Failed to ensure collections: %s", e)
             raise e
 
     def reset(self) -> None:
@@ -207,10 +260,10 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                 client.delete_collection(collection_name=collection_name)
                 logger.debug("Deleted collection: %s", collection_name)
             except Exception as e:
-                logger.debug(f"Collection {collection_name} deletion skipped: {e}")
+                logger.debug("Collection %s deletion skipped: %s", collection_name, e)
 
         # Recreate collections
-        self._ensure_collections()
+        self._ensure_collections(client)
         logger.info("Qdrant vector store reset complete")
 
     def add_documents(
@@ -241,28 +294,32 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
 
         # Prepare points for upsert
         points = []
+        skipped = 0
         for i, (doc, embedding, clean_content) in enumerate(zip(documents, embeddings, contents)):
+            # Failed embedding batches come back empty; upserting them would fail the whole batch
+            if not embedding:
+                skipped += 1
+                continue
+
             # Generate a unique integer ID from doc_id or index
             if doc.doc_id:
-                # Use hash of doc_id for consistent integer ID
-                point_id = abs(hash(doc.doc_id)) % (10**18)
+                # Stable digest of doc_id (built-in hash() is randomized per process),
+                # so re-indexing a document overwrites its point instead of duplicating it
+                digest = hashlib.blake2b(doc.doc_id.encode("utf-8"), digest_size=8).digest()
+                point_id = int.from_bytes(digest) % (10**18)
             else:
                 point_id = abs(hash(f"{collection_name}_{i}_{time.time()}")) % (10**18)
 
-            # Normalize metadata string values to prevent BOM issues
-            clean_metadata = {}
+            # Store normalized content in payload along with metadata. Metadata
+            # strings are normalized to prevent BOM issues; label values are
+            # shared by chunks of a document and messages of a race, so they go
+            # through the label cache and each distinct one is cleaned once
+            payload = {"content": clean_content, "doc_id": doc.doc_id}
             for key, value in doc.metadata.items():
                 if isinstance(value, str):
-                    clean_metadata[key] = normalize_text(value)
-                else:
-                    clean_metadata[key] = value
-
-            # Store normalized content in payload along with metadata
-            payload = {
-                "content": clean_content,
-                "doc_id": doc.doc_id,
-                **clean_metadata,
-            }
+                    normalize = normalize_label if key in LABEL_METADATA_KEYS else normalize_text
+                    value = normalize(value)
+                payload[key] = value
 
             points.append(
                 PointStruct(
@@ -272,17 +329,33 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                 )
             )
 
-        # Upsert in batches
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            client.upsert(
-                collection_name=collection_name,
-                points=batch,
+        if skipped:
+            logger.warning(
+                "Skipping %d documents without embeddings for %s", skipped, collection_name
             )
 
-        logger.info("Added %d documents to %s", len(documents), collection_name)
-        return len(documents)
+        # Upsert in batches
+        for i in range(0, len(points), UPSERT_BATCH_SIZE):
+            batch = points[i : i + UPSERT_BATCH_SIZE]
+            try:
+                client.upsert(
+                    collection_name=collection_name,
+                    points=batch,
+                )
+            except Exception as e:
+                raise VectorStoreError(
+                    f"Failed to upsert batch {i // UPSERT_BATCH_SIZE} into {collection_name}",
+                    cause=e,
+                    context={
+                        "collection": collection_name,
+                        "batch_start": i,
+                        "batch_size": len(batch),
+                        "first_doc_id": batch[0].payload.get("doc_id"),
+                    },
+                ) from e
+
+        logger.info("Added %d documents to %s", len(points), collection_name)
+        return len(points)
 
     def search(
         self,
@@ -302,37 +375,86 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
         Returns:
             List of SearchResult objects.
         """
-        from qdrant_client.models import FieldCondition, Filter, MatchValue
-
         client = self._get_client()
 
         # Generate query embedding
         query_embedding = self._embedding_function.embed_query(query)
 
-        # Build filter if provided
-        qdrant_filter = None
-        if filter_metadata:
-            conditions = []
-            for key, value in filter_metadata.items():
-                if isinstance(value, dict) and "$eq" in value:
-                    conditions.append(FieldCondition(key=key, match=MatchValue(value=value["$eq"])))
-            if conditions:
-                qdrant_filter = Filter(must=conditions)
-
         # Search using query_points (qdrant-client 1.16+ API)
         results = client.query_points(
             collection_name=collection_name,
             query=query_embedding,
             limit=top_k * 2,  # Get extra for filtering
-            query_filter=qdrant_filter,
+            query_filter=self._build_filter(filter_metadata),
             with_payload=True,
         )
 
-        search_results = []
-        seen_content = set()
-
         # query_points returns QueryResponse with .points attribute
         points = results.points if hasattr(results, "points") else results
+        return self._to_search_results(points, top_k)
+
+    def search_batch(
+        self,
+        queries: list[str],
+        collection_name: str = REGULATIONS_COLLECTION,
+        top_k: int = 5,
+        filters: list[dict[str, Any] | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with one embedding call and one Qdrant request.
+
+        Args:
+            queries: Search queries.
+            collection_name: Collection to search in.
+            top_k: Number of results to return per query.
+            filters: Optional metadata filter per query (same length as queries).
+
+        Returns:
+            One list of SearchResult objects per query, in input order.
+        """
+        if not queries:
+            return []
+
+        from qdrant_client.models import QueryRequest
+
+        client = self._get_client()
+        filters = filters or [None] * len(queries)
+
+        query_embeddings = self._embedding_function.embed_queries(queries)
+
+        responses = client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                QueryRequest(
+                    query=embedding,
+                    filter=self._build_filter(filter_metadata),
+                    limit=top_k * 2,  # Get extra for filtering
+                    with_payload=True,
+                )
+                for embedding, filter_metadata in zip(query_embeddings, filters)
+            ],
+        )
+
+        return [self._to_search_results(response.points, top_k) for response in responses]
+
+    @staticmethod
+    def _build_filter(filter_metadata: dict[str, Any] | None) -> Any:
+        """Build a Qdrant filter from ``{"key": {"$eq": value}}`` style metadata."""
+        if not filter_metadata:
+            return None
+
+        from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+        conditions = []
+        for key, value in filter_metadata.items():
+            if isinstance(value, dict) and "$eq" in value:
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value["$eq"])))
+        return Filter(must=conditions) if conditions else None
+
+    @staticmethod
+    def _to_search_results(points: Any, top_k: int) -> list[SearchResult]:
+        """Convert scored Qdrant points into normalized, deduplicated SearchResults."""
+        search_results = []
+        seen_content = set()
 
         for hit in points:
             score = hit.score
@@ -405,7 +527,7 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
                 results = self.search(query, collection_name, top_k)
                 all_results.extend(results)
             except Exception as e:
-                logger.warning(f"Search failed for collection {collection_name}: {e}")
+                logger.warning("Search failed for collection %s: %s", collection_name, e)
 
         # Sort by score and return top results
         all_results.sort(key=lambda x: x.score, reverse=True)
@@ -429,9 +551,28 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
             }
         except Exception as e:
             # Collection might not exist
-            logger.warning(f"Failed to get stats for {collection_name}: {e}")
+            logger.warning("Failed to get stats for %s: %s", collection_name, e)
             return {"count": 0, "status": "unknown"}
 
+    def get_collection_stats_batch(self, collection_names: list[str]) -> dict[str, dict[str, Any]]:
+        """Get statistics for several collections concurrently.
+
+        Qdrant has no multi-collection info call, so the per-collection
+        requests are issued in parallel rather than one after another.
+
+        Args:
+            collection_names: Names of the collections.
+
+        Returns:
+            Dict mapping each collection name to its statistics.
+        """
+        if not collection_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(collection_names)) as executor:
+            return dict(
+                zip(collection_names, executor.map(self.get_collection_stats, collection_names))
+            )
+
     def document_exists(self, collection_name: str, url: str, config_hash: str) -> bool:
         """Check if a document exists with the given URL and config hash.
 
@@ -465,9 +606,59 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
             )
             return len(results) > 0
         except Exception as e:
-            logger.warning(f"Error checking document existence: {e}")
+            logger.warning("Error checking document existence: %s", e)
             return False
 
+    def document_exists_many(
+        self, collection_name: str, urls: list[str], config_hash: str
+    ) -> set[str]:
+        """Return which of ``urls`` are already indexed with the given config hash.
+
+        Batched form of :meth:`document_exists`: one filtered scroll over all
+        URLs (paged, since every chunk of a document carries its URL) instead
+        of one request per URL.
+
+        Args:
+            collection_name: Collection to search in.
+            urls: Source URLs to check.
+            config_hash: Hash of the configuration used for ingestion.
+
+        Returns:
+            The subset of ``urls`` that exist with matching config.
+        """
+        if not urls:
+            return set()
+
+        from qdrant_client.http import models
+
+        try:
+            client = self._get_client()
+            scroll_filter = models.Filter(
+                must=[
+                    models.FieldCondition(key="url", match=models.MatchAny(any=list(urls))),
+                    models.FieldCondition(
+                        key="config_hash", match=models.MatchValue(value=config_hash)
+                    ),
+                ]
+            )
+            found: set[str] = set()
+            offset = None
+            while True:
+                points, offset = client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=scroll_filter,
+                    limit=1000,
+                    offset=offset,
+                    with_payload=["url"],
+                    with_vectors=False,
+                )
+                found.update(p.payload["url"] for p in points if p.payload)
+                if offset is None:
+                    return found
+        except Exception as e:
+            logger.warning("Error checking document existence: %s", e)
+            return set()
+
     def clear_collection(self, collection_name: str) -> None:
         """Clear all documents from a collection.
 
@@ -489,4 +680,4 @@ class QdrantAdapter(VectorStorePort):  # type: ignore[misc]
             )
             logger.info("Cleared collection: %s", collection_name)
         except Exception as e:
-            logger.warning(f"Failed to clear collection {collection_name}: {e}")
+            logger.warning("Failed to clear collection %s: %s", collection_name, e)
@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     chunk_size: int = 1000
     chunk_overlap: int = 400
     top_k_results: int = 5
+    # Cross-encoder re-ranking (needs sentence-transformers/torch; off by default
+    # because torch has issues on Windows)
+    rerank_enabled: bool = False
 
     # Logging
     log_level: str = "INFO"
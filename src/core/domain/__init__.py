@@ -5,7 +5,7 @@ Models are organized by domain area:
 
 - document: Document and SearchResult for the RAG vector store
 - fia_document: FIADocument for scraped FIA documents
-- race_data: PenaltyEvent and RaceResult from FastF1
+- race_data: PenaltyEvent and RaceResult from FastF1, plus race data helpers
 - agent: QueryType, AgentResponse, and RetrievalContext
 
 All models are re-exported here for convenient importing:
@@ -16,7 +16,7 @@ All models are re-exported here for convenient importing:
 from .agent import AgentResponse, QueryType, RetrievalContext
 from .document import Document, SearchResult
 from .fia_document import FIADocument
-from .race_data import PenaltyEvent, RaceResult
+from .race_data import INDEXED_PENALTY_CATEGORIES, PenaltyEvent, RaceResult, build_driver_map
 
 __all__ = [
     # Document models
@@ -25,8 +25,10 @@ __all__ = [
     # FIA document models
     "FIADocument",
     # Race data models
+    "INDEXED_PENALTY_CATEGORIES",
     "PenaltyEvent",
     "RaceResult",
+    "build_driver_map",
     # Agent models
     "QueryType",
     "AgentResponse",
@@ -26,9 +26,9 @@ class QueryType(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
-    """A single message in the chat history."""
+    """A single message in the chat history (slotted: one is built per history turn)."""
 
     role: str
     content: str
@@ -123,11 +123,12 @@ class AgentResponse:
     Attributes:
         answer: The generated response text.
         query_type: How the query was classified.
-        sources_used: List of source citations.
+        sources_used: Source citations, always dicts with "source", "doc_type"
+            and "score" keys (plus optional "excerpt" and "url").
         context: The retrieval context used (optional).
     """
 
     answer: str
     query_type: QueryType
-    sources_used: list[str]
+    sources_used: list[dict]
     context: "RetrievalContext | None" = None
@@ -4,13 +4,14 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """A document chunk with content and metadata.
 
     This represents a piece of text that can be indexed and searched
     in the vector store. Each document has content, associated metadata,
-    and an optional unique identifier.
+    and an optional unique identifier. Slotted, as setup creates one per
+    chunk (tens of thousands per season).
 
     Attributes:
         content: The text content of the document chunk.
@@ -23,7 +24,7 @@ class Document:
     doc_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result with document and relevance score.
 
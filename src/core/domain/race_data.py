@@ -1,7 +1,32 @@
 """Race data models for FastF1 loaded data."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
+
+# Race control message categories that setup indexes as race data
+INDEXED_PENALTY_CATEGORIES = frozenset({"Penalty", "Investigation", "Track Limits"})
+
+
+def build_driver_map(drivers: Iterable[Any]) -> dict[str, str]:
+    """Map each driver's code and car number to their full name.
+
+    Race control messages identify drivers by either, so one table resolves both.
+
+    Args:
+        drivers: Drivers with ``code``, ``name`` and optional ``number``
+            attributes (e.g. from the Jolpica API).
+
+    Returns:
+        Dict from driver code and car number (as a string) to driver name.
+    """
+    driver_map: dict[str, str] = {}
+    for driver in drivers:
+        driver_map[driver.code] = driver.name
+        if driver.number:
+            driver_map[str(driver.number)] = driver.name
+    return driver_map
 
 
 @dataclass
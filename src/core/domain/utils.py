@@ -14,7 +14,17 @@ The application should treat text consistently at the boundaries:
   response boundary for defense-in-depth.
 """
 
+import hashlib
 import re
+from functools import lru_cache
+
+# Deletes BOM markers and folds tabs to spaces in a single translate pass
+_NORMALIZE_TABLE = str.maketrans({"\ufeff": None, "\ufffe": None, "\t": " "})
+_MULTI_SPACE = re.compile(r" {2,}")
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+
+# Sentence boundaries chunk_text prefers to break at, in priority order
+_SENTENCE_BREAKS = (". ", ".\n", "? ", "?\n", "! ", "!\n")
 
 
 def normalize_text(text: str | None) -> str:
@@ -38,17 +48,52 @@ def normalize_text(text: str | None) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    # Remove BOM markers that can appear at the start of documents
-    cleaned = text.replace("\ufeff", "").replace("\ufffe", "")
-
-    # Normalize newlines and collapse repeated spaces/tabs while keeping paragraph breaks
-    cleaned = cleaned.replace("\r\n", "\n").replace("\r", "\n")
-    cleaned = re.sub(r"[ \t]+", " ", cleaned)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    # Fast path for already-clean text (most user questions): these substring
+    # checks are C-level scans, and str.strip() returns the same object when
+    # there is nothing to trim, so no new string is allocated. ASCII-only text
+    # (most English regulations and questions) cannot hold BOMs; isascii() is
+    # O(1) on CPython strings, so those two scans are skipped for it
+    if (
+        (text.isascii() or ("\ufeff" not in text and "\ufffe" not in text))
+        and "\t" not in text
+        and "\r" not in text
+        and "  " not in text
+        and "\n\n\n" not in text
+    ):
+        return text.strip()
+
+    # Remove BOM markers and turn tabs into spaces
+    cleaned = text.translate(_NORMALIZE_TABLE)
+
+    # Normalize newlines and collapse repeated spaces while keeping paragraph breaks
+    if "\r" in cleaned:
+        cleaned = cleaned.replace("\r\n", "\n").replace("\r", "\n")
+    cleaned = _MULTI_SPACE.sub(" ", cleaned)
+    cleaned = _EXCESS_NEWLINES.sub("\n\n", cleaned)
 
     return cleaned.strip()
 
 
+@lru_cache(maxsize=4096)
+def normalize_label(text: str) -> str:
+    """Cached :func:`normalize_text` for short strings that repeat a lot.
+
+    Meant for metadata such as document titles and event, race or driver
+    names; long document bodies should go through :func:`normalize_text`
+    directly so they don't fill the cache.
+    """
+    return normalize_text(text)
+
+
+def short_hash(key: str) -> str:
+    """Ten hex characters of a BLAKE2b digest of ``key``, for stable document IDs.
+
+    BLAKE2b with a 5-byte digest is cheaper than MD5 truncated to the same
+    length and, unlike built-in ``hash()``, gives the same value in every process.
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=5).hexdigest()
+
+
 def sanitize_text(text: str | None) -> str:
     """Backward-compatible alias for :func:`normalize_text`."""
 
@@ -87,18 +132,20 @@ def chunk_text(
     if not text:
         return []
 
-    if len(text) <= chunk_size:
+    text_len = len(text)
+    if text_len <= chunk_size:
         return [text]
 
+    half_chunk = chunk_size // 2
     chunks = []
     start = 0
-    while start < len(text):
+    while start < text_len:
         end = start + chunk_size
         # Try to break at sentence boundary
-        if end < len(text):
-            for punct in [". ", ".\n", "? ", "?\n", "! ", "!\n"]:
+        if end < text_len:
+            for punct in _SENTENCE_BREAKS:
                 last_punct = text.rfind(punct, start, end)
-                if last_punct > start + chunk_size // 2:
+                if last_punct > start + half_chunk:
                     end = last_punct + 1
                     break
         chunk = text[start:end].strip()
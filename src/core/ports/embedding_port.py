@@ -11,3 +11,10 @@ class EmbeddingPort(ABC):
 
     @abstractmethod
     def embed_documents(self, texts: list[str]) -> list[list[float]]: ...
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several queries. Adapters should override this with a batched call."""
+        return [self.embed_query(text) for text in texts]
+
+    def warm(self) -> None:
+        """Open the embedding client ahead of the first call. Lazy adapters override this."""
@@ -27,3 +27,6 @@ class LLMPort(ABC):
     ) -> Generator[str, None, None]:
         """Generate a streaming response."""
         ...
+
+    def warm(self) -> None:
+        """Prepare the provider client before the first request. No-op by default."""
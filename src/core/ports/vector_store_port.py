@@ -30,6 +30,24 @@ class VectorStorePort(ABC):
         """Search for relevant documents."""
         ...
 
+    def search_batch(
+        self,
+        queries: list[str],
+        collection_name: str,
+        top_k: int = 5,
+        filters: list[dict[str, Any] | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once, returning one result list per query.
+
+        Adapters should override this with a single batched round trip; the
+        default falls back to one search per query.
+        """
+        filters = filters or [None] * len(queries)
+        return [
+            self.search(query, collection_name, top_k, filter_metadata)
+            for query, filter_metadata in zip(queries, filters)
+        ]
+
     @abstractmethod
     def reset(self) -> None:
         """Reset/clear the vector store."""
@@ -39,3 +57,17 @@ class VectorStorePort(ABC):
     def get_collection_stats(self, collection_name: str) -> dict[str, Any]:
         """Get statistics for a collection."""
         ...
+
+    def get_collection_stats_batch(self, collection_names: list[str]) -> dict[str, dict[str, Any]]:
+        """Get statistics for several collections, keyed by collection name.
+
+        Adapters should override this to fetch the stats concurrently; the
+        default falls back to one call per collection.
+        """
+        return {name: self.get_collection_stats(name) for name in collection_names}
+
+    def warm(self) -> None:
+        """Connect ahead of the first search or write.
+
+        The default does nothing; adapters that connect lazily should override it.
+        """
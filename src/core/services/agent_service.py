@@ -258,32 +258,60 @@ class AgentService:
         if messages:
             search_query = self.contextualize_query(query, messages)
 
-            # Handle special conversation markers
-            if search_query == "[DECLINED]":
-                logger.debug("User declined follow-up, returning acknowledgment")
-                return AgentResponse(
-                    answer=DECLINED_RESPONSE,
-                    query_type=QueryType.GENERAL,
-                    sources_used=[],
-                    context=RetrievalContext([], [], []),
-                )
-            elif search_query == "[THANKS]":
-                logger.debug("User expressed gratitude, returning thanks response")
-                return AgentResponse(
-                    answer=THANKS_RESPONSE,
-                    query_type=QueryType.GENERAL,
-                    sources_used=[],
-                    context=RetrievalContext([], [], []),
-                )
-            elif search_query == "[GREETING]":
-                logger.debug("User sent greeting, returning welcome response")
-                return AgentResponse(
-                    answer=GREETING_RESPONSE,
-                    query_type=QueryType.GENERAL,
-                    sources_used=[],
-                    context=RetrievalContext([], [], []),
-                )
+            special = self._special_response(search_query)
+            if special:
+                return special
+
+        query_type, context, prompt = self._prepare(search_query)
+
+        # Generate response
+        logger.debug("Generating response...")
+        answer = self.llm.generate(prompt, system_prompt=F1_SYSTEM_PROMPT)
+
+        # Get sources
+        sources = self.get_sources(context)
+
+        return AgentResponse(
+            answer=answer,
+            query_type=query_type,
+            sources_used=sources,
+            context=context,
+        )
+
+    def _special_response(self, search_query: str) -> AgentResponse | None:
+        """Return a canned response for conversation markers from query rewriting.
+
+        Args:
+            search_query: Contextualized query (may be a marker like "[THANKS]").
+
+        Returns:
+            AgentResponse for a marker, or None for a regular query.
+        """
+        canned = {
+            "[DECLINED]": DECLINED_RESPONSE,
+            "[THANKS]": THANKS_RESPONSE,
+            "[GREETING]": GREETING_RESPONSE,
+        }.get(search_query)
+        if canned is None:
+            return None
+
+        logger.debug("Conversation marker %s, returning canned response", search_query)
+        return AgentResponse(
+            answer=canned,
+            query_type=QueryType.GENERAL,
+            sources_used=[],
+            context=RetrievalContext([], [], [], query=search_query),
+        )
 
+    def _prepare(self, search_query: str) -> tuple[QueryType, RetrievalContext, str]:
+        """Classify, retrieve context and build the LLM prompt for a query.
+
+        Args:
+            search_query: The (contextualized) query to answer.
+
+        Returns:
+            Tuple of (query_type, retrieval context, prompt).
+        """
         # Classify the query
         query_type = self.classify_query(search_query)
         logger.debug("Query type: %s", query_type.value)
@@ -310,25 +338,19 @@ class AgentService:
             # Use standard prompt for non-analytics queries
             prompt = self.build_prompt(search_query, query_type, context)
 
-        # Generate response
-        logger.debug("Generating response...")
-        answer = self.llm.generate(prompt, system_prompt=F1_SYSTEM_PROMPT)
-
-        # Get sources
-        sources = self.get_sources(context)
+        return query_type, context, prompt
 
-        return AgentResponse(
-            answer=answer,
-            query_type=query_type,
-            sources_used=sources,
-            context=context,
-        )
-
-    def ask_stream(self, query: str) -> Generator[str, None, AgentResponse]:
+    def ask_stream(
+        self, query: str, messages: list[object] | None = None
+    ) -> Generator[str, None, AgentResponse]:
         """Ask a question with streaming response.
 
+        Retrieval happens before the first chunk is yielded, so sources are
+        available on the returned AgentResponse as soon as the stream ends.
+
         Args:
             query: User's question.
+            messages: Optional chat history for context.
 
         Yields:
             Text chunks as they're generated.
@@ -342,20 +364,27 @@ class AgentService:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty or whitespace only")
 
-        query_type = self.classify_query(query)
-        query_context = self.retriever.extract_race_context(query)
-        context = self.retriever.retrieve(query, top_k=5, query_context=query_context)
-        prompt = self.build_prompt(query, query_type, context)
+        search_query = query
+        if messages:
+            search_query = self.contextualize_query(query, messages)
+
+            special = self._special_response(search_query)
+            if special:
+                yield special.answer
+                return special
+
+        query_type, context, prompt = self._prepare(search_query)
 
-        full_response = ""
+        # Collect chunks and join once instead of growing a string per token
+        parts: list[str] = []
         for chunk in self.llm.generate_stream(prompt, system_prompt=F1_SYSTEM_PROMPT):
-            full_response += chunk
+            parts.append(chunk)
             yield chunk
 
         sources = self.get_sources(context)
 
         return AgentResponse(
-            answer=full_response,
+            answer="".join(parts),
             query_type=query_type,
             sources_used=sources,
             context=context,
@@ -393,7 +422,7 @@ class AgentService:
             # Clean up markdown if model adds it
             generated_sql = generated_sql.replace("```sql", "").replace("```", "").strip()
 
-            logger.debug(f"Generated SQL: {generated_sql}")
+            logger.debug("Generated SQL: %s", generated_sql)
 
             results = self.stats_repo.execute_query(generated_sql)
 
@@ -402,5 +431,5 @@ class AgentService:
 
             return f"Query: {generated_sql}\nResults: {str(results)}"
         except Exception as e:
-            logger.error(f"SQL generation/execution failed: {e}")
+            logger.error("SQL generation/execution failed: %s", e)
             return f"Error retrieving stats: {e}"
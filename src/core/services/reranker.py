@@ -6,15 +6,35 @@ embedding-based similarity alone.
 """
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
+from ..domain import Document, SearchResult
+
 if TYPE_CHECKING:
     from sentence_transformers import CrossEncoder
 
-    from ..domain import SearchResult
-
 logger = logging.getLogger(__name__)
 
+# Loaded models shared across reranker instances (keyed by model name)
+_MODEL_CACHE: dict[str, "CrossEncoder"] = {}
+
+# Serializes model loads; retrieval reranks from several threads at once
+_MODEL_LOCK = threading.Lock()
+
+
+def _sigmoid_activation():
+    """Return ``torch.nn.Sigmoid()``, importing torch only when a model is loaded.
+
+    torch always comes with sentence-transformers; if it is missing (e.g. the
+    library is mocked) the model's default activation is used instead.
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch.nn.Sigmoid()
+
 
 class CrossEncoderReranker:
     """Re-ranks search results using a cross-encoder model.
@@ -28,6 +48,9 @@ class CrossEncoderReranker:
 
     MODEL_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
+    # Query-document pairs scored per forward pass
+    BATCH_SIZE = 32
+
     def __init__(self, model_name: str | None = None):
         """Initialize the reranker.
 
@@ -38,13 +61,22 @@ class CrossEncoderReranker:
         self._model = None  # Lazy load to avoid slow startup
 
     def _get_model(self) -> "CrossEncoder":
-        """Lazy load the cross-encoder model."""
-        if self._model is None:
+        """Lazy load the cross-encoder model, reusing an already loaded instance."""
+        if self._model is not None:
+            return self._model
+
+        with _MODEL_LOCK:
+            if self.model_name in _MODEL_CACHE:
+                self._model = _MODEL_CACHE[self.model_name]
+                return self._model
             try:
                 from sentence_transformers import CrossEncoder
 
-                logger.debug(f"Loading cross-encoder model: {self.model_name}")
-                self._model = CrossEncoder(self.model_name)
+                logger.debug("Loading cross-encoder model: %s", self.model_name)
+                # Sigmoid maps MS MARCO logits into 0-1 so they stay comparable
+                # with embedding similarity scores
+                self._model = CrossEncoder(self.model_name, activation_fn=_sigmoid_activation())
+                _MODEL_CACHE[self.model_name] = self._model
                 logger.info("Cross-encoder model loaded")
             except ImportError:
                 raise ImportError(
@@ -53,6 +85,10 @@ class CrossEncoderReranker:
                 )
         return self._model
 
+    def warm(self) -> None:
+        """Load the cross-encoder model ahead of the first rerank."""
+        self._get_model()
+
     def rerank(
         self,
         query: str,
@@ -80,22 +116,18 @@ class CrossEncoderReranker:
         # Create query-document pairs for the cross-encoder
         pairs = [(query, result.document.content) for result in results]
 
-        logger.debug(f"Input Results DocIDs: {[r.document.doc_id for r in results]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Input Results DocIDs: %s", [r.document.doc_id for r in results])
 
-        # Get cross-encoder scores
-        scores = model.predict(pairs)
-        logger.debug(f"Model Scores: {scores}")
+        # Get cross-encoder scores (single batched forward pass)
+        scores = model.predict(pairs, batch_size=self.BATCH_SIZE)
+        logger.debug("Model Scores: %s", scores)
 
         # Create new results with updated scores
         reranked = []
         for result, new_score in zip(results, scores):
-            # Create a new SearchResult with the cross-encoder score
-            # Import here to avoid circular dependency
-            from ..domain import Document
-            from ..domain import SearchResult as SR
-
             reranked.append(
-                SR(
+                SearchResult(
                     document=Document(
                         content=result.document.content,
                         metadata=result.document.metadata,
@@ -109,8 +141,10 @@ class CrossEncoderReranker:
         reranked.sort(key=lambda x: x.score, reverse=True)
 
         logger.debug(
-            f"Re-ranked {len(results)} results. "
-            f"Top score: {reranked[0].score:.3f} -> {reranked[-1].score:.3f}"
+            "Re-ranked %d results. Top score: %.3f -> %.3f",
+            len(results),
+            reranked[0].score,
+            reranked[-1].score,
         )
 
         return reranked[:top_k]
@@ -127,5 +161,5 @@ class CrossEncoderReranker:
         except ImportError:
             return False
         except Exception as e:
-            logger.warning(f"Cross-encoder not available: {e}")
+            logger.warning("Cross-encoder not available: %s", e)
             return False
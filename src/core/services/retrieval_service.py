@@ -3,6 +3,8 @@
 import hashlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ..domain import Document, FIADocument, PenaltyEvent, RetrievalContext, SearchResult
 from ..domain.utils import chunk_text
@@ -11,6 +13,17 @@ from .reranker import CrossEncoderReranker
 
 logger = logging.getLogger(__name__)
 
+# Retrievals that may run at once: the API runs each /ask on Starlette's
+# threadpool, whose default limit is 40 threads
+MAX_CONCURRENT_RETRIEVALS = 40
+
+# Shared pool for querying the three collections concurrently (network-bound).
+# Sized for three searches per concurrent retrieval so in-flight requests don't
+# queue behind one another; threads are only started as they are needed.
+_COLLECTION_POOL = ThreadPoolExecutor(
+    max_workers=3 * MAX_CONCURRENT_RETRIEVALS, thread_name_prefix="retrieval"
+)
+
 
 class RetrievalService:
     """Retrieves relevant F1 documents for answering questions."""
@@ -42,6 +55,9 @@ class RetrievalService:
         "red flag": ["race stopped", "session stopped"],
     }
 
+    # Candidates fetched per requested result when re-ranking
+    RERANK_CANDIDATE_MULTIPLIER = 4
+
     def __init__(
         self,
         vector_store: VectorStorePort,
@@ -57,16 +73,26 @@ class RetrievalService:
         self.reranker = CrossEncoderReranker() if use_reranker else None
         if self.reranker:
             logger.info("Cross-encoder re-ranking enabled")
+        # Query parsing is cached per instance; expansion reads this instance's F1_SYNONYMS
+        self._expand_query_cached = lru_cache(maxsize=256)(self._expand_query)
+        self._extract_race_context_cached = lru_cache(maxsize=256)(self._extract_race_context)
 
     def expand_query(self, query: str) -> str:
         """Expand query with F1-specific synonyms for better retrieval.
 
+        Results are cached per query string, so repeated questions skip the
+        synonym scan.
+
         Args:
             query: Original user query.
 
         Returns:
             Expanded query with relevant synonyms added.
         """
+        return self._expand_query_cached(query)
+
+    def _expand_query(self, query: str) -> str:
+        """Uncached implementation of expand_query."""
         query_lower = query.lower()
         expansions = []
 
@@ -147,7 +173,7 @@ class RetrievalService:
             Number of chunks indexed.
         """
         if not document.text_content:
-            logger.warning(f"No text content in {document.title}")
+            logger.warning("No text content in %s", document.title)
             return 0
 
         # Chunk the document
@@ -220,6 +246,19 @@ Message: {event.message}
 
         return self.vector_store.add_documents([doc], VectorStorePort.RACE_DATA_COLLECTION)
 
+    def _finalize_results(
+        self, query: str, results: list[SearchResult], top_k: int
+    ) -> list[SearchResult]:
+        """Boost, deduplicate and (optionally) rerank raw search results."""
+        # Apply keyword boosting and deduplication
+        results = self.boost_keyword_matches(results, query)
+        results = self.deduplicate_results(results)
+
+        # Apply reranking if available
+        if self.reranker and results:
+            return self.reranker.rerank(query, results, top_k)
+        return results[:top_k]
+
     def _retrieve_regulations(
         self, query: str, expanded_query: str, top_k: int, retrieve_k: int
     ) -> list[SearchResult]:
@@ -228,17 +267,7 @@ Message: {event.message}
         regulations = self.vector_store.search(
             expanded_query, VectorStorePort.REGULATIONS_COLLECTION, retrieve_k
         )
-        # Apply keyword boosting and deduplication
-        regulations = self.boost_keyword_matches(regulations, query)
-        regulations = self.deduplicate_results(regulations)
-
-        # Apply reranking if available
-        if self.reranker and regulations:
-            regulations = self.reranker.rerank(query, regulations, top_k)
-        else:
-            regulations = regulations[:top_k]
-
-        return regulations
+        return self._finalize_results(query, regulations, top_k)
 
     def _retrieve_stewards(
         self,
@@ -258,17 +287,7 @@ Message: {event.message}
             stewards = self.vector_store.search(
                 expanded_query, VectorStorePort.STEWARDS_COLLECTION, retrieve_k
             )
-        # Apply keyword boosting and deduplication
-        stewards = self.boost_keyword_matches(stewards, query)
-        stewards = self.deduplicate_results(stewards)
-
-        # Apply reranking if available
-        if self.reranker and stewards:
-            stewards = self.reranker.rerank(query, stewards, top_k)
-        else:
-            stewards = stewards[:top_k]
-
-        return stewards
+        return self._finalize_results(query, stewards, top_k)
 
     def _retrieve_race_data(
         self,
@@ -288,17 +307,44 @@ Message: {event.message}
             race_data = self.vector_store.search(
                 expanded_query, VectorStorePort.RACE_DATA_COLLECTION, retrieve_k
             )
-        # Apply keyword boosting and deduplication
-        race_data = self.boost_keyword_matches(race_data, query)
-        race_data = self.deduplicate_results(race_data)
+        return self._finalize_results(query, race_data, top_k)
 
-        # Apply reranking if available
-        if self.reranker and race_data:
-            race_data = self.reranker.rerank(query, race_data, top_k)
-        else:
-            race_data = race_data[:top_k]
+    @staticmethod
+    def _build_filters(query_context: dict | None) -> tuple[dict | None, dict | None]:
+        """Build (stewards_filter, race_filter) metadata filters from query context.
 
-        return race_data
+        Args:
+            query_context: Optional dict with detected driver/race/season/team context.
+
+        Returns:
+            Tuple of stewards and race_data filters (None when no filter applies).
+        """
+        if not query_context:
+            return None, None
+
+        # Stewards don't usually have metadata for driver/race reliably parsed from PDF text chunks
+        # BUT if we have 'event' metadata (race name), we can filter.
+        # Stewards doc metadata keys: 'event', 'season', 'doc_type'.
+        # 'driver' is typically NOT in metadata (chunks are just text).
+        # So we only filter by Race/Season for stewards.
+        stewards_filter = {}
+        if query_context.get("season"):
+            stewards_filter["season"] = query_context["season"]
+        if query_context.get("race"):
+            stewards_filter["event"] = query_context["race"]  # metadata key is 'event'
+
+        # Race data has 'race', 'season', 'driver', 'team' (added recently).
+        # QdrantAdapter uses strict AND if we pass valid dict.
+        race_filter = {}
+        for key in ("season", "race", "driver", "team"):
+            if query_context.get(key):
+                race_filter[key] = query_context[key]
+
+        return stewards_filter or None, race_filter or None
+
+    def _retrieve_k(self, top_k: int) -> int:
+        """Number of candidates to fetch (more when a reranker will trim them)."""
+        return top_k * self.RERANK_CANDIDATE_MULTIPLIER if self.reranker else top_k
 
     def retrieve(
         self,
@@ -323,72 +369,36 @@ Message: {event.message}
         Returns:
             RetrievalContext with relevant documents.
         """
-        regulations = []
-        stewards = []
-        race_data = []
-
         # Expand query with F1 synonyms for better retrieval
         expanded_query = self.expand_query(query)
 
         # Build metadata filters from query context
-        # Note: ChromaDB supports $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin
-        # For text matching in content, we rely on the embedding search instead
-        # stewards_filter = None # Stewards decisions don't have reliable metadata fields for filtering yet
-        race_filter = None
-
-        if query_context:
-            # Build filters for race_data and stewards
-            # Note: We use "should" (OR) logic for flexibility? No, typically AND for specific query.
-            # But QdrantAdapter uses strict AND if we pass valid dict.
-
-            # Filter by Season
-            if query_context.get("season"):
-                race_filter = {"season": query_context["season"]}
-            else:
-                race_filter = {}
-
-            # Filter by Race
-            if query_context.get("race"):
-                race_filter["race"] = query_context["race"]
-
-            # Filter by Driver
-            if query_context.get("driver"):
-                race_filter["driver"] = query_context["driver"]
-
-            # Filter by Team
-            if query_context.get("team"):
-                race_filter["team"] = query_context["team"]
+        stewards_filter, race_filter = self._build_filters(query_context)
 
         # Determine how many candidates to retrieve
         # If using reranker, get more candidates for re-ranking
-        retrieve_k = top_k * 4 if self.reranker else top_k
+        retrieve_k = self._retrieve_k(top_k)
 
+        # Collections are independent network calls: run them concurrently so
+        # latency is the slowest search rather than the sum of all three
+        regulations_future = stewards_future = race_data_future = None
         if include_regulations:
-            regulations = self._retrieve_regulations(query, expanded_query, top_k, retrieve_k)
-
+            regulations_future = _COLLECTION_POOL.submit(
+                self._retrieve_regulations, query, expanded_query, top_k, retrieve_k
+            )
         if include_stewards:
-            # Stewards don't usually have metadata for driver/race reliably parsed from PDF text chunks
-            # BUT if we have 'event' metadata (race name), we can filter.
-            # Stewards doc metadata keys: 'event', 'season', 'doc_type'.
-            # 'driver' is typically NOT in metadata (chunks are just text).
-            # So we only filter by Race/Season for stewards.
-            stewards_filter = {}
-            if query_context and query_context.get("season"):
-                stewards_filter["season"] = query_context["season"]
-            if query_context and query_context.get("race"):
-                stewards_filter["event"] = query_context["race"]  # metadata key is 'event'
-
-            stewards = self._retrieve_stewards(
-                query, expanded_query, top_k, retrieve_k, stewards_filter or None
+            stewards_future = _COLLECTION_POOL.submit(
+                self._retrieve_stewards, query, expanded_query, top_k, retrieve_k, stewards_filter
             )
-
         if include_race_data:
-            # Race data has 'race', 'season', 'driver', 'team' (added recently).
-            # We use the constructed race_filter.
-            race_data = self._retrieve_race_data(
-                query, expanded_query, top_k, retrieve_k, race_filter or None
+            race_data_future = _COLLECTION_POOL.submit(
+                self._retrieve_race_data, query, expanded_query, top_k, retrieve_k, race_filter
             )
 
+        regulations = regulations_future.result() if regulations_future else []
+        stewards = stewards_future.result() if stewards_future else []
+        race_data = race_data_future.result() if race_data_future else []
+
         return RetrievalContext(
             regulations=regulations,
             stewards_decisions=stewards,
@@ -396,15 +406,122 @@ Message: {event.message}
             query=query,
         )
 
+    def _search_batch_with_fallback(
+        self,
+        collection_name: str,
+        expanded_queries: list[str],
+        top_k: int,
+        retrieve_k: int,
+        filters: list[dict | None],
+    ) -> list[list[SearchResult]]:
+        """Batched filtered search, re-running unfiltered only for queries with no hits."""
+        results = self.vector_store.search_batch(expanded_queries, collection_name, top_k, filters)
+
+        # If no results with filter, try without filter (one batch for all misses)
+        misses = [i for i, (hits, f) in enumerate(zip(results, filters)) if not hits and f]
+        if misses:
+            retried = self.vector_store.search_batch(
+                [expanded_queries[i] for i in misses], collection_name, retrieve_k
+            )
+            for i, hits in zip(misses, retried):
+                results[i] = hits
+
+        return results
+
+    def retrieve_batch(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        query_contexts: list[dict | None] | None = None,
+        include_regulations: bool = True,
+        include_stewards: bool = True,
+        include_race_data: bool = True,
+    ) -> list[RetrievalContext]:
+        """Retrieve context for several queries with one batched search per collection.
+
+        Equivalent to calling :meth:`retrieve` for each query, but embeds all
+        queries together and issues a single vector store request per collection.
+
+        Args:
+            queries: User questions.
+            top_k: Number of results per category.
+            query_contexts: Optional per-query context dicts (same length as queries).
+            include_regulations: Whether to search regulations.
+            include_stewards: Whether to search stewards decisions.
+            include_race_data: Whether to search race control data.
+
+        Returns:
+            One RetrievalContext per query, in input order.
+        """
+        if not queries:
+            return []
+
+        query_contexts = query_contexts or [None] * len(queries)
+        expanded_queries = [self.expand_query(query) for query in queries]
+        stewards_filters, race_filters = [], []
+        for query_context in query_contexts:
+            stewards_filter, race_filter = self._build_filters(query_context)
+            stewards_filters.append(stewards_filter)
+            race_filters.append(race_filter)
+
+        retrieve_k = self._retrieve_k(top_k)
+        empty: list[list[SearchResult]] = [[] for _ in queries]
+
+        regulations = empty
+        if include_regulations:
+            regulations = self.vector_store.search_batch(
+                expanded_queries, VectorStorePort.REGULATIONS_COLLECTION, retrieve_k
+            )
+
+        stewards = empty
+        if include_stewards:
+            stewards = self._search_batch_with_fallback(
+                VectorStorePort.STEWARDS_COLLECTION,
+                expanded_queries,
+                top_k,
+                retrieve_k,
+                stewards_filters,
+            )
+
+        race_data = empty
+        if include_race_data:
+            race_data = self._search_batch_with_fallback(
+                VectorStorePort.RACE_DATA_COLLECTION,
+                expanded_queries,
+                top_k,
+                retrieve_k,
+                race_filters,
+            )
+
+        return [
+            RetrievalContext(
+                regulations=self._finalize_results(query, regs, top_k),
+                stewards_decisions=self._finalize_results(query, stws, top_k),
+                race_data=self._finalize_results(query, races, top_k),
+                query=query,
+            )
+            for query, regs, stws, races in zip(queries, regulations, stewards, race_data)
+        ]
+
     def extract_race_context(self, query: str) -> dict:
         """Extract race/driver context from a query.
 
+        Results are cached per query string; each call returns a fresh copy so
+        callers may modify it.
+
         Args:
             query: User's question.
 
         Returns:
             Dict with extracted context (race, driver, season, etc.)
         """
+        return dict(self._extract_race_context_cached(query))
+
+    def _extract_race_context(self, query: str) -> dict:
+        """Uncached implementation of extract_race_context.
+
+        The returned dict is shared between cache hits and must not be mutated.
+        """
         context = {
             "driver": None,
             "race": None,
@@ -1,6 +1,8 @@
 """Integration tests for FastAPI endpoints."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -33,7 +35,12 @@ def mock_vector_store():
     """Mock the VectorStore for testing."""
     mock = MagicMock()
     mock.get_collection_stats.return_value = {"count": 100}
+    mock.get_collection_stats_batch.side_effect = lambda names: {
+        name: {"count": 100} for name in names
+    }
     mock.REGULATIONS_COLLECTION = "regulations"
+    mock.STEWARDS_COLLECTION = "stewards_decisions"
+    mock.RACE_DATA_COLLECTION = "race_data"
     return mock
 
 
@@ -75,6 +82,51 @@ class TestHealthEndpoints:
         assert data["status"] == "ready"
         assert "vector_store" in data
 
+    @pytest.mark.integration
+    def test_readiness_check_caches_collection_stats(self, client, mock_vector_store):
+        """Test back-to-back probes reuse the cached collection stats."""
+        from src.adapters.inbound.api.deps import invalidate_collection_stats
+
+        invalidate_collection_stats()
+        client.get("/api/v1/ready")
+        client.get("/api/v1/ready")
+
+        assert mock_vector_store.get_collection_stats_batch.call_count == 1
+
+    @pytest.mark.integration
+    def test_collection_stats_served_stale_during_refresh(self, mock_vector_store):
+        """Test a caller doesn't wait on another caller's in-flight refresh."""
+        from src.adapters.inbound.api import deps
+
+        names = ["regulations"]
+        deps.invalidate_collection_stats()
+        deps._stats_cache[tuple(names)] = (0.0, {"regulations": {"count": 1}})
+
+        with deps._stats_lock:  # another caller is refreshing
+            stats = deps.get_collection_stats_cached(mock_vector_store, names)
+
+        assert stats == {"regulations": {"count": 1}}
+        mock_vector_store.get_collection_stats_batch.assert_not_called()
+        deps.invalidate_collection_stats()
+
+    @pytest.mark.integration
+    def test_refresh_overlapping_invalidation_is_not_cached(self, mock_vector_store):
+        """Test a refresh that started before an invalidation doesn't cache its stats."""
+        from src.adapters.inbound.api import deps
+
+        names = ["regulations"]
+        deps.invalidate_collection_stats()
+
+        def stats_then_invalidate(collection_names):
+            deps.invalidate_collection_stats()  # setup finishes mid-refresh
+            return {"regulations": {"count": 1}}
+
+        mock_vector_store.get_collection_stats_batch.side_effect = stats_then_invalidate
+        stats = deps.get_collection_stats_cached(mock_vector_store, names)
+
+        assert stats == {"regulations": {"count": 1}}
+        assert tuple(names) not in deps._stats_cache
+
 
 class TestChatEndpoints:
     """Tests for chat/ask endpoints."""
@@ -91,6 +143,20 @@ class TestChatEndpoints:
         assert "sources" in data
         assert len(data["sources"]) == 1
 
+    @pytest.mark.integration
+    def test_ask_question_clamps_relevance_scores(self, client, mock_agent):
+        """Test out-of-range retrieval scores are clamped to the 0-1 contract."""
+        mock_agent.ask.return_value.sources_used = [
+            {"source": "A", "score": 1.2},
+            {"source": "B", "score": -0.3},
+        ]
+
+        response = client.post("/api/v1/ask", json={"question": "Why did Max get a penalty?"})
+
+        assert response.status_code == 200
+        scores = [s["relevance_score"] for s in response.json()["sources"]]
+        assert scores == [1.0, 0.0]
+
     @pytest.mark.integration
     def test_ask_question_empty_fails(self, client):
         """Test empty question is rejected."""
@@ -106,6 +172,243 @@ class TestChatEndpoints:
 
         assert response.status_code == 422  # Validation error
 
+    @pytest.mark.integration
+    def test_ask_stream_done_event_includes_sources(self, client, mock_agent):
+        """Test streamed answer ends with a done event carrying the sources."""
+
+        def fake_stream(question, messages=None):
+            yield "Test "
+            yield "answer"
+            return mock_agent.ask.return_value
+
+        mock_agent.ask_stream.side_effect = fake_stream
+        response = client.post(
+            "/api/v1/ask/stream",
+            json={"question": "Why did Max get a penalty?"},
+        )
+
+        assert response.status_code == 200
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert [e["content"] for e in events if e["type"] == "chunk"] == ["Test ", "answer"]
+        assert events[-1]["type"] == "done"
+        assert events[-1]["sources"][0]["title"] == "FIA Regulations"
+
+
+class TestSetupEndpoints:
+    """Tests for the setup endpoints."""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("path", ["/api/v1/setup", "/api/v1/admin/setup/stream"])
+    def test_setup_rejected_while_running(self, client, path):
+        """Test both setup endpoints return 409 while a setup job is running."""
+        from src.adapters.inbound.api.routers import setup
+
+        with patch.object(setup._setup_lock, "locked", return_value=True):
+            response = client.post(path, json={})
+
+        assert response.status_code == 409
+        assert "already running" in response.json()["detail"]
+
+    @pytest.mark.integration
+    def test_second_setup_rejected_before_first_job_starts(self, client):
+        """Test a POST arriving before the first job has started still gets 409."""
+        from src.adapters.inbound.api.routers import setup
+
+        # A job that has not started yet: it never releases the claimed slot
+        with patch.object(setup, "_run_setup_job", new_callable=AsyncMock) as job:
+            first = client.post("/api/v1/setup", json={})
+            second = client.post("/api/v1/setup", json={})
+            stream = client.post("/api/v1/admin/setup/stream", json={})
+        job.call_args.args[0]()  # release the slot for other tests
+
+        assert first.status_code == 202
+        assert second.status_code == 409
+        assert stream.status_code == 409
+        assert job.call_count == 1
+
+    @pytest.mark.integration
+    def test_unstarted_stream_does_not_block_setup(self):
+        """Test a setup stream whose body is never iterated leaves setup available."""
+        from src.adapters.inbound.api.routers import setup
+
+        response = asyncio.run(setup.run_setup_stream(setup.SetupRequest()))
+        assert setup._setup_lock.locked()
+
+        asyncio.run(response.background())
+
+        assert not setup._setup_lock.locked()
+        assert not setup._setup_job["running"]
+
+    @pytest.mark.integration
+    def test_fia_chunks_isolate_failed_downloads(self):
+        """Test one failed FIA download is reported without losing the other documents."""
+        from src.adapters.inbound.api.routers import setup
+
+        docs = [MagicMock(title=f"Doc {i}", text_content=None) for i in range(5)]
+
+        def download(doc):
+            if doc is docs[2]:
+                raise ConnectionError("timeout")
+
+        def extract_text(doc):
+            doc.text_content = "Some regulation text."
+
+        scraper = MagicMock(download_document=download, extract_text=extract_text)
+
+        results = {
+            doc.title: (chunks, error)
+            for doc, chunks, error in setup._iter_fia_chunks(scraper, docs, 1500, 200)
+        }
+
+        assert len(results) == 5
+        assert isinstance(results["Doc 2"][1], ConnectionError)
+        assert results["Doc 0"] == (["Some regulation text."], None)
+        assert all(doc.text_content is None for doc in docs)
+
+    @pytest.mark.integration
+    def test_stream_reports_index_progress_per_flush(self, tmp_path):
+        """Test each batch flush sends index progress and the final event covers the phase."""
+        from src.adapters.inbound.api.routers import setup
+        from src.config.settings import settings
+
+        regs = [
+            MagicMock(url=f"https://fia.test/{i}", title=f"Reg {i}", text_content=None)
+            for i in range(3)
+        ]
+
+        def extract_text(doc):
+            doc.text_content = "Short regulation text."
+
+        scraper = MagicMock(extract_text=extract_text)
+        scraper.scrape_regulations.return_value = regs
+        scraper.scrape_stewards_decisions.return_value = []
+        store = MagicMock()
+        store.document_exists_many.return_value = set()
+        store.add_documents.side_effect = lambda docs, collection_name: len(docs)
+
+        async def collect():
+            return [
+                json.loads(event[len(b"data: ") :])
+                async for event in setup._generate_setup_events(False, 0, 2025)
+            ]
+
+        with (
+            patch.object(setup, "INDEX_BATCH_SIZE", 2),
+            patch.object(setup, "get_vector_store", return_value=store),
+            patch.object(setup, "invalidate_collection_stats"),
+            patch.object(settings, "data_dir", tmp_path),
+            patch(
+                "src.adapters.outbound.data_sources.fia_adapter.FIAAdapter",
+                return_value=scraper,
+            ),
+            patch(
+                "src.adapters.outbound.data_sources.fastf1_adapter.FastF1Adapter",
+                side_effect=RuntimeError("offline"),
+            ),
+        ):
+            events = asyncio.run(collect())
+
+        index_events = [
+            (e["event_type"], e["current"], e["total"])
+            for e in events
+            if e.get("data_type") == "regulations" and e.get("phase") == "index"
+        ]
+        assert index_events == [("progress", 2, 2), ("phase", 3, 3)]
+
+
+class TestErrorHandlers:
+    """Tests for the global exception handlers' response bodies."""
+
+    @pytest.fixture
+    def request_scope(self):
+        """A bare request for the error formatter."""
+        from starlette.requests import Request
+
+        return Request({"type": "http", "path": "/api/v1/ask", "method": "POST", "headers": []})
+
+    @pytest.mark.integration
+    def test_request_context_not_in_response(self, request_scope):
+        """Test path/method are logged but not returned to the client."""
+        from src.adapters.inbound.api.main import _log_and_format
+
+        body = _log_and_format(request_scope, RuntimeError("boom"))
+
+        assert "context" not in body
+        assert body["error"]["message"] == "boom"
+
+    @pytest.mark.integration
+    def test_agent_error_keeps_own_context(self, request_scope):
+        """Test an F1AgentError's own context is still returned, without request fields."""
+        from src.adapters.inbound.api.main import _log_and_format
+        from src.core.domain.exceptions import F1AgentError
+
+        exc = F1AgentError("boom", context={"collection": "regulations"})
+        body = _log_and_format(request_scope, exc)
+
+        assert body["context"] == {"collection": "regulations"}
+
+
+class TestRateLimiting:
+    """Tests for the sliding-window rate-limit middleware."""
+
+    @pytest.fixture
+    def limited_client(self):
+        """Client for a minimal app limited to 2 requests per minute on /limited."""
+        from fastapi import FastAPI
+
+        from src.adapters.inbound.api.rate_limit import SlidingWindowRateLimitMiddleware
+
+        app = FastAPI()
+
+        @app.get("/limited")
+        def limited():
+            return {"ok": True}
+
+        @app.get("/open")
+        def open_route():
+            return {"ok": True}
+
+        app.add_middleware(SlidingWindowRateLimitMiddleware, rules={"/limited": (2, 60.0)})
+        return TestClient(app)
+
+    @pytest.mark.integration
+    def test_requests_over_limit_get_429(self, limited_client):
+        """Test the request past the limit is rejected with Retry-After."""
+        statuses = [limited_client.get("/limited").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        response = limited_client.get("/limited")
+        assert int(response.headers["Retry-After"]) >= 1
+        assert "Rate limit exceeded" in response.json()["error"]
+
+    @pytest.mark.integration
+    def test_unlisted_paths_are_not_limited(self, limited_client):
+        """Test paths without a rule pass straight through."""
+        statuses = {limited_client.get("/open").status_code for _ in range(5)}
+
+        assert statuses == {200}
+
+
+class TestLifespan:
+    """Tests for application startup and shutdown."""
+
+    @pytest.mark.integration
+    def test_startup_initializes_dependencies(self):
+        """Test the lifespan builds and warms the dependency singletons before serving."""
+        from src.adapters.inbound.api.main import app
+
+        with (
+            patch("src.adapters.inbound.api.deps.init_dependencies") as mock_init,
+            patch("src.adapters.inbound.api.deps.warm_dependencies") as mock_warm,
+        ):
+            with TestClient(app):
+                mock_init.assert_called_once_with()
+                mock_warm.assert_called_once_with()
+
 
 class TestAPIDocumentation:
     """Tests for API documentation endpoints."""
@@ -133,6 +436,33 @@ class TestAPIDocumentation:
         assert "/api/v1/ask" in schema["paths"]
 
 
+class TestCompression:
+    """Tests for response compression."""
+
+    @pytest.mark.integration
+    def test_large_json_response_is_gzipped(self, client):
+        """Test JSON bodies above the size threshold are gzip-encoded."""
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == "gzip"
+        assert response.json()["info"]["title"] == "PitWallAI API"
+
+    @pytest.mark.integration
+    def test_stream_is_not_gzipped(self, client, mock_agent):
+        """Test SSE responses are not buffered by compression."""
+        mock_agent.ask_stream.return_value = iter(["x" * 1000])
+
+        response = client.post(
+            "/api/v1/ask/stream",
+            json={"question": "What is track limits?"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+
+
 class TestCORSConfiguration:
     """Tests for CORS configuration."""
 
@@ -177,3 +507,28 @@ class TestCORSConfiguration:
         )
         # Disallowed origins should not be reflected in the response
         assert response.headers.get("Access-Control-Allow-Origin") != "https://evil.com"
+
+    @pytest.mark.integration
+    def test_allowed_origin_matches_case_insensitively(self, client):
+        """Test an allowed origin with uppercase scheme/host is not rejected."""
+        response = client.get(
+            "/api/v1/health", headers={"Origin": "HTTPS://Gen-Lang-Client-0855046443.web.app"}
+        )
+
+        assert response.status_code == 200
+
+    @pytest.mark.integration
+    def test_disallowed_origin_request_rejected(self, client):
+        """Test requests from disallowed origins get a JSON 403."""
+        response = client.get("/api/v1/health", headers={"Origin": "https://evil.com"})
+
+        assert response.status_code == 403
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.json() == {"detail": "Origin not allowed"}
+
+    @pytest.mark.integration
+    def test_origin_not_enforced_outside_api(self, client):
+        """Test docs and schema routes skip the origin check."""
+        response = client.get("/openapi.json", headers={"Origin": "https://evil.com"})
+
+        assert response.status_code == 200
@@ -12,6 +12,7 @@ from src.adapters.common.exception_handler import (
     format_exception_json,
     get_error_code,
     get_http_status_code,
+    log_exception,
 )
 from src.core.domain.exceptions import (
     ConfigurationError,
@@ -211,6 +212,24 @@ class TestExceptionHandler:
         assert result["context"]["url"] == "original"
         assert result["context"]["request_id"] == "abc123"
 
+    def test_format_does_not_mutate_exception_context(self):
+        """Extra context should not leak into the exception's own context."""
+        exc = QdrantConnectionError("Test", context={"url": "original"})
+        format_exception_json(exc, extra_context={"request_id": "abc123"})
+
+        assert exc.extra_context == {"url": "original"}
+
+    def test_log_exception_returns_formatted_data(self):
+        """log_exception should return the dict it logged, including the trace."""
+        try:
+            raise ValueError("Logged error")
+        except ValueError as e:
+            result = log_exception(e, extra_context={"path": "/api/v1/ask"})
+
+        assert result["error"]["message"] == "Logged error"
+        assert result["context"]["path"] == "/api/v1/ask"
+        assert "stack_trace" in result
+
     def test_get_error_code_custom_exception(self):
         """get_error_code should return correct code for custom exceptions."""
         assert get_error_code(QdrantConnectionError("test")) == "F1_VEC_002"
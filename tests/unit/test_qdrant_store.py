@@ -205,6 +205,104 @@ class TestQdrantVectorStore:
         assert stats["count"] == 100
         assert stats["status"] == "green"
 
+    @pytest.mark.unit
+    def test_get_collection_stats_batch(self, store_with_mocked_client, mock_qdrant_client):
+        """Test batched stats return one entry per collection, in order."""
+        counts = {"regulations": 10, "stewards_decisions": 20, "race_data": 30}
+
+        def get_collection(collection_name):
+            info = MagicMock()
+            info.points_count = counts[collection_name]
+            info.status = "green"
+            return info
+
+        mock_qdrant_client.get_collection.side_effect = get_collection
+
+        stats = store_with_mocked_client.get_collection_stats_batch(list(counts))
+
+        assert list(stats) == list(counts)
+        assert {name: s["count"] for name, s in stats.items()} == counts
+
+    @pytest.mark.unit
+    def test_document_exists_many_pages_one_filtered_scroll(
+        self, store_with_mocked_client, mock_qdrant_client
+    ):
+        """Test batched existence check pages one scroll and returns the found URLs."""
+
+        def point(url):
+            p = MagicMock()
+            p.payload = {"url": url}
+            return p
+
+        mock_qdrant_client.scroll.side_effect = [
+            ([point("https://a"), point("https://a")], "next"),
+            ([point("https://b")], None),
+        ]
+
+        found = store_with_mocked_client.document_exists_many(
+            "regulations", ["https://a", "https://b", "https://c"], "cfg"
+        )
+
+        assert found == {"https://a", "https://b"}
+        assert mock_qdrant_client.scroll.call_count == 2
+        assert mock_qdrant_client.scroll.call_args.kwargs["offset"] == "next"
+
+    @pytest.mark.unit
+    def test_document_exists_many_empty(self, store_with_mocked_client, mock_qdrant_client):
+        """Test no request is made when there are no URLs to check."""
+        assert store_with_mocked_client.document_exists_many("regulations", [], "cfg") == set()
+        mock_qdrant_client.scroll.assert_not_called()
+
+    @pytest.mark.unit
+    def test_collections_provisioned_once_per_cluster(self):
+        """Test a second adapter for the same cluster skips collection provisioning."""
+        from src.adapters.outbound.vector_store import qdrant_adapter
+
+        url = "https://provision-once.cloud.qdrant.io"
+        with (
+            patch("qdrant_client.QdrantClient") as MockClient,
+            patch.object(qdrant_adapter, "_PROVISIONED_URLS", set()),
+        ):
+            MockClient.return_value.get_collections.return_value.collections = []
+            for _ in range(2):
+                store = qdrant_adapter.QdrantAdapter(
+                    url=url, api_key="key", embedding_api_key="", embedding_function=MagicMock()
+                )
+                store._get_client()
+
+        assert MockClient.call_count == 2
+        assert MockClient.return_value.get_collections.call_count == 1
+
+    @pytest.mark.unit
+    def test_client_created_once_under_concurrent_first_use(self):
+        """Test concurrent first calls from several threads build one client."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.adapters.outbound.vector_store import qdrant_adapter
+
+        url = "https://concurrent-init.cloud.qdrant.io"
+        with (
+            patch("qdrant_client.QdrantClient") as MockClient,
+            patch.object(qdrant_adapter, "_PROVISIONED_URLS", set()),
+        ):
+            MockClient.return_value.get_collections.return_value.collections = []
+            store = qdrant_adapter.QdrantAdapter(
+                url=url, api_key="key", embedding_api_key="", embedding_function=MagicMock()
+            )
+            start = threading.Barrier(3)
+
+            def connect(_):
+                start.wait()
+                return store._get_client()
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                clients = list(executor.map(connect, range(3)))
+
+        assert MockClient.call_count == 1
+        assert MockClient.return_value.get_collections.call_count == 1
+        assert clients[0] is clients[1] is clients[2]
+
     @pytest.mark.unit
     def test_reset_deletes_all_collections(self, store_with_mocked_client, mock_qdrant_client):
         """Test reset deletes all collections."""
@@ -222,3 +320,115 @@ class TestQdrantVectorStore:
         store_with_mocked_client.clear_collection("regulations")
 
         mock_qdrant_client.delete_collection.assert_called_once_with(collection_name="regulations")
+
+    @pytest.mark.unit
+    def test_search_batch_single_request(self, store_with_mocked_client, mock_qdrant_client):
+        """Test batch search embeds once and issues one Qdrant request."""
+        store_with_mocked_client._embedding_function.embed_queries.return_value = [
+            [0.1] * 3072,
+            [0.2] * 3072,
+        ]
+
+        hit_a = MagicMock(score=0.9, payload={"content": "Track limits", "doc_id": "a"})
+        hit_b = MagicMock(score=0.8, payload={"content": "Unsafe release", "doc_id": "b"})
+        mock_qdrant_client.query_batch_points.return_value = [
+            MagicMock(points=[hit_a]),
+            MagicMock(points=[hit_b]),
+        ]
+
+        results = store_with_mocked_client.search_batch(["q1", "q2"], "regulations", top_k=3)
+
+        store_with_mocked_client._embedding_function.embed_queries.assert_called_once_with(
+            ["q1", "q2"]
+        )
+        mock_qdrant_client.query_batch_points.assert_called_once()
+        assert [r[0].document.doc_id for r in results] == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_search_batch_empty(self, store_with_mocked_client, mock_qdrant_client):
+        """Test batch search with no queries makes no calls."""
+        assert store_with_mocked_client.search_batch([], "regulations") == []
+        mock_qdrant_client.query_batch_points.assert_not_called()
+
+    @pytest.mark.unit
+    def test_uses_injected_embedding_function(self):
+        """Test that a shared embedding function is used instead of creating one."""
+        from src.adapters.outbound.vector_store.qdrant_adapter import (
+            QdrantAdapter as QdrantVectorStore,
+        )
+
+        shared = MagicMock()
+        store = QdrantVectorStore("https://test", "key", "google-key", embedding_function=shared)
+
+        assert store._embedding_function is shared
+
+    @pytest.mark.unit
+    def test_add_documents_skips_failed_embeddings(
+        self, store_with_mocked_client, mock_qdrant_client
+    ):
+        """Test documents whose embedding batch failed are not upserted."""
+        store_with_mocked_client._embedding_function.embed_documents.return_value = [
+            [0.1] * 3072,
+            [],
+        ]
+        docs = [
+            Document(content="ok", metadata={}, doc_id="doc_1"),
+            Document(content="failed", metadata={}, doc_id="doc_2"),
+        ]
+
+        result = store_with_mocked_client.add_documents(docs, "regulations")
+
+        assert result == 1
+        points = mock_qdrant_client.upsert.call_args.kwargs["points"]
+        assert [p.payload["doc_id"] for p in points] == ["doc_1"]
+
+    @pytest.mark.unit
+    def test_add_documents_point_ids_are_stable(self, store_with_mocked_client, mock_qdrant_client):
+        """Test point IDs derive from doc_id deterministically (not per-process hash())."""
+        import hashlib
+
+        docs = [Document(content="x", metadata={}, doc_id="reg-abc-0")]
+
+        store_with_mocked_client.add_documents(docs, "regulations")
+
+        point = mock_qdrant_client.upsert.call_args.kwargs["points"][0]
+        digest = hashlib.blake2b(b"reg-abc-0", digest_size=8).digest()
+        assert point.id == int.from_bytes(digest) % (10**18)
+
+    @pytest.mark.unit
+    def test_add_documents_caches_only_label_metadata(
+        self, store_with_mocked_client, mock_qdrant_client
+    ):
+        """Test only label keys go through the label cache; other strings are still cleaned."""
+        from src.core.domain.utils import normalize_label
+
+        normalize_label.cache_clear()
+        docs = [
+            Document(
+                content="x",
+                metadata={"source": "\ufeffFIA Doc", "url": "\ufeffhttps://fia.com/a.pdf"},
+                doc_id="doc_1",
+            )
+        ]
+
+        store_with_mocked_client.add_documents(docs, "regulations")
+
+        payload = mock_qdrant_client.upsert.call_args.kwargs["points"][0].payload
+        assert payload["source"] == "FIA Doc"
+        assert payload["url"] == "https://fia.com/a.pdf"
+        assert normalize_label.cache_info().currsize == 1
+
+    @pytest.mark.unit
+    def test_add_documents_upsert_failure_names_batch(
+        self, store_with_mocked_client, mock_qdrant_client
+    ):
+        """Test an upsert failure is wrapped with the failing batch's context."""
+        from src.core.domain.exceptions import VectorStoreError
+
+        mock_qdrant_client.upsert.side_effect = RuntimeError("boom")
+        docs = [Document(content="x", metadata={}, doc_id="doc_1")]
+
+        with pytest.raises(VectorStoreError) as exc_info:
+            store_with_mocked_client.add_documents(docs, "regulations")
+
+        assert exc_info.value.extra_context["first_doc_id"] == "doc_1"
@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.domain import build_driver_map
+
+
+class TestBuildDriverMap:
+    """Unit tests for the build_driver_map helper."""
+
+    @pytest.mark.unit
+    def test_maps_codes_and_car_numbers_to_names(self):
+        """Both the driver code and the car number resolve to the full name."""
+        drivers = [SimpleNamespace(code="VER", name="Max Verstappen", number=1)]
+        assert build_driver_map(drivers) == {"VER": "Max Verstappen", "1": "Max Verstappen"}
+
+    @pytest.mark.unit
+    def test_driver_without_number_maps_code_only(self):
+        """Drivers without a car number are still resolvable by code."""
+        drivers = [SimpleNamespace(code="DOO", name="Jack Doohan", number=None)]
+        assert build_driver_map(drivers) == {"DOO": "Jack Doohan"}
@@ -206,3 +206,56 @@ class TestCrossEncoderReranker:
         """Test is_available returns True when model is successfully mocked."""
         reranker, mock_model = reranker_with_mock
         assert reranker.is_available() is True
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="Skipped on Windows due to PyTorch DLL loading issues in test env",
+    )
+    def test_model_shared_between_instances(self, mock_cross_encoder_class):
+        """Test that a loaded model is reused by new reranker instances."""
+        from importlib import reload
+
+        import src.core.services.reranker as reranker_module
+
+        reload(reranker_module)
+
+        first = reranker_module.CrossEncoderReranker()
+        second = reranker_module.CrossEncoderReranker()
+
+        assert first._get_model() is second._get_model()
+        mock_cross_encoder_class.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="Skipped on Windows due to PyTorch DLL loading issues in test env",
+    )
+    def test_model_loaded_once_under_concurrent_first_use(self, mock_cross_encoder_class):
+        """Test concurrent first calls from several threads load the model only once."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from importlib import reload
+
+        import src.core.services.reranker as reranker_module
+
+        reload(reranker_module)
+
+        def slow_load(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_cross_encoder_class.side_effect = slow_load
+        rerankers = [reranker_module.CrossEncoderReranker() for _ in range(3)]
+        start = threading.Barrier(3)
+
+        def load(reranker):
+            start.wait()
+            return reranker._get_model()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            models = list(executor.map(load, rerankers))
+
+        mock_cross_encoder_class.assert_called_once()
+        assert models[0] is models[1] is models[2]
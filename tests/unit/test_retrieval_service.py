@@ -0,0 +1,167 @@
+"""Unit tests for RetrievalService."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.domain import Document, SearchResult
+from src.core.ports.vector_store_port import VectorStorePort
+from src.core.services.retrieval_service import RetrievalService
+
+
+def _result(doc_id: str, score: float = 0.8) -> SearchResult:
+    return SearchResult(
+        document=Document(content=f"content {doc_id}", metadata={"source": doc_id}, doc_id=doc_id),
+        score=score,
+    )
+
+
+class TestRetrieveBatch:
+    """Tests for batched retrieval."""
+
+    @pytest.fixture
+    def vector_store(self):
+        """Vector store mock returning one hit per query for every collection."""
+        store = MagicMock(spec=VectorStorePort)
+
+        def search_batch(queries, collection_name, top_k=5, filters=None):
+            return [[_result(f"{collection_name}-{i}")] for i in range(len(queries))]
+
+        store.search_batch.side_effect = search_batch
+        return store
+
+    @pytest.mark.unit
+    def test_one_search_per_collection(self, vector_store):
+        """All queries share a single batched search per collection."""
+        retriever = RetrievalService(vector_store, use_reranker=False)
+
+        contexts = retriever.retrieve_batch(["track limits", "unsafe release", "DRS"], top_k=3)
+
+        assert len(contexts) == 3
+        assert vector_store.search_batch.call_count == 3
+        vector_store.search.assert_not_called()
+        assert contexts[1].query == "unsafe release"
+        assert contexts[1].regulations[0].document.doc_id == "regulations-1"
+        assert contexts[2].race_data[0].document.doc_id == "race_data-2"
+
+    @pytest.mark.unit
+    def test_filtered_misses_fall_back_unfiltered(self, vector_store):
+        """Queries with a filter and no hits are retried once without the filter."""
+
+        def search_batch(queries, collection_name, top_k=5, filters=None):
+            if filters and any(filters):
+                return [[] if f else [_result("hit")] for f in filters]
+            return [[_result("fallback")] for _ in queries]
+
+        vector_store.search_batch.side_effect = search_batch
+        retriever = RetrievalService(vector_store, use_reranker=False)
+
+        contexts = retriever.retrieve_batch(
+            ["penalty at Monza", "penalty"],
+            query_contexts=[{"race": "Italian Grand Prix"}, None],
+            include_regulations=False,
+        )
+
+        assert contexts[0].stewards_decisions[0].document.doc_id == "fallback"
+        assert contexts[1].stewards_decisions[0].document.doc_id == "hit"
+
+    @pytest.mark.unit
+    def test_empty_queries(self, vector_store):
+        """No queries means no vector store calls."""
+        retriever = RetrievalService(vector_store, use_reranker=False)
+
+        assert retriever.retrieve_batch([]) == []
+        vector_store.search_batch.assert_not_called()
+
+
+class TestRetrieve:
+    """Tests for single-query retrieval."""
+
+    @pytest.mark.unit
+    def test_results_land_in_matching_categories(self):
+        """Concurrent collection searches are assembled into the right fields."""
+        store = MagicMock(spec=VectorStorePort)
+        store.search.side_effect = lambda q, collection, *args: [_result(collection)]
+        retriever = RetrievalService(store, use_reranker=False)
+
+        context = retriever.retrieve("track limits", top_k=2)
+
+        assert store.search.call_count == 3
+        assert context.regulations[0].document.doc_id == VectorStorePort.REGULATIONS_COLLECTION
+        assert context.stewards_decisions[0].document.doc_id == VectorStorePort.STEWARDS_COLLECTION
+        assert context.race_data[0].document.doc_id == VectorStorePort.RACE_DATA_COLLECTION
+
+    @pytest.mark.unit
+    def test_excluded_collections_not_searched(self):
+        """Disabled categories are neither searched nor populated."""
+        store = MagicMock(spec=VectorStorePort)
+        store.search.return_value = [_result("reg")]
+        retriever = RetrievalService(store, use_reranker=False)
+
+        context = retriever.retrieve("DRS", include_stewards=False, include_race_data=False)
+
+        store.search.assert_called_once()
+        assert context.stewards_decisions == []
+        assert context.race_data == []
+
+
+class TestQueryParsingCache:
+    """Tests for the cached query expansion and context extraction."""
+
+    @pytest.mark.unit
+    def test_extract_race_context_returns_independent_copies(self):
+        """Mutating a returned context does not leak into later calls."""
+        retriever = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+
+        first = retriever.extract_race_context("Verstappen penalty at Monza 2024")
+        first["driver"] = "Someone Else"
+        second = retriever.extract_race_context("Verstappen penalty at Monza 2024")
+
+        assert second == {
+            "driver": "Max Verstappen",
+            "race": "Italian Grand Prix",
+            "season": 2024,
+            "team": None,
+        }
+
+    @pytest.mark.unit
+    def test_extract_race_context_cache_hit_skips_parsing(self):
+        """A repeated query is parsed once and then served from the cache."""
+        retriever = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+
+        retriever.extract_race_context("Hamilton at Silverstone")
+        retriever.extract_race_context("Hamilton at Silverstone")
+
+        info = retriever._extract_race_context_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_expand_query_is_stable(self):
+        """Repeated expansion of a query returns the same string."""
+        retriever = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+
+        expanded = retriever.expand_query("track limits penalty")
+
+        assert expanded.startswith("track limits penalty ")
+        assert retriever.expand_query("track limits penalty") == expanded
+
+    @pytest.mark.unit
+    def test_expand_query_cache_hit_skips_expansion(self):
+        """A repeated query is served from the cache."""
+        retriever = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+
+        retriever.expand_query("unsafe release")
+        retriever.expand_query("unsafe release")
+
+        info = retriever._expand_query_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_expand_query_uses_instance_synonyms(self):
+        """Overridden synonyms are honored and not shared with other instances' caches."""
+        custom = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+        custom.F1_SYNONYMS = {"drs": ["drag reduction system"]}
+        default = RetrievalService(MagicMock(spec=VectorStorePort), use_reranker=False)
+
+        assert custom.expand_query("drs") == "drs drag reduction system"
+        assert default.expand_query("drs") != "drs drag reduction system"
@@ -1,6 +1,6 @@
 import pytest
 
-from src.core.domain.utils import normalize_text
+from src.core.domain.utils import normalize_label, normalize_text
 
 
 @pytest.mark.unit
@@ -10,3 +10,19 @@ def test_normalize_text_removes_bom_and_collapses_whitespace():
     normalized = normalize_text(text)
 
     assert normalized == "Résumé café\n\na"
+
+
+@pytest.mark.unit
+def test_normalize_text_returns_clean_text_unchanged():
+    text = "Why did Pérez get a penalty?\n\nAt Monaco"
+
+    assert normalize_text(text) is text
+    assert normalize_text("  padded \n") == "padded"
+
+
+@pytest.mark.unit
+def test_normalize_label_matches_normalize_text():
+    label = "\ufeffBritish  Grand Prix"
+
+    assert normalize_label(label) == normalize_text(label) == "British Grand Prix"
+    assert normalize_label(label) is normalize_label(label)
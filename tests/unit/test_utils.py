@@ -1,6 +1,6 @@
 import pytest
 
-from src.core.domain.utils import chunk_text
+from src.core.domain.utils import chunk_text, short_hash
 
 
 class TestChunkText:
@@ -40,3 +40,20 @@ class TestChunkText:
         """chunk_overlap cannot be negative."""
         with pytest.raises(ValueError):
             chunk_text("content", chunk_size=10, chunk_overlap=-1)
+
+
+class TestShortHash:
+    """Unit tests for the stable short_hash helper."""
+
+    @pytest.mark.unit
+    def test_is_ten_hex_chars(self):
+        """IDs keep the ten-character width used in document IDs."""
+        digest = short_hash("https://www.fia.com/doc.pdf")
+        assert len(digest) == 10
+        int(digest, 16)
+
+    @pytest.mark.unit
+    def test_is_deterministic_and_key_sensitive(self):
+        """The same key always hashes the same; different keys differ."""
+        assert short_hash("a") == short_hash("a")
+        assert short_hash("a") != short_hash("b")